@@ -1,19 +1,30 @@
 # 사주 분석 시스템 패키지
 # AI 기반 8단계 전문 사주 분석을 제공하는 종합 시스템
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Saju Analysis Team"
 __description__ = "AI 기반 8단계 전문 사주 분석 시스템"
 
-# 주요 모듈들
-from . import saju_calculator
-from . import saju_analyzer
-from . import langgraph_workflow
-from . import api
-
+# 주요 모듈들 (PEP 562 지연 import)
+# api / langgraph_workflow 는 FastAPI, LangSmith, LangGraph, langchain-openai 를 불러오므로
+# 계산기만 쓰는 작업이 이 비용을 치르지 않도록 처음 접근할 때 import 합니다.
 __all__ = [
     "saju_calculator",
-    "saju_analyzer", 
+    "saju_analyzer",
     "langgraph_workflow",
     "api"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
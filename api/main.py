@@ -3,10 +3,10 @@
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 from typing import Dict, List, Optional, Union
-import json
 import asyncio
 from datetime import datetime
 import os
@@ -26,9 +26,20 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from saju_calculator import calculate_solar_saju, convert_lunar_to_solar
+from saju_calculator import (
+    calculate_solar_saju,
+    calculate_solar_saju_batch,
+    convert_lunar_to_solar_async,
+    find_same_saju_times,
+)
+from saju_engine import events
+from saju_engine.chart_cache import get_chart_cache
+from saju_engine.kasi_async import close_async_kasi_client
+from saju_analyzer import serialization
 from saju_analyzer.core import SajuAnalyzer, SajuData
+from saju_analyzer.extended_cache import get_extended_cache
 from saju_analyzer.terms import SajuTermsExplainer
+from saju_analyzer.timeline import scan_interactions
 from langgraph_workflow.workflow import SajuAnalysisWorkflow
 
 # 환경 변수 설정
@@ -48,6 +59,14 @@ LANGCHAIN_PROJECT = os.getenv("LANGCHAIN_PROJECT", "saju-analysis")
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", 8000))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "console")
+
+# 궁합 상위 후보 조회 한 번에 받을 최대 후보 수 (요청 하나가 배치 계산량을 무제한으로 늘리지 않도록)
+MAX_COMPATIBILITY_CANDIDATES = int(os.getenv("MAX_COMPATIBILITY_CANDIDATES", 10000))
+
+# 구조화 이벤트 로깅 (LOG_FORMAT=json 이면 JSON 한 줄 형식)
+events.configure_logging(LOG_FORMAT, LOG_LEVEL)
+log = events.get_logger("api")
 
 # LangSmith 클라이언트 초기화
 langsmith_client = Client(api_key=LANGCHAIN_API_KEY) if LANGCHAIN_API_KEY else None
@@ -63,7 +82,7 @@ async def lifespan(app: FastAPI):
     # 시작 시 초기화
     global analyzer, terms_explainer, workflow
     
-    print("🚀 사주 분석 시스템 초기화 중...")
+    events.info(log, "api.startup", "🚀 사주 분석 시스템 초기화 중...")
     
     # 분석 도구 초기화
     analyzer = SajuAnalyzer()
@@ -76,22 +95,23 @@ async def lifespan(app: FastAPI):
             openai_api_key=OPENAI_API_KEY,
             model=model
         )
-        print("✅ LangGraph 워크플로우 초기화 완료")
+        events.info(log, "api.workflow_ready", "✅ LangGraph 워크플로우 초기화 완료", model=model)
     else:
-        print("⚠️  OPENAI_API_KEY가 설정되지 않았습니다.")
+        events.warning(log, "api.openai_key_missing", "OPENAI_API_KEY가 설정되지 않았습니다.")
     
     # LangSmith 설정 확인
     if langsmith_client:
-        print("✅ LangSmith 추적 활성화")
+        events.info(log, "api.langsmith_enabled", "✅ LangSmith 추적 활성화")
     else:
-        print("⚠️  LangSmith 추적이 비활성화되어 있습니다.")
+        events.warning(log, "api.langsmith_disabled", "LangSmith 추적이 비활성화되어 있습니다.")
     
-    print("🎯 사주 분석 시스템 준비 완료!")
+    events.info(log, "api.ready", "🎯 사주 분석 시스템 준비 완료!")
     
     yield
     
     # 종료 시 정리
-    print("🔄 사주 분석 시스템 종료 중...")
+    events.info(log, "api.shutdown", "🔄 사주 분석 시스템 종료 중...")
+    await close_async_kasi_client()
 
 def main():
     """API 서버 실행을 위한 메인 함수"""
@@ -159,6 +179,37 @@ class SajuRequest(BaseModel):
     is_lunar: bool = False
     is_leap_month: bool = False
 
+class TimelineRequest(SajuRequest):
+    """원국 대비 대운/세운(/월운) 상호작용 타임라인 요청 모델 (기본: 출생 연도부터 100년, 최대 150년)"""
+    start_year: Optional[int] = Field(None, ge=1, le=9999)
+    end_year: Optional[int] = Field(None, ge=1, le=9999)
+    monthly: bool = False
+
+class ReverseSajuRequest(BaseModel):
+    """사주 역조회 요청 모델 (같은 사주가 나오는 출생 시각)"""
+    year_pillar: str
+    month_pillar: str
+    day_pillar: str
+    hour_pillar: str
+    city: str = "서울"
+    limit: Optional[int] = Field(100, ge=1)
+
+class CompatibilityCandidate(BaseModel):
+    """궁합 후보 (양력 출생 정보)"""
+    id: str
+    birth_year: int
+    birth_month: int
+    birth_day: int
+    birth_hour: int
+    birth_minute: int = 0
+    city: str = "서울"
+
+class CompatibilityRequest(BaseModel):
+    """궁합 상위 후보 조회 요청 모델 (후보 수는 MAX_COMPATIBILITY_CANDIDATES 이하)"""
+    person: SajuRequest
+    candidates: List[CompatibilityCandidate] = Field(..., min_length=1, max_length=MAX_COMPATIBILITY_CANDIDATES)
+    top_k: int = Field(10, ge=1)
+
 class SajuResponse(BaseModel):
     """사주 분석 응답 모델"""
     analysis_id: str
@@ -197,6 +248,9 @@ async def root():
             "calculate": "/api/v1/saju/calculate",
             "analyze": "/api/v1/saju/analyze",
             "stream": "/api/v1/saju/analyze/stream",
+            "timeline": "/api/v1/saju/timeline",
+            "reverse": "/api/v1/saju/reverse",
+            "compatibility": "/api/v1/compatibility/top",
             "terms": "/api/v1/terms",
             "health": "/health"
         }
@@ -213,16 +267,36 @@ async def health_check():
             "terms_explainer": terms_explainer is not None,
             "workflow": workflow is not None,
             "langsmith": langsmith_client is not None
-        }
+        },
+        "chart_cache": get_chart_cache().stats(),
+        "extended_cache": get_extended_cache().stats()
     }
 
+def json_response(content: bytes, status_code: int = 200) -> Response:
+    """미리 직렬화한 JSON 바이트 응답 (Pydantic 재검증/재인코딩 없음)"""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+def sse_event(payload: Dict) -> bytes:
+    """Server-Sent Events 한 건 (data: JSON)"""
+    return b"data: " + serialization.dumps(payload) + b"\n\n"
+
 @app.post("/api/v1/saju/calculate")
 async def calculate_saju(request: SajuRequest):
     """사주 기본 계산"""
+    saju_data = await calculate_saju_data(request)
+    return json_response(serialization.json_object({
+        "saju_data": saju_data.to_json_bytes(),
+        "calculated_at": serialization.dumps(datetime.now().isoformat()),
+        "input_data": serialization.dumps(request.dict())
+    }))
+
+async def calculate_saju_data(request: SajuRequest) -> SajuData:
+    """요청 → SajuData (음력 변환 포함, 실패 시 HTTPException)"""
     try:
         # 음력→양력 변환 (필요시)
         if request.is_lunar:
-            solar_year, solar_month, solar_day = convert_lunar_to_solar(
+            # 비동기 변환 (KASI 조회가 필요해도 이벤트 루프를 막지 않음)
+            solar_year, solar_month, solar_day = await convert_lunar_to_solar_async(
                 request.birth_year, request.birth_month, request.birth_day,
                 request.is_leap_month
             )
@@ -246,7 +320,7 @@ async def calculate_saju(request: SajuRequest):
         )
         
         # SajuData 객체 생성
-        saju_data = SajuData(
+        return SajuData(
             year_pillar=result['year_pillar'],
             month_pillar=result['month_pillar'],
             day_pillar=result['day_pillar'],
@@ -256,15 +330,117 @@ async def calculate_saju(request: SajuRequest):
             great_luck=result['great_luck']
         )
         
-        return {
-            "saju_data": saju_data.to_dict(),
-            "calculated_at": datetime.now().isoformat(),
-            "input_data": request.dict()
-        }
-        
+    except HTTPException:
+        # 입력 오류(400)는 그대로 전달
+        raise
     except Exception as e:
+        events.exception(log, "api.calculate_error", "사주 계산 중 오류 발생: {error}", error=str(e))
         raise HTTPException(status_code=500, detail=f"사주 계산 중 오류 발생: {str(e)}")
 
+@app.post("/api/v1/saju/timeline")
+async def saju_timeline(request: TimelineRequest):
+    """원국과 대운/세운(/월운)의 합충형파해·천간합충·십신 타임라인"""
+    saju_data = await calculate_saju_data(request)
+    try:
+        # 스캔은 동기 CPU 작업이므로 스레드 풀에서 실행 (기간은 scan_interactions 가 MAX_SCAN_YEARS 로 제한)
+        timeline = await run_in_threadpool(scan_interactions, saju_data, request.start_year, request.end_year,
+                                           monthly=request.monthly)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(serialization.dumps(timeline))
+
+@app.post("/api/v1/saju/reverse")
+async def reverse_saju(request: ReverseSajuRequest):
+    """같은 사주(네 기둥)가 나오는 출생 시각 구간 조회"""
+    try:
+        ranges = find_same_saju_times(
+            request.year_pillar, request.month_pillar, request.day_pillar, request.hour_pillar,
+            city=request.city, limit=request.limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if ranges is None:
+        raise HTTPException(status_code=503, detail="사주 역색인이 준비되지 않았습니다.")
+    
+    return {
+        "pillars": {
+            "year_pillar": request.year_pillar,
+            "month_pillar": request.month_pillar,
+            "day_pillar": request.day_pillar,
+            "hour_pillar": request.hour_pillar
+        },
+        "city": request.city,
+        "count": len(ranges),
+        "ranges": [
+            {key: value.strftime('%Y-%m-%d %H:%M') for key, value in item.items()}
+            for item in ranges
+        ]
+    }
+
+def compatibility_matches(solar_year: int, solar_month: int, solar_day: int, person: SajuRequest,
+                          candidates: List[CompatibilityCandidate], top_k: int):
+    """본인 사주와 후보 배치 사주 → (본인 사주 결과, 점수 상위 top_k 후보 목록), 잘못된 입력은 ValueError"""
+    # numpy 는 배치/궁합 계산에서만 필요하므로 호출 시점에 import
+    from saju_analyzer.compat import score_pair, top_k_matches
+    from saju_engine.batch import city_longitudes
+    from saju_engine.sexagenary import pack_batch, pack_pillars, unpack_pillars
+    
+    result = calculate_solar_saju(solar_year, solar_month, solar_day, person.birth_hour, person.birth_minute,
+                                  male=person.is_male, city=person.city)
+    batch = calculate_solar_saju_batch(
+        [c.birth_year for c in candidates], [c.birth_month for c in candidates],
+        [c.birth_day for c in candidates], [c.birth_hour for c in candidates],
+        [c.birth_minute for c in candidates],
+        city_longitude=city_longitudes([c.city for c in candidates])
+    )
+    
+    codes = pack_batch(batch)
+    indexes, scores = top_k_matches([pack_pillars(result)], codes, top_k)
+    
+    matches = []
+    for index, score in zip(indexes[0].tolist(), scores[0].tolist()):
+        pillars = unpack_pillars(int(codes[index]))
+        matches.append({
+            "id": candidates[index].id,
+            "score": round(score, 1),
+            "pillars": pillars,
+            "detail": score_pair(result, pillars)
+        })
+    return result, matches
+
+@app.post("/api/v1/compatibility/top")
+async def compatibility_top(request: CompatibilityRequest):
+    """후보 목록 중 궁합 점수 상위 K 명 조회 (후보 사주는 배치 엔진으로 한 번에 계산)"""
+    # numpy 는 배치/궁합 계산에서만 필요하므로 호출 시점에 import
+    person = request.person
+    if person.is_lunar:
+        solar_year, solar_month, solar_day = await convert_lunar_to_solar_async(
+            person.birth_year, person.birth_month, person.birth_day, person.is_leap_month
+        )
+        if solar_year is None:
+            raise HTTPException(status_code=400, detail="음력→양력 변환에 실패했습니다. 날짜를 확인해주세요.")
+    else:
+        solar_year, solar_month, solar_day = person.birth_year, person.birth_month, person.birth_day
+    
+    candidates = request.candidates
+    try:
+        # 배치 사주 계산과 N×M 점수 계산은 동기 CPU 작업이므로 스레드 풀에서 실행
+        result, matches = await run_in_threadpool(
+            compatibility_matches, solar_year, solar_month, solar_day, person, candidates, request.top_k
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    events.debug(log, "api.compatibility", "궁합 조회: 후보 {count}명 중 상위 {top_k}명",
+                 count=len(candidates), top_k=len(matches))
+    
+    return {
+        "person": {key: result[key] for key in ("year_pillar", "month_pillar", "day_pillar", "hour_pillar")},
+        "candidate_count": len(candidates),
+        "matches": matches
+    }
+
 @app.post("/api/v1/saju/analyze")
 async def analyze_saju(request: SajuRequest):
     """사주 전문 분석 (완료 후 결과 반환)"""
@@ -273,8 +449,7 @@ async def analyze_saju(request: SajuRequest):
     
     try:
         # 사주 기본 계산
-        calculate_response = await calculate_saju(request)
-        saju_data = SajuData(**calculate_response["saju_data"])
+        saju_data = await calculate_saju_data(request)
         
         # 전문 분석 실행
         analysis_result = await workflow.analyze_saju(saju_data)
@@ -293,11 +468,11 @@ async def analyze_saju(request: SajuRequest):
                     run_type="chain"
                 )
             except Exception as e:
-                print(f"LangSmith 추적 오류: {e}")
+                events.error(log, "api.langsmith_error", "LangSmith 추적 오류: {error}", error=str(e))
         
         return SajuResponse(
             analysis_id=analysis_id,
-            saju_data=calculate_response["saju_data"],
+            saju_data=saju_data.to_dict(),
             extended_data=analysis_result["extended_data"],
             analysis_results=analysis_result["step_results"],
             status="completed",
@@ -305,6 +480,7 @@ async def analyze_saju(request: SajuRequest):
         )
         
     except Exception as e:
+        events.exception(log, "api.analyze_error", "분석 중 오류 발생: {error}", error=str(e))
         raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
 
 @app.post("/api/v1/saju/analyze/stream")
@@ -317,10 +493,12 @@ async def analyze_saju_stream(request: SajuRequest):
     # 사주 계산
     try:
         if request.is_lunar:
-            solar_date = convert_lunar_to_solar(
+            solar_date = await convert_lunar_to_solar_async(
                 request.birth_year, request.birth_month, request.birth_day,
                 request.is_leap_month
             )
+            if solar_date[0] is None:
+                raise ValueError("음력→양력 변환에 실패했습니다. 날짜를 확인해주세요.")
             birth_year, birth_month, birth_day = solar_date
         else:
             birth_year, birth_month, birth_day = request.birth_year, request.birth_month, request.birth_day
@@ -342,6 +520,7 @@ async def analyze_saju_stream(request: SajuRequest):
         )
         
     except Exception as e:
+        events.warning(log, "api.stream_calculate_error", "사주 계산 오류: {error}", error=str(e))
         raise HTTPException(status_code=400, detail=f"사주 계산 오류: {str(e)}")
     
     # 실시간 스트리밍 분석 생성기
@@ -356,7 +535,7 @@ async def analyze_saju_stream(request: SajuRequest):
                 # 각 단계별 데이터 스트리밍
                 if stream_data["type"] == "start":
                     # 분석 시작 알림
-                    data_json = json.dumps({
+                    yield sse_event({
                         'type': 'start',
                         'analysis_id': analysis_id,
                         'message': stream_data['message'],
@@ -368,12 +547,11 @@ async def analyze_saju_stream(request: SajuRequest):
                             'hour_pillar': saju_obj.hour_pillar,
                             'birth_info': saju_obj.birth_info
                         }
-                    }, ensure_ascii=False)
-                    yield f"data: {data_json}\n\n"
+                    })
                 
                 elif stream_data["type"] == "step_start":
                     # 단계 시작 알림
-                    data_json = json.dumps({
+                    yield sse_event({
                         'type': 'step_start',
                         'step': stream_data['step'],
                         'total_steps': stream_data['total_steps'],
@@ -381,12 +559,11 @@ async def analyze_saju_stream(request: SajuRequest):
                         'progress_percentage': stream_data['progress_percentage'],
                         'message': stream_data['message'],
                         'timestamp': datetime.now().isoformat()
-                    }, ensure_ascii=False)
-                    yield f"data: {data_json}\n\n"
+                    })
                 
                 elif stream_data["type"] == "step_complete":
                     # 단계 완료 및 결과 스트리밍
-                    data_json = json.dumps({
+                    yield sse_event({
                         'type': 'step_complete',
                         'step': stream_data['step'],
                         'step_name': stream_data['step_name'],
@@ -394,23 +571,21 @@ async def analyze_saju_stream(request: SajuRequest):
                         'progress_percentage': stream_data['progress_percentage'],
                         'message': stream_data['message'],
                         'timestamp': datetime.now().isoformat()
-                    }, ensure_ascii=False)
-                    yield f"data: {data_json}\n\n"
+                    })
                     
                     # 스트리밍 속도 조절 (너무 빠르면 읽기 어려움)
                     await asyncio.sleep(0.3)
                 
                 elif stream_data["type"] == "error":
                     # 에러 발생 시
-                    data_json = json.dumps({
+                    yield sse_event({
                         'type': 'error',
                         'step': stream_data['step'],
                         'step_name': stream_data['step_name'],
                         'error': stream_data['error'],
                         'message': stream_data['message'],
                         'timestamp': datetime.now().isoformat()
-                    }, ensure_ascii=False)
-                    yield f"data: {data_json}\n\n"
+                    })
                     break
                 
                 elif stream_data["type"] == "complete":
@@ -427,27 +602,26 @@ async def analyze_saju_stream(request: SajuRequest):
                         'total_time': stream_data.get('total_time', '5-7분')
                     }
                     
-                    data_json = json.dumps({
+                    yield sse_event({
                         'type': 'complete',
                         'analysis_id': analysis_id,
                         'final_analysis': final_analysis,
                         'message': stream_data['message'],
                         'total_time': stream_data.get('total_time', '5-7분'),
                         'timestamp': datetime.now().isoformat()
-                    }, ensure_ascii=False)
-                    yield f"data: {data_json}\n\n"
+                    })
                     break
         
         except Exception as e:
             # 전역 에러 처리
+            events.exception(log, "api.stream_error", "스트리밍 분석 오류: {error}", error=str(e))
             error_message = f"분석 중 오류가 발생했습니다: {str(e)}"
-            data_json = json.dumps({
+            yield sse_event({
                 'type': 'error',
                 'error': error_message,
                 'message': error_message,
                 'timestamp': datetime.now().isoformat()
-            }, ensure_ascii=False)
-            yield f"data: {data_json}\n\n"
+            })
     
     # Server-Sent Events로 스트리밍 응답
     return StreamingResponse(
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+확장 분석 벤치마크 (조회 테이블 구현 검증 + 속도 비교)
+
+문자열 기준 구현(SajuAnalyzer._analyze_extended_fields)과 조회 테이블 구현(saju_analyzer.tables)의
+결과를 비교하고, 사주 한 건당 처리 시간을 잽니다. 결과가 하나라도 다르면 종료 코드 1 을 반환합니다.
+  - 지지장간/형충파해: 지지 12⁴ 조합 전수 비교
+  - 십신: 일간 10 × 간지 60 전수 비교
+  - 전체 to_dict(): 무작위 사주 × 출생 월(0~13) 비교, 배치 열 결과와 건별 결과 비교
+  - 오행 생극: 기존 쌍별 문자열 목록(_analyze_element_relations)과 지연 생성 목록/방향별 가중치 비교
+  - 지지 관계: 기둥 4~6개 무작위 지지에서 비트마스크 엔진과 규칙별 직접 대조(naive) 비교, 배치 비트 비교
+
+속도는 건별 조회 테이블 / 캐시 적중 / 배치 세 경로를 잽니다. 캐시 적중은 확장 분석 캐시 용량
+(SAJU_EXTENDED_CACHE_SIZE) 안의 표본만 재며 적중률이 100% 가 아니면 실패로 처리합니다.
+각 경로의 속도 향상을 목표(TARGET_SPEEDUP, 문자열 구현 대비 20배)와 비교해 출력합니다.
+20배 목표는 배치 경로(analyze_extended_batch)에 적용되며 배치가 미달하면 실패로 처리합니다.
+건별 경로(조회 테이블 약 4배, 캐시 적중 약 9배)는 목표 미달로 표시만 하고 실패로 보지 않습니다.
+
+사용법:
+    python benchmark_analyzer.py
+    python benchmark_analyzer.py --samples 50000 --seed 7
+"""
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from itertools import product
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from saju_analyzer import branches, tables  # noqa: E402
+from saju_analyzer.core import SajuAnalyzer, SajuData  # noqa: E402
+from saju_analyzer.extended_cache import get_extended_cache  # noqa: E402
+from saju_engine.sexagenary import (  # noqa: E402
+    hour_stem_for,
+    month_stem_for,
+    pack_chart,
+    pillar_name,
+    sexagenary_index,
+)
+
+# 문자열 구현 대비 목표 속도 향상 (배치 경로에 적용, 건별 경로는 비교 결과만 출력)
+TARGET_SPEEDUP = 20
+
+
+def speedup_label(speedup: float, required: bool) -> str:
+    """속도 향상 배수 → 목표 대비 표시 (목표 미달 시 배치는 ❌, 건별은 ⚠️)"""
+    if speedup >= TARGET_SPEEDUP:
+        return f"✅ 목표 {TARGET_SPEEDUP}배 달성"
+    return f"{'❌' if required else '⚠️ '} 목표 {TARGET_SPEEDUP}배 미달"
+
+
+def random_chart(rng: random.Random):
+    """월간·시간이 맞는 무작위 사주 (육십갑자 인덱스 4개)"""
+    year, day = rng.randrange(60), rng.randrange(60)
+    month_branch, hour_branch = rng.randrange(12), rng.randrange(12)
+    month = sexagenary_index(month_stem_for(year % 10, month_branch), month_branch)
+    hour = sexagenary_index(hour_stem_for(day % 10, hour_branch), hour_branch)
+    return year, month, day, hour
+
+
+def check_branches(analyzer: SajuAnalyzer) -> int:
+    """지지 12⁴ 조합 전수: 지지장간, 형충파해"""
+    mismatches = 0
+    for group in product(range(12), repeat=4):
+        pillars = [pillar_name(sexagenary_index(branch % 2, branch)) for branch in group]
+        hidden_stems, conflicts, _ = tables.branch_fields(group)
+        expected = (analyzer._analyze_hidden_stems(pillars), analyzer._analyze_conflicts(pillars))
+        actual = (hidden_stems, [{'type': kind, 'branches': list(names), 'positions': list(positions)}
+                                 for kind, names, positions in conflicts])
+        mismatches += actual != expected
+    return mismatches
+
+
+def naive_interactions(branch_names):
+    """규칙마다 지지 목록을 직접 대조하는 기준 구현 (branches.RELATIONS 순서)"""
+    found = []
+    for relation in branches.RELATIONS:
+        if relation.duplicate:
+            matched = branch_names.count(relation.branches[0]) >= 2
+        else:
+            matched = all(branch in branch_names for branch in relation.branches)
+        if matched:
+            found.append(relation)
+    # 세 글자 관계가 성립하면 그 안의 두 글자 관계(半合, 삼형의 刑)는 제외
+    full = {kind: [set(r.branches) for r in found if r.type == kind and len(r.branches) == 3] for kind in ('三合', '刑')}
+    covering = {'半合': full['三合'], '刑': full['刑']}
+    found = [r for r in found
+             if not (r.type in covering and len(set(r.branches)) == 2
+                     and any(set(r.branches) < group for group in covering[r.type]))]
+    return [{'type': r.type, 'name': r.name, 'branches': list(r.branches), 'element': r.element,
+             'positions': [i for i, branch in enumerate(branch_names) if branch in r.branches]}
+            for r in found]
+
+
+def check_interactions(rng: random.Random, samples: int) -> int:
+    """무작위 지지 4~6개 (원국 + 대운/세운/월운): 건별 결과, 배치 비트"""
+    mismatches = 0
+    groups = {size: [] for size in (4, 5, 6)}
+    for _ in range(samples):
+        size = rng.choice((4, 5, 6))
+        indexes = [rng.randrange(12) for _ in range(size)]
+        groups[size].append(indexes)
+        mismatches += branches.interactions(indexes) != naive_interactions([tables.BRANCHES[i] for i in indexes])
+    for rows in groups.values():
+        if rows:
+            bits = branches.interactions_batch(rows)
+            mismatches += sum(int(b) != branches.relation_bits(row) for b, row in zip(bits, rows))
+    return mismatches
+
+
+def check_ten_gods(analyzer: SajuAnalyzer) -> int:
+    """일간 10 × 간지 60 전수: 십신"""
+    mismatches = 0
+    for day_stem in range(10):
+        for index in range(60):
+            day = sexagenary_index(day_stem, day_stem % 2)
+            pillars = (index, index, day, index)
+            expected = analyzer._analyze_ten_gods([pillar_name(i) for i in pillars], tables.STEMS[day_stem])
+            mismatches += tables.extended_fields(pillars, 1)['ten_gods'] != expected
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="확장 분석 조회 테이블 검증 및 벤치마크")
+    parser.add_argument("--samples", type=int, default=20000, help="무작위 사주 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    analyzer = SajuAnalyzer()
+    rng = random.Random(args.seed)
+    charts = [random_chart(rng) for _ in range(args.samples)]
+    months = [rng.randrange(14) for _ in range(args.samples)]
+    data = [
+        SajuData(*(pillar_name(i) for i in chart), birth_info={'original_time': f"2000-{month:02d}-01 00:00"},
+                 elements={}, great_luck={})
+        for chart, month in zip(charts, months)
+    ]
+
+    print(f"🔍 결과 비교 (무작위 {args.samples:,}건, seed {args.seed})")
+    branch_mismatches = check_branches(analyzer)
+    print(f"{'✅' if not branch_mismatches else '❌'} 지지장간/형충파해 12⁴ 조합: 불일치 {branch_mismatches}건")
+    ten_god_mismatches = check_ten_gods(analyzer)
+    print(f"{'✅' if not ten_god_mismatches else '❌'} 십신 600 조합: 불일치 {ten_god_mismatches}건")
+    interaction_mismatches = check_interactions(rng, args.samples)
+    print(f"{'✅' if not interaction_mismatches else '❌'} 지지 관계 (기준 구현/배치): 불일치 {interaction_mismatches}건")
+
+    full_mismatches = relation_mismatches = 0
+    for item in data:
+        pillars = [item.year_pillar, item.month_pillar, item.day_pillar, item.hour_pillar]
+        expected = {'basic_data': item.to_dict(), **analyzer._analyze_extended_fields(pillars, item.birth_info)}
+        actual = analyzer.analyze_extended_saju(item).to_dict()
+        full_mismatches += actual != expected
+
+        # 기존 쌍별 목록의 문자열별 개수 = 방향별 가중치
+        legacy = analyzer._analyze_element_relations(pillars)
+        relations = actual['element_relations']
+        relation_mismatches += (relations.legacy_dict() != legacy
+                                or Counter(legacy['generation']) != relations['generation_flow']
+                                or Counter(legacy['destruction']) != relations['destruction_flow'])
+    print(f"{'✅' if not full_mismatches else '❌'} 전체 to_dict(): 불일치 {full_mismatches}건")
+    print(f"{'✅' if not relation_mismatches else '❌'} 오행 생극 (기존 목록/가중치): 불일치 {relation_mismatches}건")
+
+    codes = [pack_chart(*chart) for chart in charts]
+    batch = analyzer.analyze_extended_batch(codes, months)
+    batch_mismatches = 0
+    for i, item in enumerate(data):
+        fields = batch.to_dict(i)
+        relations = fields['element_relations']
+        columns = (
+            [tables.TEN_GOD_NAMES[g] for g in batch.ten_gods[i]] == list(fields['ten_gods'].values())
+            and {tables.ELEMENT_ORDER[e]: int(c) for e, c in enumerate(batch.element_counts[i]) if c}
+            == relations['element_count']
+            and {name: int(batch.generation_flow[i][a]) for a, _, name in tables.GENERATION_EDGES
+                 if batch.generation_flow[i][a]} == relations['generation_flow']
+            and {name: int(batch.destruction_flow[i][a]) for a, _, name in tables.DESTRUCTION_EDGES
+                 if batch.destruction_flow[i][a]} == relations['destruction_flow']
+            and batch.balance_scores[i] == fields['seasonal_balance']['balance_score']
+            and bin(int(batch.conflicts[i])).count('1') == len(fields['conflicts'])
+            and [r.name for r in branches.describe(int(batch.interactions[i]))]
+            == [r['name'] for r in fields['branch_interactions']]
+            and bool(batch.strong[i]) == (fields['day_master_strength'] == "신강")
+            and round(float(batch.strength_scores[i]), 1) == fields['day_master_score']['score']
+        )
+        batch_mismatches += not columns
+    print(f"{'✅' if not batch_mismatches else '❌'} 배치 열 결과: 불일치 {batch_mismatches}건")
+
+    # 속도 (사주 1건당)
+    started = time.perf_counter()
+    for item in data:
+        analyzer._analyze_extended_fields([item.year_pillar, item.month_pillar, item.day_pillar, item.hour_pillar],
+                                          item.birth_info)
+    legacy = (time.perf_counter() - started) / len(data)
+
+    started = time.perf_counter()
+    for chart, month in zip(charts, months):
+        tables.extended_fields(chart, month)
+    scalar = (time.perf_counter() - started) / len(data)
+
+    # 캐시 적중 경로: 캐시 용량 안의 표본만 미리 채운 뒤 측정 (용량을 넘으면 LRU 가 밀려나 미스를 재게 됨)
+    cache = get_extended_cache()
+    hot = data[:cache.max_entries]
+    cached = hit_rate = None
+    if hot:
+        for item in hot:
+            analyzer.analyze_extended_saju(item)
+        before = cache.stats()
+        started = time.perf_counter()
+        for item in hot:
+            analyzer.analyze_extended_saju(item)
+        cached = (time.perf_counter() - started) / len(hot)
+        after = cache.stats()
+        hit_rate = (after['hits'] - before['hits']) / len(hot)
+
+    started = time.perf_counter()
+    analyzer.analyze_extended_batch(codes, months)
+    batched = (time.perf_counter() - started) / len(data)
+
+    print(f"\n⏱️  문자열 구현: {legacy * 1e6:.1f}µs/건")
+    print(f"⏱️  조회 테이블: {scalar * 1e6:.1f}µs/건 ({legacy / scalar:.1f}배, "
+          f"{speedup_label(legacy / scalar, False)})")
+    if cached is None:
+        print("⏱️  캐시 적중 (analyze_extended_saju): 캐시 사용 안 함 (SAJU_EXTENDED_CACHE_SIZE=0)")
+    else:
+        print(f"⏱️  캐시 적중 (analyze_extended_saju): {cached * 1e6:.1f}µs/건 ({legacy / cached:.1f}배, "
+              f"{len(hot):,}건, 적중률 {hit_rate:.1%}, {speedup_label(legacy / cached, False)})")
+    batch_ok = legacy / batched >= TARGET_SPEEDUP
+    print(f"⏱️  배치 (열 결과): {batched * 1e6:.2f}µs/건 ({legacy / batched:.0f}배, "
+          f"{speedup_label(legacy / batched, True)})")
+
+    if hit_rate is not None and hit_rate < 1:
+        print(f"❌ 캐시 적중 측정 표본에서 미스 발생 (적중률 {hit_rate:.1%})")
+
+    failed = (branch_mismatches or ten_god_mismatches or interaction_mismatches or full_mismatches
+              or relation_mismatches or batch_mismatches or (hit_rate is not None and hit_rate < 1)
+              or not batch_ok)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+import 시간 벤치마크 (콜드 스타트 예산 검사)
+
+새 인터프리터에서 `python -X importtime -c "import <모듈>"` 을 여러 번 실행해 모듈별 누적 import 시간의
+중앙값을 재고, 예산을 넘거나 지연 import 대상(HTTP/서버/LLM/NumPy 등)이 미리 로드되면 종료 코드 1 을 반환합니다.
+
+사용법:
+    python benchmark_import.py                 # 기본 대상과 예산
+    python benchmark_import.py --runs 9 --budget-ms 80
+    SAJU_IMPORT_BUDGET_MS=80 python benchmark_import.py saju_calculator
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent
+
+# 모듈별 기본 예산 (ms, -X importtime 누적 시간 기준)
+DEFAULT_BUDGETS_MS = {
+    "saju_calculator": 60.0,
+    "saju_analyzer": 60.0,
+}
+
+# 계산기 import 시 로드되면 안 되는 모듈 (사용 시점에 지연 import)
+LAZY_MODULES = (
+    "requests", "xml.etree.ElementTree", "prettytable", "sqlite3", "numpy",
+    "aiohttp", "fastapi", "langsmith", "langgraph", "langchain_core", "langchain_openai",
+)
+
+
+def measure_import_ms(module: str) -> float:
+    """새 프로세스에서 module 의 누적 import 시간(ms)"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, capture_output=True, text=True, check=True
+    )
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} 의 import 시간을 찾을 수 없습니다.")
+
+
+def loaded_lazy_modules(module: str):
+    """module import 직후 이미 로드된 지연 import 대상 목록"""
+    code = (
+        f"import sys, {module}\n"
+        f"print(','.join(name for name in {LAZY_MODULES!r} if name in sys.modules))"
+    )
+    completed = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                               capture_output=True, text=True, check=True)
+    return [name for name in completed.stdout.strip().split(",") if name]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="모듈 import 시간 벤치마크 (콜드 스타트 예산 검사)")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_BUDGETS_MS), help="측정할 모듈")
+    parser.add_argument("--runs", type=int, default=5, help="모듈별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--budget-ms", type=float, default=os.getenv("SAJU_IMPORT_BUDGET_MS"),
+                        help="모든 모듈에 적용할 예산 (기본: 모듈별 기본값)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"⏱️  import 시간 측정 ({args.runs}회 중앙값, {Path(sys.executable).name})")
+    for module in args.modules:
+        budget = float(args.budget_ms) if args.budget_ms is not None else DEFAULT_BUDGETS_MS.get(module, 60.0)
+        samples = [measure_import_ms(module) for _ in range(args.runs)]
+        median = statistics.median(samples)
+        eager = loaded_lazy_modules(module)
+
+        ok = median <= budget and not eager
+        failed |= not ok
+        print(f"{'✅' if ok else '❌'} {module}: {median:.1f}ms (예산 {budget:.0f}ms, 최소 {min(samples):.1f}ms)")
+        if eager:
+            print(f"   ⚠️  미리 로드된 지연 import 대상: {', '.join(eager)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,9 @@ from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 import json
 
+from saju_analyzer import strength, tables
+from saju_engine.luck import current_period
+
 class SajuCalculationTool(BaseTool):
     """사주 기본 계산 도구"""
     
@@ -77,14 +80,30 @@ class LuckAnalysisTool(BaseTool):
     name: str = "luck_analysis"
     description: str = "대운과 세운 분석 도구"
     
-    def _run(self, birth_info: Dict, current_year: int) -> str:
-        """운세 분석 실행"""
+    def _run(self, birth_info: Dict, current_year: int, great_luck: Optional[Dict] = None) -> str:
+        """운세 분석 실행 (great_luck: calculate_solar_saju 결과의 대운 정보)"""
         
         birth_year = int(birth_info['original_time'].split('-')[0])
         current_age = current_year - birth_year + 1
         
-        # 대운 계산 (간단한 버전)
-        great_luck_start = 3  # 기본 3세 시작
+        if great_luck and great_luck.get('pillars'):
+            # 절입 거리로 계산된 대운수와 대운 간지 사용
+            great_luck_start = great_luck['start_age']
+            current = current_period(great_luck, datetime(current_year, 7, 1))
+            current_great_luck_period = current['order'] if current else 0
+            upcoming = great_luck['pillars'][current_great_luck_period:]
+            analysis = {
+                "current_age": current_age,
+                "great_luck_start_age": great_luck_start,
+                "great_luck_period": current_great_luck_period,
+                "current_great_luck": current['pillar'] if current else None,
+                "next_great_luck_age": upcoming[0]['start_age'] if upcoming else None,
+                "important_ages": [period['start_age'] for period in great_luck['pillars'][1:8]]
+            }
+            return json.dumps(analysis, ensure_ascii=False, indent=2)
+        
+        # 대운 정보가 없으면 기본 3세 시작으로 근사
+        great_luck_start = 3
         current_great_luck_period = ((current_age - great_luck_start) // 10) + 1
         
         analysis = {
@@ -98,8 +117,8 @@ class LuckAnalysisTool(BaseTool):
         
         return json.dumps(analysis, ensure_ascii=False, indent=2)
     
-    async def _arun(self, birth_info: Dict, current_year: int) -> str:
-        return self._run(birth_info, current_year)
+    async def _arun(self, birth_info: Dict, current_year: int, great_luck: Optional[Dict] = None) -> str:
+        return self._run(birth_info, current_year, great_luck)
 
 class ConflictAnalysisTool(BaseTool):
     """형충파해 분석 도구"""
@@ -151,62 +170,62 @@ class ConflictAnalysisTool(BaseTool):
         return self._run(conflicts)
 
 class YongshinAnalysisTool(BaseTool):
-    """용신 분석 도구"""
+    """용신 분석 도구 (saju_analyzer.strength 강약 점수 기반)"""
     
     name: str = "yongshin_analysis"
     description: str = "용신 및 기신 분석 도구"
     
-    def _run(self, elements: Dict[str, int], seasonal_balance: Dict, day_strength: str) -> str:
-        """용신 분석 실행"""
-        
-        # 계절별 조후 필요 오행
-        seasonal_needs = {
-            '春': ['火', '土'],
-            '夏': ['水', '金'],
-            '秋': ['火', '木'],
-            '冬': ['火', '木']
-        }
-        
-        season = seasonal_balance.get('season', '春')
-        needed_elements = seasonal_needs.get(season, [])
-        
-        # 용신 후보 분석
-        yongshin_candidates = []
-        
-        # 조후 기준 용신
-        for element in needed_elements:
-            count = elements.get(element, 0)
-            if count < 2:  # 부족한 경우
-                yongshin_candidates.append(f"{element}(조후)")
-        
-        # 신강/신약 기준 용신
-        if day_strength == "신약":
-            # 신약이면 비겁, 인성이 용신
-            if elements.get('木', 0) < 2:
-                yongshin_candidates.append("木(比劫)")
-            if elements.get('水', 0) < 2:
-                yongshin_candidates.append("水(印星)")
-        else:
-            # 신강이면 관성, 식상, 재성이 용신
-            if elements.get('金', 0) < 2:
-                yongshin_candidates.append("金(官星)")
-            if elements.get('火', 0) < 2:
-                yongshin_candidates.append("火(食傷)")
-            if elements.get('土', 0) < 2:
-                yongshin_candidates.append("土(財星)")
+    # 강약 분류 → 용신으로 보는 오행 그룹 (신약은 돕는 쪽, 신강은 빼는 쪽, 중화는 전체 중 부족한 쪽)
+    STRENGTH_GROUPS = {
+        '극신약': ('印星', '比劫'),
+        '신약': ('印星', '比劫'),
+        '중화': ('比劫', '食傷', '財星', '官星', '印星'),
+        '신강': ('食傷', '財星', '官星'),
+        '극신강': ('食傷', '財星', '官星')
+    }
+    
+    def _run(self, pillars: List[str], seasonal_balance: Optional[Dict] = None) -> str:
+        """용신 분석 실행 (pillars: 연월일시 간지 4개)"""
+        
+        score = strength.analyze_pillars(pillars)
+        if score is None:
+            return json.dumps({"error": f"올바른 사주가 아닙니다: {pillars}"}, ensure_ascii=False)
+        
+        # 계절: 조후 분석 결과가 있으면 그대로, 없으면 월지 기준 (寅卯辰 春 …)
+        season = (seasonal_balance or {}).get('season') \
+            or tables.SEASON_NAMES[(tables.BRANCHES.index(pillars[1][1]) - 2) % 12 // 3]
+        needed_elements = list(tables.SEASON_NEEDS.get(season, ()))
+        
+        contributions = score['elements']
+        average = sum(contributions.values()) / 5
+        day_element = tables.ELEMENT_ORDER.index(score['day_element'])
+        group_elements = {group: tables.ELEMENT_ORDER[(day_element + k) % 5]
+                          for k, group in enumerate(strength.GROUP_NAMES)}
+        
+        # 조후 기준 용신: 필요한 오행 중 기여도가 평균보다 낮은 것
+        yongshin_candidates = [
+            f"{element}(조후)" for element in sorted(needed_elements, key=contributions.get)
+            if contributions[element] < average
+        ]
+        
+        # 강약 기준 용신: 분류별 그룹 중 기여도가 낮은 순
+        groups = sorted(self.STRENGTH_GROUPS[score['category']], key=score['groups'].get)
+        yongshin_candidates += [f"{group_elements[group]}({group})" for group in groups]
         
         analysis = {
             "season": season,
-            "day_strength": day_strength,
+            "day_strength": score['category'],
+            "strength_score": score['score'],
             "yongshin_candidates": yongshin_candidates[:3],  # 상위 3개
             "seasonal_needs": needed_elements,
-            "current_elements": elements
+            "element_contributions": contributions,
+            "group_contributions": score['groups']
         }
         
         return json.dumps(analysis, ensure_ascii=False, indent=2)
     
-    async def _arun(self, elements: Dict[str, int], seasonal_balance: Dict, day_strength: str) -> str:
-        return self._run(elements, seasonal_balance, day_strength)
+    async def _arun(self, pillars: List[str], seasonal_balance: Optional[Dict] = None) -> str:
+        return self._run(pillars, seasonal_balance)
 
 class LifeAreaAnalysisTool(BaseTool):
     """생활 영역별 분석 도구"""
@@ -8,7 +8,7 @@ from langchain_core.messages import HumanMessage, AIMessage
 from langchain_openai import ChatOpenAI
 import json
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import sys
 from pathlib import Path
@@ -19,8 +19,14 @@ sys.path.insert(0, str(project_root))
 
 from saju_analyzer.core import SajuAnalyzer, ExtendedSajuData, SajuData
 from saju_analyzer.terms import SajuTermsExplainer
+from saju_analyzer.timeline import scan_interactions
+from saju_engine import events
+from saju_engine.calendar_table import get_calendar_table
+from saju_engine.luck import current_period
 from langgraph_workflow.analysis_tools import *
 
+log = events.get_logger("workflow")
+
 class AnalysisState(TypedDict):
     """분석 상태 정의"""
     # 기본 정보
@@ -234,11 +240,22 @@ class SajuAnalysisWorkflow:
         state["step_name"] = "용신과 조후"
         
         saju_data = state["saju_data"]
+        pillars = [saju_data['year_pillar'], saju_data['month_pillar'],
+                   saju_data['day_pillar'], saju_data['hour_pillar']]
+        
+        # 지장간·월령 가중 강약 점수로 용신 후보 계산
+        yongshin = json.loads(YongshinAnalysisTool()._run(pillars, state["extended_data"].get("seasonal_balance")))
+        contribution_text = ", ".join(
+            f"{group} {value:.2f}" for group, value in yongshin.get("group_contributions", {}).items()
+        ) or "정보 없음"
         
         prompt = f"""
 사주의 용신과 조후를 분석해주세요.
 
 **사주:** {saju_data['year_pillar']} {saju_data['month_pillar']} {saju_data['day_pillar']} {saju_data['hour_pillar']}
+**일간 강약:** {yongshin.get('day_strength', '알 수 없음')} (점수 {yongshin.get('strength_score', '-')}/100, 지장간·월령 가중)
+**오행 그룹 기여도:** {contribution_text}
+**용신 후보:** {', '.join(yongshin.get('yongshin_candidates', [])) or '없음'}
 
 **분석 요청:**
 1. 용신(가장 필요한 오행) 선택
@@ -258,7 +275,7 @@ class SajuAnalysisWorkflow:
         state["step_results"]["step3"] = {
             "title": "용신과 조후",
             "content": response.content,
-            "data": {}
+            "data": yongshin
         }
         
         state["messages"].append(response)
@@ -314,12 +331,66 @@ class SajuAnalysisWorkflow:
         birth_year = int(saju_data['birth_info']['original_time'].split('-')[0])
         current_age = current_year - birth_year + 1
         
+        # 절입 거리로 계산한 대운수와 현재 대운
+        great_luck = saju_data.get('great_luck') or {}
+        current_luck = current_period(great_luck, datetime.now())
+        luck_flow = " → ".join(
+            f"{period['start_age']}세 {period['pillar']}" for period in great_luck.get('pillars', [])[:8]
+        )
+        
+        # 향후 세운(5년)과 월운(12개월)은 만세력 테이블에서 조회
+        annual_luck, monthly_luck = [], []
+        calendar = get_calendar_table()
+        if calendar is not None:
+            annual_luck = [
+                {"year": year, "pillar": calendar.year_pillar(year)}
+                for year in range(current_year, current_year + 5) if calendar.year_pillar(year)
+            ]
+            today = datetime.now().date()
+            monthly_luck = calendar.month_transitions(today, today + timedelta(days=365))[:12]
+        annual_text = ", ".join(f"{item['year']}년 {item['pillar']}" for item in annual_luck) or "정보 없음"
+        
+        # 원국 + 현재 대운 + 올해 세운을 합친 오행 생극 흐름
+        combined_pillars = [saju_data['year_pillar'], saju_data['month_pillar'],
+                            saju_data['day_pillar'], saju_data['hour_pillar']]
+        if current_luck:
+            combined_pillars.append(current_luck['pillar'])
+        if annual_luck:
+            combined_pillars.append(annual_luck[0]['pillar'])
+        element_flow = self.analyzer.analyze_element_relations(combined_pillars)
+        flow_text = ", ".join(
+            f"{name} {weight}" for name, weight in
+            sorted({**element_flow['generation_flow'], **element_flow['destruction_flow']}.items(),
+                   key=lambda item: -item[1])[:4]
+        ) or "정보 없음"
+        monthly_text = ", ".join(f"{item['start_date'][:7]} {item['month_pillar']}" for item in monthly_luck) or "정보 없음"
+        
+        # 향후 10년 세운이 원국(+그해 대운)과 만드는 합충형파해 (LLM 호출 전에 계산)
+        # 테이블 범위 밖 연도나 잘못된 원국이면 다른 운세 정보처럼 "없음" 으로 두고 분석은 계속
+        try:
+            timeline = scan_interactions(saju_data, current_year, current_year + 9)
+        except Exception as e:
+            events.warning(log, "workflow.timeline_error", "향후 10년 합충형파해 스캔 실패: {error}", error=str(e))
+            timeline = None
+        timeline_text = "\n".join(
+            f"  - {item['year']}년 {item['pillar']}: "
+            + ", ".join(f"{event['name']}({'·'.join(event['with'])})" for event in item['events'])
+            for item in (timeline['years'] if timeline else []) if item['events']
+        ) or "  - 없음"
+        
         prompt = f"""
 현재 대운과 향후 운세 흐름을 분석해주세요.
 
 **기본 정보:**
 - 사주: {saju_data['year_pillar']} {saju_data['month_pillar']} {saju_data['day_pillar']} {saju_data['hour_pillar']}
 - 현재 나이: {current_age}세
+- 대운: {great_luck.get('direction', '')} {great_luck.get('start_age', '')}세 시작 ({luck_flow})
+- 현재 대운: {current_luck['pillar'] + f" ({current_luck['start_age']}~{current_luck['end_age']}세)" if current_luck else '대운 시작 전'}
+- 향후 세운: {annual_text}
+- 향후 월운: {monthly_text}
+- 원국+대운+세운 오행 흐름 (강한 순): {flow_text}
+- 향후 10년 세운과 원국의 합충형파해:
+{timeline_text}
 
 **분석 요청:**
 1. 현재 대운의 특성
@@ -341,7 +412,13 @@ class SajuAnalysisWorkflow:
             "content": response.content,
             "data": {
                 "current_age": current_age,
-                "current_year": current_year
+                "current_year": current_year,
+                "great_luck_start_age": great_luck.get('start_age'),
+                "current_great_luck": current_luck,
+                "annual_luck": annual_luck,
+                "monthly_luck": monthly_luck,
+                "element_flow": dict(element_flow),
+                "timeline": timeline
             }
         }
         
@@ -356,11 +433,17 @@ class SajuAnalysisWorkflow:
         state["step_name"] = "형충파해 분석"
         
         saju_data = state["saju_data"]
+        interactions = state["extended_data"].get("branch_interactions", [])
+        pillar_names = ["년지", "월지", "일지", "시지"]
+        found = ", ".join(
+            f"{item['name']}({'·'.join(pillar_names[p] for p in item['positions'])})" for item in interactions
+        ) or "없음"
         
         prompt = f"""
 사주의 형충파해 요소와 대처방안을 분석해주세요.
 
 **사주:** {saju_data['year_pillar']} {saju_data['month_pillar']} {saju_data['day_pillar']} {saju_data['hour_pillar']}
+**지지 합/충/형/파/해:** {found}
 
 **분석 요청:**
 1. 형충파해 발견 여부
@@ -380,7 +463,7 @@ class SajuAnalysisWorkflow:
         state["step_results"]["step6"] = {
             "title": "형충파해 분석",
             "content": response.content,
-            "data": {}
+            "data": {"branch_interactions": interactions}
         }
         
         state["messages"].append(response)
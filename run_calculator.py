@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 사주 계산기 실행 스크립트
+
+    python run_calculator.py                              # 대화형 계산기
+    python run_calculator.py bulk births.csv -o out.jsonl  # 대량 계산 (saju_engine.bulk)
 """
 import sys
 from pathlib import Path
@@ -11,6 +14,10 @@ sys.path.insert(0, str(project_root))
 
 if __name__ == "__main__":
     try:
+        if len(sys.argv) > 1 and sys.argv[1] == "bulk":
+            from saju_engine.bulk import main as bulk_main
+            sys.exit(bulk_main(sys.argv[2:]))
+
         from saju_calculator import main
         main()
     except ImportError as e:
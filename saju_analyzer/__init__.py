@@ -2,12 +2,14 @@
 # 사주 데이터 분석 및 용어 해설 기능 제공
 
 from .core import SajuAnalyzer, SajuData, ExtendedSajuData
+from .chart import SajuChart
 from .terms import SajuTermsExplainer, TermExplanation
 
 __all__ = [
     "SajuAnalyzer",
     "SajuData", 
     "ExtendedSajuData",
+    "SajuChart",
     "SajuTermsExplainer",
     "TermExplanation"
 ] 
\ No newline at end of file
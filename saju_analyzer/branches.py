@@ -0,0 +1,184 @@
+# saju_analyzer/branches.py
+# 지지 상호작용 엔진 (12비트 지지 마스크 + 마스크별 관계 테이블)
+#
+# 기둥 수와 관계없이 지지들을 12비트 마스크(나온 지지)와 중복 마스크(두 번 이상 나온 지지)로 바꾼 뒤
+# 마스크별로 한 번만 계산해 둔 관계 비트(최대 64개 관계)를 조회합니다.
+#   合 육합, 三合/半合 삼합국, 方合 방합, 沖, 刑(삼형/상형/자형), 破, 害
+# 세 글자가 모두 있으면 같은 국의 半合, 같은 삼형의 두 글자 刑은 따로 보고하지 않습니다.
+# 관계가 나온 위치(몇 번째 기둥인지)는 지지별 위치 비트마스크로 계산합니다.
+#
+# 확장 분석의 conflicts(기존 형충파해 목록, SajuAnalyzer.CONFLICTS 기준)는 호환을 위해 그대로 두고
+# branch_interactions 항목이 이 엔진의 결과입니다. interactions_batch 는 [N, 기둥 수] 지지 배열용입니다.
+
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from saju_analyzer.core import SajuAnalyzer
+from saju_engine.sexagenary import BRANCHES
+
+# 육합 (합화 오행)
+SIX_COMBINATIONS = (('子', '丑', '土'), ('寅', '亥', '木'), ('卯', '戌', '火'),
+                    ('辰', '酉', '金'), ('巳', '申', '水'), ('午', '未', '火'))
+
+# 삼합국 (생지, 왕지, 고지, 오행) - 왕지를 포함한 두 글자는 半合
+THREE_HARMONIES = (('申', '子', '辰', '水'), ('亥', '卯', '未', '木'),
+                   ('寅', '午', '戌', '火'), ('巳', '酉', '丑', '金'))
+
+# 방합 (같은 계절의 세 지지)
+DIRECTIONAL_COMBINATIONS = (('寅', '卯', '辰', '木'), ('巳', '午', '未', '火'),
+                            ('申', '酉', '戌', '金'), ('亥', '子', '丑', '水'))
+
+# 자형 (같은 지지가 두 번 이상) - CONFLICTS 의 午午/酉酉/亥亥 + 辰辰
+SELF_PUNISHMENTS = ('辰', '午', '酉', '亥')
+
+
+class BranchRelation(NamedTuple):
+    """지지 관계 규칙"""
+    type: str                   # 合 / 三合 / 半合 / 方合 / 沖 / 刑 / 破 / 害
+    name: str                   # 예: 子丑合, 申子辰三合, 午午自刑
+    branches: Tuple[str, ...]
+    element: Optional[str]      # 합이 만드는 오행 (합 계열만)
+    mask: int                   # 필요한 지지 비트
+    duplicate: bool             # 같은 지지가 두 번 이상 있어야 성립 (자형)
+
+
+def _bit(branch: str) -> int:
+    return 1 << BRANCHES.index(branch)
+
+
+def _build_relations() -> Tuple[Tuple[BranchRelation, ...], Dict[int, int]]:
+    """관계 규칙 목록과 (관계 인덱스 → 그 관계를 가리는 세 글자 관계 인덱스)"""
+    relations: List[BranchRelation] = []
+    covered_by: Dict[int, int] = {}
+
+    def add(kind, group, name_suffix, element=None, duplicate=False):
+        relations.append(BranchRelation(kind, ''.join(group) + name_suffix, tuple(group), element,
+                                        sum(_bit(b) for b in set(group)), duplicate))
+        return len(relations) - 1
+
+    for a, b, element in SIX_COMBINATIONS:
+        add('合', (a, b), '合', element)
+    for start, center, end, element in THREE_HARMONIES:
+        full = add('三合', (start, center, end), '三合', element)
+        for pair in ((start, center), (center, end)):
+            covered_by[add('半合', pair, '半合', element)] = full
+    for group in DIRECTIONAL_COMBINATIONS:
+        add('方合', group[:3], '方合', group[3])
+    for a, b in SajuAnalyzer.CONFLICTS['沖']:
+        add('沖', (a, b), '沖')
+    for group in SajuAnalyzer.CONFLICTS['刑']:
+        if len(group) == 3:
+            full = add('刑', group, '三刑')
+            for pair in combinations(group, 2):
+                covered_by[add('刑', pair, '刑')] = full
+        elif group[0] != group[1]:
+            add('刑', group, '刑')
+    for branch in SELF_PUNISHMENTS:
+        add('刑', (branch, branch), '自刑', duplicate=True)
+    for kind in ('破', '害'):
+        for a, b in SajuAnalyzer.CONFLICTS[kind]:
+            add(kind, (a, b), kind)
+
+    return tuple(relations), covered_by
+
+
+RELATIONS, _COVERED_BY = _build_relations()
+assert len(RELATIONS) <= 64
+DUPLICATE_RELATIONS = tuple(i for i, relation in enumerate(RELATIONS) if relation.duplicate)
+# 지지 인덱스 → 그 지지가 들어가는 관계 비트 (운에서 들어온 지지가 일으키는 관계만 고를 때)
+RELATIONS_BY_BRANCH = tuple(sum(1 << i for i, relation in enumerate(RELATIONS) if relation.mask >> branch & 1)
+                            for branch in range(12))
+
+
+@lru_cache(maxsize=None)
+def mask_relations(mask: int) -> int:
+    """12비트 지지 마스크 → 성립하는 관계 비트 (자형 제외, 마스크별 1회 계산)"""
+    bits = 0
+    for i, relation in enumerate(RELATIONS):
+        if not relation.duplicate and mask & relation.mask == relation.mask:
+            bits |= 1 << i
+    for i, full in _COVERED_BY.items():
+        if bits >> full & 1:
+            bits &= ~(1 << i)
+    return bits
+
+
+def duplicate_relations(duplicates: int) -> int:
+    """중복 마스크(두 번 이상 나온 지지) → 자형 관계 비트"""
+    bits = 0
+    for i in DUPLICATE_RELATIONS:
+        if duplicates & RELATIONS[i].mask:
+            bits |= 1 << i
+    return bits
+
+
+def branch_masks(branches: Sequence[int]) -> Tuple[int, int, List[int]]:
+    """지지 인덱스 목록 → (지지 마스크, 중복 마스크, 지지별 위치 비트마스크)"""
+    mask = duplicates = 0
+    positions = [0] * 12
+    for i, branch in enumerate(branches):
+        bit = 1 << branch
+        duplicates |= mask & bit
+        mask |= bit
+        positions[branch] |= 1 << i
+    return mask, duplicates, positions
+
+
+def relation_bits(branches: Sequence[int]) -> int:
+    """지지 인덱스 목록 → 관계 비트 (RELATIONS 순서)"""
+    mask, duplicates, _ = branch_masks(branches)
+    return mask_relations(mask) | duplicate_relations(duplicates)
+
+
+def describe(bits: int) -> List[BranchRelation]:
+    """관계 비트 → 관계 규칙 목록"""
+    return [relation for i, relation in enumerate(RELATIONS) if bits >> i & 1]
+
+
+def interactions(branches: Sequence[int]) -> List[Dict]:
+    """지지 인덱스 목록 (원국 4개 + 대운/세운 등) → 지지 관계 목록"""
+    mask, duplicates, positions = branch_masks(branches)
+    bits = mask_relations(mask) | duplicate_relations(duplicates)
+
+    result = []
+    while bits:
+        low = bits & -bits
+        relation = RELATIONS[low.bit_length() - 1]
+        bits ^= low
+        position_bits = 0
+        for branch in set(relation.branches):
+            position_bits |= positions[BRANCHES.index(branch)]
+        result.append({
+            'type': relation.type,
+            'name': relation.name,
+            'branches': list(relation.branches),
+            'element': relation.element,
+            'positions': [i for i in range(len(branches)) if position_bits >> i & 1]
+        })
+    return result
+
+
+_batch_table = None
+
+
+def interactions_batch(branches) -> 'np.ndarray':
+    """지지 인덱스 배열 [N, 기둥 수] → 관계 비트 배열 uint64 [N] (describe 로 해석)"""
+    global _batch_table
+    import numpy as np
+
+    if _batch_table is None:
+        _batch_table = np.array([mask_relations(mask) for mask in range(1 << 12)], dtype=np.uint64)
+
+    branches = np.atleast_2d(np.asarray(branches, dtype=np.int64))
+    offsets = 12 * np.arange(len(branches))[:, None]
+    counts = np.bincount((branches + offsets).ravel(), minlength=12 * len(branches)).reshape(-1, 12)
+    weights = np.left_shift(1, np.arange(12))
+    mask = (counts > 0) @ weights
+    duplicates = (counts > 1) @ weights
+
+    bits = _batch_table[mask]
+    for i in DUPLICATE_RELATIONS:
+        has = (duplicates & RELATIONS[i].mask) != 0
+        bits |= has.astype(np.uint64) << np.uint64(i)
+    return bits
@@ -0,0 +1,131 @@
+# saju_analyzer/chart.py
+# 정수 인덱스 기반 사주 원국 (SajuChart)
+#
+# 네 기둥을 육십갑자 인덱스(0~59)로 묶은 24비트 사주 코드 하나로 저장하고,
+# 천간/지지/오행 개수는 처음 접근할 때 한 번만 계산합니다 (__slots__, 인스턴스 dict 없음).
+# code 는 해시/캐시/DB 키로 그대로 쓸 수 있고, SajuData 및 calculate_solar_saju 결과 dict 와
+# 손실 없이 서로 변환됩니다.
+
+from typing import Dict, Optional, Tuple
+
+from saju_analyzer.core import SajuAnalyzer, SajuData
+from saju_engine.sexagenary import (
+    BRANCHES,
+    STEMS,
+    pack_chart,
+    pack_pillars,
+    pillar_name,
+    unpack_chart,
+)
+
+ELEMENT_ORDER = '木火土金水'
+
+# 인덱스 → 문자열 (모든 차트가 같은 문자열 객체를 공유)
+PILLAR_NAMES = tuple(pillar_name(i) for i in range(60))
+
+# 천간/지지 인덱스 → 오행 인덱스 (ELEMENT_ORDER 기준)
+STEM_ELEMENT = tuple(ELEMENT_ORDER.index(SajuAnalyzer.ELEMENTS[stem]) for stem in STEMS)
+BRANCH_ELEMENT = tuple(ELEMENT_ORDER.index(SajuAnalyzer.ELEMENTS[branch]) for branch in BRANCHES)
+
+
+class SajuChart:
+    """사주 원국 (24비트 코드 + 출생 정보/대운)"""
+
+    __slots__ = ('code', 'birth_info', 'great_luck', '_stems', '_branches', '_elements')
+
+    def __init__(self, code: int, birth_info: Optional[Dict] = None, great_luck: Optional[Dict] = None):
+        self.code = code
+        self.birth_info = birth_info
+        self.great_luck = great_luck
+        self._stems = None
+        self._branches = None
+        self._elements = None
+
+    @classmethod
+    def from_indexes(cls, year: int, month: int, day: int, hour: int, **kwargs) -> 'SajuChart':
+        """네 기둥의 육십갑자 인덱스로 생성"""
+        return cls(pack_chart(year, month, day, hour), **kwargs)
+
+    @classmethod
+    def from_dict(cls, saju: Dict) -> 'SajuChart':
+        """calculate_solar_saju 결과 (또는 SajuData.to_dict()) 로 생성"""
+        return cls(pack_pillars(saju), saju.get('birth_info'), saju.get('great_luck'))
+
+    @classmethod
+    def from_saju_data(cls, data: SajuData) -> 'SajuChart':
+        return cls.from_dict(data.to_dict())
+
+    @property
+    def pillars(self) -> Tuple[int, int, int, int]:
+        """(연, 월, 일, 시) 육십갑자 인덱스"""
+        return unpack_chart(self.code)
+
+    @property
+    def pillar_names(self) -> Tuple[str, str, str, str]:
+        return tuple(PILLAR_NAMES[index] for index in unpack_chart(self.code))
+
+    @property
+    def stems(self) -> Tuple[int, int, int, int]:
+        """(연, 월, 일, 시) 천간 인덱스"""
+        if self._stems is None:
+            self._stems = tuple(index % 10 for index in unpack_chart(self.code))
+        return self._stems
+
+    @property
+    def branches(self) -> Tuple[int, int, int, int]:
+        """(연, 월, 일, 시) 지지 인덱스"""
+        if self._branches is None:
+            self._branches = tuple(index % 12 for index in unpack_chart(self.code))
+        return self._branches
+
+    @property
+    def day_stem(self) -> int:
+        return self.stems[2]
+
+    @property
+    def elements(self) -> Tuple[int, int, int, int, int]:
+        """오행 개수 (ELEMENT_ORDER 순서, 천간 4 + 지지 4)"""
+        if self._elements is None:
+            counts = [0] * 5
+            for stem in self.stems:
+                counts[STEM_ELEMENT[stem]] += 1
+            for branch in self.branches:
+                counts[BRANCH_ELEMENT[branch]] += 1
+            self._elements = tuple(counts)
+        return self._elements
+
+    def element_counts(self) -> Dict[str, int]:
+        """calculate_five_elements 와 같은 형식의 오행 dict (천간 → 지지 순으로 처음 나온 순서)"""
+        counts = {}
+        for element in [STEM_ELEMENT[s] for s in self.stems] + [BRANCH_ELEMENT[b] for b in self.branches]:
+            name = ELEMENT_ORDER[element]
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict:
+        """SajuData.to_dict() 와 같은 형식"""
+        year, month, day, hour = self.pillar_names
+        return {
+            'year_pillar': year,
+            'month_pillar': month,
+            'day_pillar': day,
+            'hour_pillar': hour,
+            'birth_info': self.birth_info,
+            'elements': self.element_counts(),
+            'great_luck': self.great_luck
+        }
+
+    def to_saju_data(self) -> SajuData:
+        return SajuData(**self.to_dict())
+
+    def __eq__(self, other):
+        if not isinstance(other, SajuChart):
+            return NotImplemented
+        return (self.code, self.birth_info, self.great_luck) == (other.code, other.birth_info, other.great_luck)
+
+    def __hash__(self):
+        return hash(self.code)
+
+    def __repr__(self):
+        return f"SajuChart({' '.join(self.pillar_names)}, code=0x{self.code:06x})"
+
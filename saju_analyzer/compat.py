@@ -0,0 +1,225 @@
+# saju_analyzer/compat.py
+# 궁합 점수 엔진 (정수 사주 코드 N × M 쌍 벡터 계산)
+#
+# 사주는 saju_engine.sexagenary 의 24비트 사주 코드로 받고, 점수는 네 항목의 가중합(0~100)입니다.
+#   element  오행 보완: 두 사주를 합친 16글자의 오행 분포가 고를수록 높음
+#   ten_god  일간 십신: 서로의 일간이 상대에게 어떤 십신인지 (正財/正官 등 배우자성 우대, 양방향 평균)
+#   branch   지지 관계: 네 지지 × 네 지지의 육합(+)과 충/형/파/해(-) 합계
+#   day      일주 관계: 일간 천간합과 일지(배우자궁)끼리의 합충
+# 십신/형충파해는 SajuAnalyzer.TEN_GODS_MAP, CONFLICTS 를 10×10, 12×12 행렬로 바꿔 조회합니다.
+#
+# 큰 N × M 은 행 블록(chunk_cells 칸 단위)으로 나눠 계산하며, top_k_matches 는 블록마다 상위 K 개만 유지합니다.
+
+from itertools import combinations
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+from saju_analyzer.core import SajuAnalyzer
+from saju_engine.sexagenary import BRANCHES, STEMS, pack_pillars, unpack_chart
+
+ELEMENT_ORDER = '木火土金水'
+
+# 점수 가중치 (합계 1.0)
+WEIGHTS = {'element': 0.30, 'ten_god': 0.25, 'branch': 0.25, 'day': 0.20}
+
+# 상대 일간이 내게 어떤 십신인지에 따른 점수
+TEN_GOD_SCORES = {
+    '正財': 1.0, '正官': 1.0, '正印': 0.8, '食神': 0.7, '偏財': 0.6,
+    '比肩': 0.5, '偏印': 0.4, '劫財': 0.3, '傷官': 0.3, '七殺': 0.2
+}
+
+# 지지 관계 가중치 (육합은 CONFLICTS 에 없으므로 여기서 정의)
+SIX_COMBINATIONS = [('子','丑'), ('寅','亥'), ('卯','戌'), ('辰','酉'), ('巳','申'), ('午','未')]
+BRANCH_WEIGHTS = {'合': 1.0, '沖': -1.0, '刑': -0.75, '破': -0.5, '害': -0.5}
+
+# 천간합 (甲己, 乙庚, 丙辛, 丁壬, 戊癸)
+STEM_COMBINATIONS = [('甲','己'), ('乙','庚'), ('丙','辛'), ('丁','壬'), ('戊','癸')]
+
+DEFAULT_CHUNK_CELLS = 1 << 22
+
+# 오행 분포 편차의 정규화 기준 (16글자가 한 오행에 몰린 경우)
+_IDEAL_COUNT = 16 / 5
+_MAX_DEVIATION = 2 * (16 - _IDEAL_COUNT)
+
+
+def _branch_relations() -> Dict[Tuple[str, str], List[str]]:
+    """(지지, 지지) → 관계 목록 (삼형은 세 지지 중 두 지지 쌍마다, 자형은 같은 지지끼리)"""
+    relations: Dict[Tuple[str, str], List[str]] = {}
+
+    def add(a, b, kind):
+        relations.setdefault((a, b), []).append(kind)
+        if a != b:
+            relations.setdefault((b, a), []).append(kind)
+
+    for a, b in SIX_COMBINATIONS:
+        add(a, b, '合')
+    for kind, groups in SajuAnalyzer.CONFLICTS.items():
+        for group in groups:
+            if len(group) == 2:
+                add(group[0], group[1], kind)
+            else:
+                for a, b in combinations(group, 2):
+                    add(a, b, kind)
+    return relations
+
+
+BRANCH_RELATIONS = _branch_relations()
+
+
+def _lookup_tables():
+    """SajuAnalyzer 상수 → 점수 조회 행렬"""
+    element_index = {element: i for i, element in enumerate(ELEMENT_ORDER)}
+    stem_element = np.array([element_index[SajuAnalyzer.ELEMENTS[s]] for s in STEMS], dtype=np.int64)
+    branch_element = np.array([element_index[SajuAnalyzer.ELEMENTS[b]] for b in BRANCHES], dtype=np.int64)
+
+    # ten_god[a, b] = 상대 일간 b 가 일간 a 에게 주는 점수와 그 반대의 평균
+    one_way = np.array([[TEN_GOD_SCORES[SajuAnalyzer.TEN_GODS_MAP[a][b]] for b in STEMS] for a in STEMS])
+    ten_god = ((one_way + one_way.T) / 2).astype(np.float32)
+
+    branch = np.zeros((12, 12), dtype=np.float32)
+    for (a, b), kinds in BRANCH_RELATIONS.items():
+        branch[BRANCHES.index(a), BRANCHES.index(b)] = sum(BRANCH_WEIGHTS[kind] for kind in kinds)
+
+    stem_combination = np.zeros((10, 10), dtype=np.float32)
+    for a, b in STEM_COMBINATIONS:
+        stem_combination[STEMS.index(a), STEMS.index(b)] = stem_combination[STEMS.index(b), STEMS.index(a)] = 1.0
+
+    return stem_element, branch_element, ten_god, branch, stem_combination
+
+
+STEM_ELEMENT, BRANCH_ELEMENT, TEN_GOD_MATRIX, BRANCH_MATRIX, STEM_COMBINATION_MATRIX = _lookup_tables()
+
+
+class ChartFeatures(NamedTuple):
+    """궁합 계산용 사주 특징 배열 (행 = 사주)"""
+    elements: np.ndarray      # int8 [N, 5] 오행 개수 (ELEMENT_ORDER)
+    branches: np.ndarray      # float32 [N, 12] 지지 개수
+    day_stem: np.ndarray      # int64 [N]
+    day_branch: np.ndarray    # int64 [N]
+
+    def __len__(self):
+        return len(self.day_stem)
+
+    def rows(self, start: int, stop: int) -> 'ChartFeatures':
+        return ChartFeatures(*(part[start:stop] for part in self))
+
+
+def chart_features(codes) -> ChartFeatures:
+    """사주 코드 배열 → ChartFeatures"""
+    codes = np.atleast_1d(np.asarray(codes, dtype=np.int64))
+    pillars = np.stack(unpack_chart(codes), axis=1)
+    stems, branches = pillars % 10, pillars % 12
+
+    # 행별 개수는 (행 × 칸 수 + 칸) 평탄 인덱스의 bincount 로 한 번에 계산
+    offsets = np.arange(len(codes))[:, None]
+    element_index = np.concatenate([STEM_ELEMENT[stems], BRANCH_ELEMENT[branches]], axis=1) + 5 * offsets
+    elements = np.bincount(element_index.ravel(), minlength=5 * len(codes)).reshape(-1, 5).astype(np.int8)
+    branch_counts = np.bincount((branches + 12 * offsets).ravel(), minlength=12 * len(codes))
+    branch_counts = branch_counts.reshape(-1, 12).astype(np.float32)
+
+    return ChartFeatures(elements, branch_counts, stems[:, 2], branches[:, 2])
+
+
+def _as_features(charts) -> ChartFeatures:
+    return charts if isinstance(charts, ChartFeatures) else chart_features(charts)
+
+
+def score_components(a: ChartFeatures, b: ChartFeatures) -> Dict[str, np.ndarray]:
+    """항목별 점수 행렬 (각 float32 [len(a), len(b)], 0~1)"""
+    # 편차를 5배 해서 정수(int8)로 계산: |5 × 합친 개수 - 16|
+    deviation = np.abs(5 * (a.elements[:, None, :] + b.elements[None, :, :]) - 16).sum(axis=2, dtype=np.int16)
+    element = 1 - deviation / (5 * _MAX_DEVIATION)
+
+    ten_god = TEN_GOD_MATRIX[a.day_stem[:, None], b.day_stem[None, :]]
+
+    # 네 지지 × 네 지지(16쌍) 관계 합계 = 지지 개수 벡터의 이차형식, 16쌍 기준으로 0~1 에 맞추고 범위 밖은 자름
+    branch = np.clip(0.5 + (a.branches @ BRANCH_MATRIX @ b.branches.T) / 16, 0, 1)
+
+    day = np.clip(
+        0.5 + 0.25 * STEM_COMBINATION_MATRIX[a.day_stem[:, None], b.day_stem[None, :]]
+        + 0.25 * BRANCH_MATRIX[a.day_branch[:, None], b.day_branch[None, :]], 0, 1
+    )
+
+    return {
+        'element': element.astype(np.float32),
+        'ten_god': ten_god,
+        'branch': branch.astype(np.float32),
+        'day': day.astype(np.float32)
+    }
+
+
+def _total(components: Dict[str, np.ndarray]) -> np.ndarray:
+    total = sum(WEIGHTS[name] * value for name, value in components.items())
+    return (100 * total).astype(np.float32)
+
+
+def iter_score_blocks(charts_a, charts_b, chunk_cells: int = DEFAULT_CHUNK_CELLS) -> Iterator[Tuple[int, np.ndarray]]:
+    """(시작 행, 점수 블록 float32 [rows, len(b)]) 을 chunk_cells 칸 이하 행 블록으로 생성"""
+    a, b = _as_features(charts_a), _as_features(charts_b)
+    rows = max(1, chunk_cells // max(len(b), 1))
+    for start in range(0, len(a), rows):
+        yield start, _total(score_components(a.rows(start, start + rows), b))
+
+
+def score_matrix(charts_a, charts_b, chunk_cells: int = DEFAULT_CHUNK_CELLS) -> np.ndarray:
+    """궁합 점수 행렬 float32 [N, M] (0~100)"""
+    a, b = _as_features(charts_a), _as_features(charts_b)
+    scores = np.empty((len(a), len(b)), dtype=np.float32)
+    for start, block in iter_score_blocks(a, b, chunk_cells):
+        scores[start:start + len(block)] = block
+    return scores
+
+
+def top_k_matches(charts_a, charts_b, k: int = 10,
+                  chunk_cells: int = DEFAULT_CHUNK_CELLS) -> Tuple[np.ndarray, np.ndarray]:
+    """행(사주 a)마다 점수 상위 k 개 후보의 (인덱스 int64 [N, k], 점수 float32 [N, k]), 점수 내림차순
+
+    후보가 k 개보다 적으면 k = 후보 수. 후보 열도 chunk_cells 단위로 나눠 블록마다 상위 k 개만 유지합니다.
+    """
+    a, b = _as_features(charts_a), _as_features(charts_b)
+    k = min(k, len(b))
+    best_index = np.zeros((len(a), k), dtype=np.int64)
+    best_score = np.full((len(a), k), -np.inf, dtype=np.float32)
+    if k == 0:
+        return best_index, best_score
+
+    columns = max(k, min(len(b), chunk_cells))
+    rows = max(1, chunk_cells // columns)
+    for row in range(0, len(a), rows):
+        block_a = a.rows(row, row + rows)
+        index, score = best_index[row:row + rows], best_score[row:row + rows]
+        for column in range(0, len(b), columns):
+            block = _total(score_components(block_a, b.rows(column, column + columns)))
+            candidates = np.concatenate([score, block], axis=1)
+            candidate_index = np.concatenate(
+                [index, np.broadcast_to(np.arange(column, column + block.shape[1]), block.shape)], axis=1
+            )
+            keep = np.argpartition(-candidates, k - 1, axis=1)[:, :k]
+            score[:] = np.take_along_axis(candidates, keep, axis=1)
+            index[:] = np.take_along_axis(candidate_index, keep, axis=1)
+
+    order = np.argsort(-best_score, axis=1, kind='stable')
+    return np.take_along_axis(best_index, order, axis=1), np.take_along_axis(best_score, order, axis=1)
+
+
+def score_pair(saju_a: Dict, saju_b: Dict) -> Dict:
+    """두 사주(calculate_solar_saju 결과 또는 같은 키의 dict)의 궁합 점수와 항목별 근거"""
+    code_a, code_b = pack_pillars(saju_a), pack_pillars(saju_b)
+    components = score_components(chart_features([code_a]), chart_features([code_b]))
+
+    branches_a = [saju_a[key][1] for key in ('year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar')]
+    branches_b = [saju_b[key][1] for key in ('year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar')]
+    relations = [
+        {'branches': [x, y], 'types': BRANCH_RELATIONS[(x, y)]}
+        for x in branches_a for y in branches_b if (x, y) in BRANCH_RELATIONS
+    ]
+    day_a, day_b = saju_a['day_pillar'][0], saju_b['day_pillar'][0]
+
+    return {
+        'score': round(float(_total(components)[0, 0]), 1),
+        'components': {name: round(float(value[0, 0]), 3) for name, value in components.items()},
+        # to_a: B 의 일간이 A 에게 어떤 십신인지
+        'ten_gods': {'to_a': SajuAnalyzer.TEN_GODS_MAP[day_a][day_b], 'to_b': SajuAnalyzer.TEN_GODS_MAP[day_b][day_a]},
+        'branch_relations': relations
+    }
@@ -0,0 +1,85 @@
+# saju_analyzer/extended_cache.py
+# 확장 분석 결과 메모이제이션 (프로세스 내 LRU)
+#
+# analyze_extended_saju 의 결과(basic_data 제외)는 네 기둥과 출생 월의 계절에만 의존하므로
+# 키는 (24비트 사주 코드, 계절) 입니다. 같은 사주가 다시 들어오면 /analyze, 워크플로우,
+# 스트리밍 분석이 모두 dict 조회 한 번으로 결과와 미리 직렬화된 JSON 바이트를 공유합니다.
+#
+# 환경 변수:
+#   SAJU_EXTENDED_CACHE_SIZE  최대 항목 수 (기본: 16384, 0 이면 캐시 사용 안 함)
+
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from saju_analyzer import serialization
+from saju_engine.kasi_cache import MemoryLRUCache
+
+DEFAULT_EXTENDED_CACHE_SIZE = 16384
+
+
+class ExtendedEntry:
+    """캐시 항목: 확장 분석 필드 dict + JSON 바이트 (처음 요청할 때 1회 직렬화)"""
+
+    __slots__ = ('fields', '_json')
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+        self._json = None
+
+    def json_bytes(self) -> bytes:
+        """fields 의 JSON UTF-8 바이트 (serialization.dumps)"""
+        if self._json is None:
+            self._json = serialization.dumps(self.fields)
+        return self._json
+
+
+class ExtendedCache:
+    """확장 분석 결과 LRU (max_entries=0 이면 항상 새로 계산)"""
+
+    def __init__(self, max_entries: int = DEFAULT_EXTENDED_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lru = MemoryLRUCache(max_entries, default_ttl=None) if max_entries > 0 else None
+
+    @staticmethod
+    def key(code: int, season: Optional[str]) -> Hashable:
+        return code, season
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Dict[str, Any]]) -> ExtendedEntry:
+        """캐시 조회, 없으면 compute() 결과를 저장 후 반환 (fields 는 공유 객체이므로 수정 금지)"""
+        if self._lru is None:
+            return ExtendedEntry(compute())
+
+        entry = self._lru.get(key)
+        if entry is None:
+            entry = ExtendedEntry(compute())
+            self._lru.set(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        if self._lru is not None:
+            self._lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit_rate 포함)"""
+        if self._lru is None:
+            return {'enabled': False}
+        stats = self._lru.stats()
+        stats.update({'enabled': True, 'max_entries': self.max_entries})
+        return stats
+
+
+_extended_cache: Optional[ExtendedCache] = None
+_extended_cache_lock = threading.Lock()
+
+
+def get_extended_cache() -> ExtendedCache:
+    """프로세스 공용 확장 분석 캐시 (최초 사용 시 생성)"""
+    global _extended_cache
+
+    if _extended_cache is None:
+        with _extended_cache_lock:
+            if _extended_cache is None:
+                _extended_cache = ExtendedCache(int(os.getenv("SAJU_EXTENDED_CACHE_SIZE",
+                                                              DEFAULT_EXTENDED_CACHE_SIZE)))
+    return _extended_cache
@@ -0,0 +1,66 @@
+# saju_analyzer/serialization.py
+# 사주 데이터 직렬화 (orjson JSON 바이트 + msgpack 압축 바이너리)
+#
+# dumps/loads 는 orjson 을 쓰고, 설치되어 있지 않으면 표준 json(공백 없는 구분자)으로 같은 내용을 만듭니다.
+# 결과는 UTF-8 바이트이며 비ASCII 문자를 이스케이프하지 않습니다 (json.dumps(..., ensure_ascii=False) 와 같은 내용).
+# packb/unpackb 는 내부 저장용 msgpack 이며 선택 의존성입니다 (pip install msgpack).
+# json_object 는 미리 직렬화해 둔 값 바이트를 다시 인코딩하지 않고 JSON 객체 하나로 잇습니다.
+
+import json
+from typing import Any, Dict
+
+_orjson = None
+_orjson_loaded = False
+
+
+def _get_orjson():
+    """orjson 모듈 (없으면 None, 최초 사용 시 import)"""
+    global _orjson, _orjson_loaded
+
+    if not _orjson_loaded:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+        _orjson_loaded = True
+    return _orjson
+
+
+def dumps(value: Any) -> bytes:
+    """값 → JSON UTF-8 바이트 (dict 의 정수 키는 문자열로)"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data) -> Any:
+    """JSON 바이트/문자열 → 값"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_object(parts: Dict[str, bytes]) -> bytes:
+    """키 → 직렬화된 값 바이트 dict 를 JSON 객체 바이트 하나로 (값은 다시 인코딩하지 않음)"""
+    return b'{' + b','.join(dumps(key) + b':' + value for key, value in parts.items()) + b'}'
+
+
+def _get_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise RuntimeError("msgpack 직렬화에는 msgpack 이 필요합니다: pip install msgpack") from None
+    return msgpack
+
+
+def packb(value: Any) -> bytes:
+    """값 → msgpack 바이트 (튜플은 배열로)"""
+    return _get_msgpack().packb(value, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """msgpack 바이트 → 값 (정수 키 허용)"""
+    return _get_msgpack().unpackb(data, raw=False, strict_map_key=False)
@@ -0,0 +1,143 @@
+# saju_analyzer/strength.py
+# 일간 강약 점수 모델 (지장간 가중치 + 월령 왕상휴수사)
+#
+# 일간을 뺀 일곱 글자의 오행 기여도를 더해 비겁·인성(일간을 돕는 쪽)의 비율을 0~100 점수로 냅니다.
+#   - 천간은 한 글자 10, 지지는 지장간을 본기/중기/여기 비율(10분율)로 나눈 10 (글자별 오행 벡터를 미리 계산)
+#   - 위치 가중치: 월지(월령) 2배, 나머지 1배
+#   - 월령 배수: 월지 오행과의 관계로 旺 130% / 相 115% / 休 100% / 囚 85% / 死 70%
+# 모든 가중치가 정수라 스칼라(day_master_strength)와 NumPy 배치(strength_batch) 결과의 기여도가 정확히 같습니다.
+# 확장 분석의 day_master_strength(신강/신약 문자열)는 호환을 위해 그대로 두고 day_master_score 항목이 이 모델입니다.
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+from saju_analyzer.tables import BRANCH_ELEMENT, ELEMENT_ORDER, HIDDEN_STEMS, STEM_ELEMENT, STEMS
+from saju_engine.sexagenary import BRANCHES, unpack_chart
+
+# 지장간 수 → (본기, 중기, 여기) 가중치 (합 10)
+HIDDEN_STEM_WEIGHTS = {1: (10,), 2: (7, 3), 3: (6, 3, 1)}
+
+# (연간, 연지, 월간, 월지, 일간, 일지, 시간, 시지) 위치 가중치 - 일간 자신은 제외
+POSITION_WEIGHTS = (1, 1, 1, 2, 0, 1, 1, 1)
+
+# 월령: (오행 - 월지 오행) % 5 → 상태, 상태 → 배수 (%)
+SEASON_STATES = ('旺', '相', '死', '囚', '休')
+SEASON_PERCENT = {'旺': 130, '相': 115, '休': 100, '囚': 85, '死': 70}
+
+# 일간 오행 기준 오행 그룹 (ELEMENT_ORDER 에서 일간 오행으로부터의 거리)
+GROUP_NAMES = ('比劫', '食傷', '財星', '官星', '印星')
+
+# 점수 구간 → 분류 (돕는 오행이 다섯 중 둘이므로 치우침 없는 사주가 40 안팎)
+CATEGORY_BOUNDS = (20, 35, 45, 60)
+CATEGORY_NAMES = ('극신약', '신약', '중화', '신강', '극신강')
+
+# 기여도 단위: 글자 10 × 배수 100 = 한 글자 1000
+CONTRIBUTION_UNIT = 1000
+STRENGTH_CACHE_SIZE = 1 << 16
+
+
+def _season_state(element: int, month_element: int) -> str:
+    """오행의 월령 상태 (월지 오행과 같으면 旺, 월지가 생하면 相, 월지를 생하면 休, 월지를 극하면 囚, 월지가 극하면 死)"""
+    return SEASON_STATES[(element - month_element) % 5]
+
+
+# 천간/지지 인덱스 → 오행별 기여 벡터 (ELEMENT_ORDER 순서, 합 10)
+STEM_VECTORS = tuple(tuple(10 * (STEM_ELEMENT[stem] == e) for e in range(5)) for stem in range(10))
+
+
+def _branch_vector(branch: int) -> Tuple[int, ...]:
+    vector = [0] * 5
+    stems = HIDDEN_STEMS[branch]
+    for stem, weight in zip(stems, HIDDEN_STEM_WEIGHTS[len(stems)]):
+        vector[STEM_ELEMENT[STEMS.index(stem)]] += weight
+    return tuple(vector)
+
+
+BRANCH_VECTORS = tuple(_branch_vector(branch) for branch in range(12))
+
+# 월지 인덱스 → 오행별 월령 배수 (%)
+MONTH_MULTIPLIERS = tuple(tuple(SEASON_PERCENT[_season_state(e, BRANCH_ELEMENT[branch])] for e in range(5))
+                          for branch in range(12))
+
+
+def category_of(score: float) -> str:
+    """점수 → 강약 분류"""
+    return CATEGORY_NAMES[bisect_right(CATEGORY_BOUNDS, score)]
+
+
+@lru_cache(maxsize=STRENGTH_CACHE_SIZE)
+def contributions(stems: Tuple[int, int, int, int], branches: Tuple[int, int, int, int]) -> Tuple[int, ...]:
+    """(연월일시 천간, 지지) 인덱스 → 오행별 기여도 (ELEMENT_ORDER 순서, CONTRIBUTION_UNIT 단위 정수)"""
+    totals = [0] * 5
+    for position in range(4):
+        stem_weight, branch_weight = POSITION_WEIGHTS[2 * position], POSITION_WEIGHTS[2 * position + 1]
+        stem_vector, branch_vector = STEM_VECTORS[stems[position]], BRANCH_VECTORS[branches[position]]
+        for e in range(5):
+            totals[e] += stem_weight * stem_vector[e] + branch_weight * branch_vector[e]
+    multipliers = MONTH_MULTIPLIERS[branches[1]]
+    return tuple(totals[e] * multipliers[e] for e in range(5))
+
+
+def score_of(values: Sequence[int], day_element: int) -> float:
+    """오행별 기여도 → 일간을 돕는 비율 (0~100)"""
+    support = values[day_element] + values[(day_element - 1) % 5]
+    return 100 * support / sum(values)
+
+
+def day_master_strength(stems: Tuple[int, int, int, int], branches: Tuple[int, int, int, int]) -> Dict:
+    """일간 강약 점수, 분류, 오행별/그룹별 기여도 (기여도는 한 글자 = 1.0)"""
+    values = contributions(stems, branches)
+    day_element = STEM_ELEMENT[stems[2]]
+    score = score_of(values, day_element)
+    return {
+        'score': round(score, 1),
+        'category': category_of(score),
+        'day_element': ELEMENT_ORDER[day_element],
+        'elements': {ELEMENT_ORDER[e]: values[e] / CONTRIBUTION_UNIT for e in range(5)},
+        'groups': {GROUP_NAMES[k]: values[(day_element + k) % 5] / CONTRIBUTION_UNIT for k in range(5)}
+    }
+
+
+def analyze_pillars(pillars: Sequence[str]) -> Optional[Dict]:
+    """간지 문자열 네 개 → day_master_strength 결과 (천간/지지가 아닌 글자가 있으면 None)"""
+    if len(pillars) != 4 or any(len(pillar) < 2 or pillar[0] not in STEMS or pillar[1] not in BRANCHES
+                                for pillar in pillars):
+        return None
+    return day_master_strength(tuple(STEMS.index(pillar[0]) for pillar in pillars),
+                               tuple(BRANCHES.index(pillar[1]) for pillar in pillars))
+
+
+def chart_strength(code: int) -> Dict:
+    """24비트 사주 코드 → day_master_strength 결과"""
+    pillars = unpack_chart(code)
+    return day_master_strength(tuple(index % 10 for index in pillars), tuple(index % 12 for index in pillars))
+
+
+class StrengthBatch(NamedTuple):
+    """배치 강약 결과 (행 = 사주)"""
+    scores: 'np.ndarray'          # float64 [N] 0~100
+    categories: 'np.ndarray'      # int8 [N] CATEGORY_NAMES 인덱스
+    contributions: 'np.ndarray'   # int32 [N, 5] 오행별 기여도 (ELEMENT_ORDER, CONTRIBUTION_UNIT 단위)
+    day_elements: 'np.ndarray'    # int8 [N] 일간 오행 인덱스
+
+
+def strength_batch(codes) -> StrengthBatch:
+    """사주 코드 배열(또는 코드 하나) → 배치 강약 (스칼라 day_master_strength 와 같은 정수 기여도)"""
+    import numpy as np
+
+    codes = np.atleast_1d(np.asarray(codes, dtype=np.int64))
+    pillars = np.stack(unpack_chart(codes), axis=1)
+    stems, branches = pillars % 10, pillars % 12
+
+    weights = np.array(POSITION_WEIGHTS, dtype=np.int32)
+    values = (np.array(STEM_VECTORS, dtype=np.int32)[stems] * weights[0::2, None]).sum(axis=1)
+    values += (np.array(BRANCH_VECTORS, dtype=np.int32)[branches] * weights[1::2, None]).sum(axis=1)
+    values *= np.array(MONTH_MULTIPLIERS, dtype=np.int32)[branches[:, 1]]
+
+    day_element = np.array(STEM_ELEMENT, dtype=np.int64)[stems[:, 2]]
+    rows = np.arange(len(codes))
+    support = values[rows, day_element] + values[rows, (day_element - 1) % 5]
+    scores = 100 * support / values.sum(axis=1)
+    categories = np.searchsorted(np.array(CATEGORY_BOUNDS), scores, side='right').astype(np.int8)
+    return StrengthBatch(scores, categories, values, day_element.astype(np.int8))
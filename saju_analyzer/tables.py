@@ -0,0 +1,337 @@
+# saju_analyzer/tables.py
+# 확장 분석 조회 테이블 (SajuAnalyzer 상수 → 천간/지지/오행 인덱스 테이블)
+#
+# analyze_extended_saju 의 지장간/십신/오행 생극/조후/형충파해/신강약을 문자열 dict 탐색과
+# generation_cycle.index() 반복 대신 작은 튜플 인덱싱으로 계산합니다.
+# 테이블은 SajuAnalyzer 상수와 기존 판정식(상생/상극 순환, 형충파해 목록)을 그대로 평가해 만들므로
+# 결과 dict 는 기존 문자열 구현과 같습니다 (benchmark_analyzer.py 가 전수/무작위 비교).
+# analyze_extended_batch 는 사주 코드 배열을 받아 같은 내용을 열(column) 배열로 계산합니다 (NumPy).
+
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from saju_analyzer.branches import interactions as branch_interactions
+from saju_analyzer.branches import interactions_batch
+from saju_analyzer.core import SajuAnalyzer
+from saju_engine.sexagenary import BRANCHES, STEMS, pillar_name, unpack_chart
+
+ELEMENT_ORDER = '木火土金水'        # 상생 순환 (generation_cycle)
+DESTRUCTION_ORDER = '木土水火金'    # 상극 순환 (destruction_cycle)
+
+PILLAR_NAMES = ('year', 'month', 'day', 'hour')
+TEN_GOD_KEYS = tuple(f'{pillar}_{part}' for pillar in PILLAR_NAMES for part in ('stem', 'branch'))
+TEN_GOD_NAMES = tuple(SajuAnalyzer.TEN_GODS_MAP['甲'].values())
+
+# 계절 → 조후 오행 (출생 월 기준)
+SEASON_NAMES = ('春', '夏', '秋', '冬')
+SEASON_MONTHS = {'春': (2, 3, 4), '夏': (5, 6, 7), '秋': (8, 9, 10), '冬': (11, 12, 1)}
+SEASON_NEEDS = {'春': ('火', '土'), '夏': ('水', '金'), '秋': ('火', '木'), '冬': ('火', '木')}
+
+# 천간/지지 글자 → 오행 이름, 천간/지지 인덱스 → 오행 이름, 오행 인덱스
+ELEMENT_NAMES = SajuAnalyzer.ELEMENTS
+STEM_ELEMENT_NAME = tuple(SajuAnalyzer.ELEMENTS[stem] for stem in STEMS)
+BRANCH_ELEMENT_NAME = tuple(SajuAnalyzer.ELEMENTS[branch] for branch in BRANCHES)
+STEM_ELEMENT = tuple(ELEMENT_ORDER.index(name) for name in STEM_ELEMENT_NAME)
+BRANCH_ELEMENT = tuple(ELEMENT_ORDER.index(name) for name in BRANCH_ELEMENT_NAME)
+
+# 지지 인덱스 → 지장간 목록 (SajuAnalyzer.HIDDEN_STEMS 의 리스트를 그대로 공유)
+HIDDEN_STEMS = tuple(SajuAnalyzer.HIDDEN_STEMS[branch] for branch in BRANCHES)
+
+# [일간][천간] / [일간][지지] → 십신 (지지는 본기 = 지장간 첫 글자 기준)
+TEN_GOD_STEM = tuple(tuple(SajuAnalyzer.TEN_GODS_MAP[day][stem] for stem in STEMS) for day in STEMS)
+TEN_GOD_BRANCH = tuple(tuple(SajuAnalyzer.TEN_GODS_MAP[day][SajuAnalyzer.HIDDEN_STEMS[branch][0]]
+                             for branch in BRANCHES) for day in STEMS)
+
+
+def _pair_relation(first: str, second: str, cycle: str, symbol: str) -> Optional[str]:
+    """두 오행의 순환 관계 문자열 (예: 木生火), 없으면 None"""
+    if (cycle.index(first) + 1) % 5 == cycle.index(second):
+        return f"{first}{symbol}{second}"
+    if (cycle.index(second) + 1) % 5 == cycle.index(first):
+        return f"{second}{symbol}{first}"
+    return None
+
+
+# (오행, 오행) → '木生火' / '木克土' / None (기존 쌍별 문자열 목록 생성용)
+GENERATION = {(a, b): _pair_relation(a, b, ELEMENT_ORDER, '生') for a in ELEMENT_ORDER for b in ELEMENT_ORDER}
+DESTRUCTION = {(a, b): _pair_relation(a, b, DESTRUCTION_ORDER, '克') for a in ELEMENT_ORDER for b in ELEMENT_ORDER}
+
+# 5×5 상생/상극 행렬 [행 → 열] (ELEMENT_ORDER 순서, 예: 木→火 상생, 木→土 상극)
+GENERATION_MATRIX = tuple(tuple(int(GENERATION[a, b] == f"{a}生{b}") for b in ELEMENT_ORDER) for a in ELEMENT_ORDER)
+DESTRUCTION_MATRIX = tuple(tuple(int(DESTRUCTION[a, b] == f"{a}克{b}") for b in ELEMENT_ORDER) for a in ELEMENT_ORDER)
+
+# 행렬의 방향 간선 (행, 열, 이름)
+GENERATION_EDGES = tuple((a, b, f"{ELEMENT_ORDER[a]}生{ELEMENT_ORDER[b]}")
+                         for a in range(5) for b in range(5) if GENERATION_MATRIX[a][b])
+DESTRUCTION_EDGES = tuple((a, b, f"{ELEMENT_ORDER[a]}克{ELEMENT_ORDER[b]}")
+                          for a in range(5) for b in range(5) if DESTRUCTION_MATRIX[a][b])
+
+# 출생 월(1~12) → (계절, 조후 오행)
+SEASON_BY_MONTH = {month: (season, SEASON_NEEDS[season])
+                   for season, months in SEASON_MONTHS.items() for month in months}
+
+# 일간 오행 → 일간을 돕는 오행 (비겁, 인성)
+SUPPORT_ELEMENTS = tuple((ELEMENT_ORDER[e], ELEMENT_ORDER[(e - 1) % 5]) for e in range(5))
+
+# 형충파해 규칙: (종류, 지지 묶음, 지지 비트마스크)
+CONFLICT_RULES = tuple(
+    (kind, group, sum(1 << BRANCHES.index(branch) for branch in set(group)))
+    for kind, groups in SajuAnalyzer.CONFLICTS.items() for group in groups
+)
+
+
+# 간지 문자열 → 육십갑자 인덱스, 인덱스 → 지지 인덱스, (천간 오행 × 5 + 지지 오행)
+PILLAR_INDEX = {pillar_name(index): index for index in range(60)}
+PILLAR_BRANCH = tuple(index % 12 for index in range(60))
+PILLAR_ELEMENTS = tuple(STEM_ELEMENT[index % 10] * 5 + BRANCH_ELEMENT[index % 12] for index in range(60))
+
+ELEMENT_CACHE_SIZE = 1 << 17    # 실제 사주(월간·시간이 맞는 조합)의 오행 코드는 131,250 가지
+
+
+@lru_cache(maxsize=None)
+def conflict_matches(branches: Tuple[int, int, int, int]) -> Tuple[Tuple[str, Tuple[str, ...], Tuple[int, ...]], ...]:
+    """(연, 월, 일, 시) 지지 인덱스 → 성립하는 형충파해 (종류, 지지, 위치) - 지지 조합별 1회 계산"""
+    mask = 0
+    for branch in branches:
+        mask |= 1 << branch
+
+    matches = []
+    for kind, group, group_mask in CONFLICT_RULES:
+        found = mask & group_mask
+        if len(group) == 2:
+            # 두 글자가 모두 있어야 성립 (午午 같은 자형은 한 글자로도 성립 - 기존 판정과 동일)
+            if found != group_mask:
+                continue
+            names = group
+        else:
+            # 삼형은 세 글자 중 두 글자 이상
+            if bin(found).count('1') < 2:
+                continue
+            names = tuple(name for name in group if found >> BRANCHES.index(name) & 1)
+        positions = tuple(i for i, branch in enumerate(branches) if found >> branch & 1)
+        matches.append((kind, names, positions))
+    return tuple(matches)
+
+
+@lru_cache(maxsize=None)
+def branch_fields(branches: Tuple[int, int, int, int]) -> Tuple[Dict[str, list], Tuple, List[Dict]]:
+    """지지 조합 → (지지장간 dict, 형충파해, 지지 관계) - 12⁴ 가지 조합별 1회 계산"""
+    hidden_stems = {BRANCHES[branch]: HIDDEN_STEMS[branch] for branch in branches}
+    return hidden_stems, conflict_matches(branches), branch_interactions(branches)
+
+
+class ElementRelations(dict):
+    """오행 생극 관계 (오행 개수 벡터 × 5×5 상생/상극 행렬)
+
+    dict 내용은 element_count(처음 나온 순서의 오행 개수)와 generation_flow / destruction_flow
+    ({'木生火': 가중치, ...}, 가중치 = 두 오행 개수의 곱 = 해당 방향의 글자 쌍 수) 입니다.
+    글자 수가 늘어도(원국 + 대운 + 세운) 크기가 일정하며, 기존 형식의 쌍별 문자열 목록은
+    generation / destruction 속성으로 처음 접근할 때 생성합니다.
+    """
+
+    __slots__ = ('elements', '_pair_lists')
+
+    def __init__(self, elements: Sequence[str]):
+        self.elements = tuple(elements)
+        self._pair_lists = None
+
+        element_count = {}
+        for element in self.elements:
+            element_count[element] = element_count.get(element, 0) + 1
+        counts = [element_count.get(element, 0) for element in ELEMENT_ORDER]
+
+        super().__init__(
+            element_count=element_count,
+            generation_flow={name: counts[a] * counts[b] for a, b, name in GENERATION_EDGES if counts[a] * counts[b]},
+            destruction_flow={name: counts[a] * counts[b] for a, b, name in DESTRUCTION_EDGES if counts[a] * counts[b]}
+        )
+
+    @property
+    def generation(self) -> List[str]:
+        """글자 쌍마다의 상생 문자열 목록 (기존 형식)"""
+        return self._legacy_lists()[0]
+
+    @property
+    def destruction(self) -> List[str]:
+        """글자 쌍마다의 상극 문자열 목록 (기존 형식)"""
+        return self._legacy_lists()[1]
+
+    def legacy_dict(self) -> Dict:
+        """기존 _analyze_element_relations 형식 {'generation', 'destruction', 'element_count'}"""
+        generation, destruction = self._legacy_lists()
+        return {'generation': generation, 'destruction': destruction, 'element_count': dict(self['element_count'])}
+
+    def _legacy_lists(self) -> Tuple[List[str], List[str]]:
+        if self._pair_lists is None:
+            pairs = list(combinations(self.elements, 2))
+            self._pair_lists = (list(filter(None, map(GENERATION.__getitem__, pairs))),
+                                list(filter(None, map(DESTRUCTION.__getitem__, pairs))))
+        return self._pair_lists
+
+
+def element_relations(characters: Iterable[str]) -> ElementRelations:
+    """천간/지지 글자들 → ElementRelations (오행이 없는 글자는 무시)"""
+    return ElementRelations([ELEMENT_NAMES[c] for c in characters if c in ELEMENT_NAMES])
+
+
+@lru_cache(maxsize=ELEMENT_CACHE_SIZE)
+def element_fields(key: int) -> Tuple[ElementRelations, str, Dict[int, int]]:
+    """네 기둥의 오행 코드(PILLAR_ELEMENTS 를 5² 진법으로 이은 값)
+    → (오행 생극 관계, 신강/신약, 출생 월별 조후 점수)"""
+    codes = (key // 15625, key // 625 % 25, key // 25 % 25, key % 25)
+    relations = ElementRelations([ELEMENT_ORDER[part] for code in codes for part in divmod(code, 5)])
+    element_count = relations['element_count']
+
+    # 신강/신약: 일간(일주 천간) 오행의 비겁 + 인성 ≥ 나머지 오행
+    same, helping = SUPPORT_ELEMENTS[codes[2] // 5]
+    support = element_count.get(same, 0) + element_count.get(helping, 0)
+    strength = "신강" if support >= len(relations.elements) - support else "신약"
+
+    balance_scores = {month: sum(element_count.get(element, 0) for element in needed)
+                      for month, (_, needed) in SEASON_BY_MONTH.items()}
+    return relations, strength, balance_scores
+
+
+def extended_fields(pillars: Tuple[int, int, int, int], birth_month: int) -> Dict:
+    """네 기둥의 육십갑자 인덱스 + 출생 월 → ExtendedSajuData 필드 (basic_data 제외)"""
+    year, month, day, hour = pillars
+    branches = (PILLAR_BRANCH[year], PILLAR_BRANCH[month], PILLAR_BRANCH[day], PILLAR_BRANCH[hour])
+    hidden_stems, conflicts, interactions = branch_fields(branches)
+    relations, strength, balance_scores = element_fields(
+        PILLAR_ELEMENTS[year] * 15625 + PILLAR_ELEMENTS[month] * 625 + PILLAR_ELEMENTS[day] * 25 + PILLAR_ELEMENTS[hour]
+    )
+
+    # 십신 (지지는 본기 기준)
+    stem_gods, branch_gods = TEN_GOD_STEM[day % 10], TEN_GOD_BRANCH[day % 10]
+    ten_gods = {
+        'year_stem': stem_gods[year % 10], 'year_branch': branch_gods[branches[0]],
+        'month_stem': stem_gods[month % 10], 'month_branch': branch_gods[branches[1]],
+        'day_stem': stem_gods[day % 10], 'day_branch': branch_gods[branches[2]],
+        'hour_stem': stem_gods[hour % 10], 'hour_branch': branch_gods[branches[3]]
+    }
+
+    # 조후
+    season, needed = SEASON_BY_MONTH.get(birth_month, (None, ()))
+    balance_score = balance_scores.get(birth_month, 0)
+
+    # 지지장간/형충파해는 호출마다 새 dict/list 로, 오행 관계는 같은 오행 구성끼리 공유 (수정 금지)
+    return {
+        'hidden_stems': dict(hidden_stems),
+        'ten_gods': ten_gods,
+        'element_relations': relations,
+        'seasonal_balance': {
+            'season': season,
+            'needed_elements': list(needed),
+            'current_elements': dict(relations['element_count']),
+            'balance_score': balance_score,
+            'balance_level': 'good' if balance_score >= 2 else 'needs_improvement'
+        },
+        'conflicts': [{'type': kind, 'branches': list(names), 'positions': list(positions)}
+                      for kind, names, positions in conflicts],
+        'branch_interactions': [dict(item, branches=list(item['branches']), positions=list(item['positions']))
+                                for item in interactions],
+        'day_master_strength': strength,
+        'day_master_score': strength_model.day_master_strength(
+            (year % 10, month % 10, day % 10, hour % 10), branches)
+    }
+
+
+class ExtendedBatch(NamedTuple):
+    """analyze_extended_batch 결과 (행 = 사주)"""
+    codes: 'np.ndarray'               # int64 [N] 사주 코드
+    birth_months: 'np.ndarray'        # int64 [N] 출생 월
+    ten_gods: 'np.ndarray'            # int8 [N, 8] TEN_GOD_NAMES 인덱스 (TEN_GOD_KEYS 순서)
+    elements: 'np.ndarray'            # int8 [N, 8] 오행 인덱스 (연간, 연지, 월간, 월지, ...)
+    element_counts: 'np.ndarray'      # int8 [N, 5] 오행 개수 (ELEMENT_ORDER)
+    generation_flow: 'np.ndarray'     # int8 [N, 5] 상생 가중치 (열 a = ELEMENT_ORDER[a] 가 생하는 방향)
+    destruction_flow: 'np.ndarray'    # int8 [N, 5] 상극 가중치 (열 a = ELEMENT_ORDER[a] 가 극하는 방향)
+    seasons: 'np.ndarray'             # int8 [N] SEASON_NAMES 인덱스 (-1 = 없음)
+    balance_scores: 'np.ndarray'      # int8 [N]
+    conflicts: 'np.ndarray'           # uint32 [N] CONFLICT_RULES 비트마스크
+    interactions: 'np.ndarray'        # uint64 [N] 지지 관계 비트 (branches.RELATIONS, branches.describe 로 해석)
+    strong: 'np.ndarray'              # bool [N] 신강 여부
+    strength_scores: 'np.ndarray'     # float64 [N] 지장간·월령 가중 강약 점수 (strength.strength_batch)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def to_dict(self, i: int, basic_data: Optional[Dict] = None) -> Dict:
+        """i 번째 행 → ExtendedSajuData.to_dict() 와 같은 dict"""
+        fields = extended_fields(unpack_chart(int(self.codes[i])), int(self.birth_months[i]))
+        return {'basic_data': basic_data, **fields}
+
+
+def _batch_tables():
+    """NumPy 조회 배열 (첫 배치 호출 때 1회 생성)"""
+    import numpy as np
+
+    tables = {
+        'stem_element': np.array(STEM_ELEMENT, dtype=np.int8),
+        'branch_element': np.array(BRANCH_ELEMENT, dtype=np.int8),
+        'ten_god_stem': np.array([[TEN_GOD_NAMES.index(name) for name in row] for row in TEN_GOD_STEM], dtype=np.int8),
+        'ten_god_branch': np.array([[TEN_GOD_NAMES.index(name) for name in row] for row in TEN_GOD_BRANCH],
+                                   dtype=np.int8),
+        'season_by_month': np.array([SEASON_NAMES.index(SEASON_BY_MONTH[m][0]) if m in SEASON_BY_MONTH else -1
+                                     for m in range(13)], dtype=np.int8),
+        'season_needs': np.array([[element in SEASON_NEEDS[season] for element in ELEMENT_ORDER]
+                                  for season in SEASON_NAMES] + [[False] * 5], dtype=np.int8),
+        'popcount': np.array([bin(mask).count('1') for mask in range(1 << 12)], dtype=np.int8)
+    }
+    return tables
+
+
+_tables = None
+
+
+def analyze_extended_batch(codes, birth_months) -> ExtendedBatch:
+    """사주 코드 배열 + 출생 월 배열 → ExtendedBatch (열 단위 확장 분석)"""
+    global _tables
+    import numpy as np
+
+    if _tables is None:
+        _tables = _batch_tables()
+    t = _tables
+
+    codes = np.atleast_1d(np.asarray(codes, dtype=np.int64))
+    birth_months = np.broadcast_to(np.asarray(birth_months, dtype=np.int64), codes.shape)
+    pillars = np.stack(unpack_chart(codes), axis=1)
+    stems, branches = pillars % 10, pillars % 12
+    day_stem = stems[:, 2:3]
+
+    # 천간/지지를 번갈아 (연간, 연지, 월간, ...) 순서로
+    ten_gods = np.empty((len(codes), 8), dtype=np.int8)
+    ten_gods[:, 0::2] = t['ten_god_stem'][day_stem, stems]
+    ten_gods[:, 1::2] = t['ten_god_branch'][day_stem, branches]
+    elements = np.empty((len(codes), 8), dtype=np.int8)
+    elements[:, 0::2] = t['stem_element'][stems]
+    elements[:, 1::2] = t['branch_element'][branches]
+    counts = (elements[:, :, None] == np.arange(5, dtype=np.int8)).sum(axis=1).astype(np.int8)
+
+    # 방향별 가중치 = 개수[a] × (개수 @ 행렬)[a] (행렬의 각 행에는 대상 오행이 하나)
+    wide = counts.astype(np.int16)
+    generation = (wide * (wide @ np.array(GENERATION_MATRIX, dtype=np.int16).T)).astype(np.int8)
+    destruction = (wide * (wide @ np.array(DESTRUCTION_MATRIX, dtype=np.int16).T)).astype(np.int8)
+
+    valid_month = (birth_months >= 0) & (birth_months <= 12)
+    seasons = np.where(valid_month, t['season_by_month'][np.clip(birth_months, 0, 12)], -1).astype(np.int8)
+    balance = (t['season_needs'][seasons] * counts).sum(axis=1).astype(np.int8)
+
+    mask = np.bitwise_or.reduce(np.left_shift(1, branches), axis=1)
+    conflicts = np.zeros(len(codes), dtype=np.uint32)
+    for bit, (_, group, group_mask) in enumerate(CONFLICT_RULES):
+        found = mask & group_mask
+        matched = (found == group_mask) if len(group) == 2 else (t['popcount'][found] >= 2)
+        conflicts |= matched.astype(np.uint32) << np.uint32(bit)
+
+    day_element = t['stem_element'][stems[:, 2]].astype(np.int64)
+    rows = np.arange(len(codes))
+    support = wide[rows, day_element] + wide[rows, (day_element - 1) % 5]
+
+    return ExtendedBatch(codes, birth_months, ten_gods, elements, counts, generation, destruction,
+                         seasons, balance, conflicts, interactions_batch(branches), support >= 8 - support,
+                         strength_model.strength_batch(codes).scores)
+
+
+# strength 모델은 이 모듈의 테이블로 만들어지므로 마지막에 import
+from saju_analyzer import strength as strength_model  # noqa: E402
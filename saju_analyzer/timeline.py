@@ -0,0 +1,260 @@
+# saju_analyzer/timeline.py
+# 원국 대 운(대운/세운/월운) 상호작용 타임라인
+#
+# scan_interactions(chart, start_year, end_year) 는 기간 안의 대운, 세운(과 선택적으로 월운) 간지를
+# 원국과 대조해 지지 합/충/형/파/해 (saju_analyzer.branches), 천간합/천간충, 운 간지의 십신을 구합니다.
+#   - 세운 간지는 (연도 - 4) % 60 산술로, 월운은 만세력 테이블(calendar_table) 월주 평면에서
+#     NumPy 로 절입일(월주가 바뀌는 날)을 한 번에 찾습니다. 테이블 범위 밖 연도(또는 테이블이 없을 때)만
+#     양력 월 기준 산술 간지를 쓰고 start_date 는 None 입니다.
+#   - 관계 조회는 (원국 지지 4개 + 운 지지) 조합별로 캐시되므로 100년 스캔도 수백 번의 dict 조회입니다.
+# 운 지지가 참여하고 원국 지지가 하나 이상 낀 관계만 보고합니다 (대운과 세운끼리만의 관계는 제외).
+# 세운은 그해 대운, 월운은 그해 대운·세운과 함께 보므로 삼합/방합/삼형이 운을 거쳐 완성되는 경우도 잡힙니다.
+# 속도: 연 단위(monthly=False) 100년 스캔은 1ms 안팎이라 API/워크플로우에서 바로 호출합니다.
+#       월운을 포함하면 100년에 1,200개월 항목을 만들어 20ms 안팎이므로 API 는 스레드 풀에서 실행합니다.
+
+from bisect import bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from saju_analyzer.branches import (
+    RELATIONS_BY_BRANCH,
+    BranchRelation,
+    branch_masks,
+    describe,
+    duplicate_relations,
+    mask_relations,
+)
+from saju_analyzer.chart import SajuChart
+from saju_analyzer.core import SajuData
+from saju_analyzer.tables import STEMS, TEN_GOD_BRANCH, TEN_GOD_STEM
+from saju_engine.calendar_table import get_calendar_table
+from saju_engine.sexagenary import BRANCHES, month_stem_for, pillar_name, sexagenary_index
+
+NATAL_STEM_LABELS = ('년간', '월간', '일간', '시간')
+NATAL_BRANCH_LABELS = ('년지', '월지', '일지', '시지')
+
+# 천간합 (합화 오행)과 천간충
+STEM_COMBINATIONS = (('甲', '己', '土'), ('乙', '庚', '金'), ('丙', '辛', '水'), ('丁', '壬', '木'), ('戊', '癸', '火'))
+STEM_CLASHES = (('甲', '庚'), ('乙', '辛'), ('丙', '壬'), ('丁', '癸'))
+
+TIME_RELATION_CACHE_SIZE = 1 << 16
+DEFAULT_SCAN_YEARS = 100
+MAX_SCAN_YEARS = 150          # 한 번에 스캔할 수 있는 최대 연수 (월운 포함 시 1,800건 남짓)
+
+
+def _stem_relations() -> Dict[Tuple[int, int], Tuple[str, str, Optional[str]]]:
+    """(천간, 천간) → (종류, 이름, 합화 오행)"""
+    relations = {}
+    for a, b, element in STEM_COMBINATIONS:
+        relations[STEMS.index(a), STEMS.index(b)] = relations[STEMS.index(b), STEMS.index(a)] = \
+            ('天干合', f'{a}{b}合', element)
+    for a, b in STEM_CLASHES:
+        relations[STEMS.index(a), STEMS.index(b)] = relations[STEMS.index(b), STEMS.index(a)] = \
+            ('天干沖', f'{a}{b}沖', None)
+    return relations
+
+
+STEM_RELATIONS = _stem_relations()
+
+
+@lru_cache(maxsize=TIME_RELATION_CACHE_SIZE)
+def time_relations(group: Tuple[int, ...]) -> Tuple[Tuple[BranchRelation, Tuple[int, ...]], ...]:
+    """지지 목록 (원국 4개 + 운 지지들) → 마지막 지지가 참여하고 원국 지지가 낀 관계와 나머지 위치"""
+    mask, duplicates, positions = branch_masks(group)
+    bits = (mask_relations(mask) | duplicate_relations(duplicates)) & RELATIONS_BY_BRANCH[group[-1]]
+    last = len(group) - 1
+
+    found = []
+    for relation in describe(bits):
+        where = 0
+        for branch in set(relation.branches):
+            where |= positions[BRANCHES.index(branch)]
+        if where & 0b1111:
+            found.append((relation, tuple(i for i in range(last) if where >> i & 1)))
+    return tuple(found)
+
+
+def _events(natal_stems: Sequence[int], natal_branches: Tuple[int, ...], index: int,
+            context: Tuple[int, ...], labels: Tuple[str, ...]) -> List[Dict]:
+    """운 간지 하나의 원국 대비 관계 목록 (context: 함께 보는 상위 운의 지지, labels: 그 이름)"""
+    stem = index % 10
+    result = []
+    stem_events = {}
+    for position, natal_stem in enumerate(natal_stems):
+        relation = STEM_RELATIONS.get((stem, natal_stem))
+        if relation is None:
+            continue
+        kind, name, element = relation
+        if name in stem_events:
+            stem_events[name]['with'].append(NATAL_STEM_LABELS[position])
+        else:
+            stem_events[name] = {'type': kind, 'name': name, 'element': element,
+                                 'with': [NATAL_STEM_LABELS[position]]}
+            result.append(stem_events[name])
+
+    names = NATAL_BRANCH_LABELS + labels
+    for relation, positions in time_relations(natal_branches + context + (index % 12,)):
+        result.append({'type': relation.type, 'name': relation.name, 'element': relation.element,
+                       'with': [names[i] for i in positions]})
+    return result
+
+
+def _ten_gods(day_stem: int, index: int) -> List[str]:
+    """운 간지의 [천간 십신, 지지(본기) 십신]"""
+    return [TEN_GOD_STEM[day_stem][index % 10], TEN_GOD_BRANCH[day_stem][index % 12]]
+
+
+def _as_chart(chart: Union[SajuChart, SajuData, Dict]) -> SajuChart:
+    if isinstance(chart, SajuChart):
+        return chart
+    if isinstance(chart, SajuData):
+        return SajuChart.from_saju_data(chart)
+    return SajuChart.from_dict(chart)
+
+
+def _luck_periods(great_luck: Optional[Dict]) -> List[Tuple[int, int, Dict]]:
+    """대운 목록 → (시작 연도, 육십갑자 인덱스, 대운 dict), 시작 연도 순"""
+    periods = []
+    for period in (great_luck or {}).get('pillars', []):
+        pillar = period['pillar']
+        index = sexagenary_index(STEMS.index(pillar[0]), BRANCHES.index(pillar[1]))
+        periods.append((int(period['start_date'][:4]), index, period))
+    return periods
+
+
+def _table_month_pillars(table, first_year: int, last_year: int) -> List[Tuple[Optional[str], int, int, int]]:
+    """만세력 테이블 평면에서 월주가 바뀌는 날 (첫 항목은 1월 1일 시점의 월운)"""
+    import numpy as np
+
+    view = table.pillars_for_range(date(first_year, 1, 1), date(last_year, 12, 31))
+    months = np.frombuffer(view.month, dtype=np.uint8)
+    starts = np.concatenate(([0], np.flatnonzero(months[1:] != months[:-1]) + 1))
+    years = np.frombuffer(view.year, dtype=np.uint8)[starts]
+    result = []
+    for offset, month, year in zip(starts.tolist(), months[starts].tolist(), years.tolist()):
+        day = view.start + timedelta(days=offset)
+        result.append((day.isoformat(), day.year, month, year))
+    return result
+
+
+def _arithmetic_month_pillars(first_year: int, last_year: int) -> List[Tuple[Optional[str], int, int, int]]:
+    """양력 월 기준 산술 월운 (시작일 None)"""
+    pillars = []
+    for year in range(first_year, last_year + 1):
+        for month in range(1, 13):
+            # 양력 1월은 전년도 丑월, 2월부터 寅월 (절입일 이전 며칠은 무시)
+            saju_year = year - 1 if month == 1 else year
+            branch = month % 12
+            year_index = (saju_year - 4) % 60
+            pillars.append((None, year, sexagenary_index(month_stem_for(year_index % 10, branch), branch), year_index))
+    return pillars
+
+
+def _month_pillars(start_year: int, end_year: int) -> List[Tuple[Optional[str], int, int, int]]:
+    """기간 안의 월운 (시작일, 양력 연도, 월주 인덱스, 연주 인덱스)
+
+    만세력 테이블이 한 해 전체를 담고 있는 연도는 테이블 절입일 기준, 그 밖의 연도만 양력 월 산술입니다.
+    """
+    table = get_calendar_table()
+    if table is None:
+        return _arithmetic_month_pillars(start_year, end_year)
+
+    # 테이블이 1월 1일 ~ 12월 31일을 모두 담는 연도 구간
+    table_first = table.first_date.year + (table.first_date > date(table.first_date.year, 1, 1))
+    table_last = table.last_date.year - (table.last_date < date(table.last_date.year, 12, 31))
+    first, last = max(start_year, table_first), min(end_year, table_last)
+    if first > last:
+        return _arithmetic_month_pillars(start_year, end_year)
+
+    pillars = _arithmetic_month_pillars(start_year, first - 1)
+    for entry in _table_month_pillars(table, first, last):
+        # 산술 구간의 12월(子월)이 테이블 1월 1일 시점 월운과 같으면 이어지는 한 달
+        if pillars and pillars[-1][2:] == entry[2:]:
+            continue
+        pillars.append(entry)
+    pillars.extend(_arithmetic_month_pillars(last + 1, end_year))
+    return pillars
+
+
+def scan_interactions(chart: Union[SajuChart, SajuData, Dict], start_year: Optional[int] = None,
+                      end_year: Optional[int] = None, monthly: bool = False) -> Dict:
+    """원국 대비 대운/세운(/월운) 상호작용 타임라인
+
+    chart: SajuChart, SajuData 또는 calculate_solar_saju 결과 dict (대운은 great_luck 사용)
+    start_year/end_year: 양력 연도 (기본: 출생 연도부터 100년, 최대 MAX_SCAN_YEARS 년)
+    monthly: 월운까지 포함 (만세력 테이블 범위 안의 연도는 절입일 기준, 100년이면 연 단위보다 20배 가량 느림)
+    """
+    chart = _as_chart(chart)
+    if start_year is None:
+        birth = (chart.birth_info or {}).get('original_time') or ''
+        start_year = int(birth[:4]) if birth[:4].isdigit() else date.today().year
+    if end_year is None:
+        end_year = start_year + DEFAULT_SCAN_YEARS - 1
+    if end_year < start_year:
+        raise ValueError(f"종료 연도가 시작 연도보다 앞입니다: {start_year} ~ {end_year}")
+    if end_year - start_year + 1 > MAX_SCAN_YEARS:
+        raise ValueError(f"스캔 기간은 최대 {MAX_SCAN_YEARS}년입니다: {start_year} ~ {end_year}")
+
+    natal_stems, natal_branches = chart.stems, chart.branches
+    day_stem = chart.day_stem
+    periods = _luck_periods(chart.great_luck)
+    period_years = [start for start, _, _ in periods]
+
+    def luck_at(year):
+        """그해 대운 (첫 대운 시작 전이면 None)"""
+        k = bisect_right(period_years, year) - 1
+        return periods[k] if k >= 0 else None
+
+    great_luck = []
+    for k, (start, index, period) in enumerate(periods):
+        end = periods[k + 1][0] - 1 if k + 1 < len(periods) else start + 9
+        if end < start_year or start > end_year:
+            continue
+        great_luck.append({
+            'order': period.get('order', k + 1),
+            'pillar': period['pillar'],
+            'start_year': start,
+            'end_year': end,
+            'ten_gods': _ten_gods(day_stem, index),
+            'events': _events(natal_stems, natal_branches, index, (), ('대운',))
+        })
+
+    years = []
+    for year in range(start_year, end_year + 1):
+        index = (year - 4) % 60
+        luck = luck_at(year)
+        context, labels = ((luck[1] % 12,), ('대운', '세운')) if luck else ((), ('세운',))
+        years.append({
+            'year': year,
+            'pillar': pillar_name(index),
+            'luck_pillar': luck[2]['pillar'] if luck else None,
+            'ten_gods': _ten_gods(day_stem, index),
+            'events': _events(natal_stems, natal_branches, index, context, labels)
+        })
+
+    result = {
+        'natal': list(chart.pillar_names),
+        'start_year': start_year,
+        'end_year': end_year,
+        'great_luck': great_luck,
+        'years': years
+    }
+
+    if monthly:
+        months = []
+        for start_date, year, index, year_index in _month_pillars(start_year, end_year):
+            luck = luck_at(year)
+            context = ((luck[1] % 12,) if luck else ()) + (year_index % 12,)
+            labels = (('대운',) if luck else ()) + ('세운', '월운')
+            months.append({
+                'year': year,
+                'start_date': start_date,
+                'pillar': pillar_name(index),
+                'year_pillar': pillar_name(year_index),
+                'ten_gods': _ten_gods(day_stem, index),
+                'events': _events(natal_stems, natal_branches, index, context, labels)
+            })
+        result['months'] = months
+
+    return result
@@ -3,12 +3,70 @@
 # MODIFIED [2024-12-19]: KASI API 음력→양력 변환 기능 추가
 # MODIFIED [2024-12-19]: 써머타임 및 절입조정 기능 추가
 # MODIFIED [2024-12-19]: KASI 24절기 API 추가 - 정확한 절기 시간 계산
+# MODIFIED [2026-10-18]: NumPy 배치 계산 진입점 추가 (calculate_solar_saju_batch)
+# MODIFIED [2026-10-18]: 오프라인 24절기 테이블 기반 월주/연주 계산 (분 단위 절입 시각)
+# MODIFIED [2026-10-18]: 오프라인 음력↔양력 변환 테이블 사용 (KASI API는 검증/범위 밖 용도)
+# MODIFIED [2026-10-18]: KASI 응답 캐시를 메모리 LRU + SQLite 영속 캐시로 교체
+# MODIFIED [2026-10-18]: KASI 공용 연결 풀 클라이언트 (재시도/동시 요청 제한, 24절기 연 단위 조회)
+# MODIFIED [2026-10-18]: API 서버용 비동기 음력 변환/24절기 조회 추가 (aiohttp, 동일 요청 병합)
+# MODIFIED [2026-10-18]: 계산 경로의 print 를 구조화 이벤트 로깅으로 교체 (CLI 는 콘솔 렌더러로 출력)
+# MODIFIED [2026-10-18]: 써머타임/절입조정을 컴파일된 시간 조정 규칙 엔진(saju_engine.time_rules)으로 교체
+# MODIFIED [2026-10-18]: 주요 도시 외 출생지는 오프라인 지명 사전(saju_engine.gazetteer)에서 경도 조회
+# MODIFIED [2026-10-18]: 사주 원국 계산 결과를 조정된 출생 분 + 성별 키로 메모이제이션 (saju_engine.chart_cache)
+# MODIFIED [2026-10-18]: 구간 열거 제너레이터 iter_charts 추가 (분/시/일 간격, NumPy 배열 묶음)
+# MODIFIED [2026-10-18]: 사주 역색인으로 같은 사주가 나오는 출생 시각 구간 조회 (find_same_saju_times)
+# MODIFIED [2026-10-18]: 대운수를 절입 시각까지의 거리로 계산하고 10년 단위 대운 간지 추가 (saju_engine.luck)
+# MODIFIED [2026-10-18]: requests/ElementTree/prettytable/KASI 클라이언트를 사용 시점에 import (PEP 562 지연 속성)
+# MODIFIED [2026-10-18]: find_same_saju_times 의 limit 은 1 이상만 허용 (음수 슬라이스로 결과가 잘리던 문제)
+# MODIFIED [2026-10-18]: 알 수 없는/해외 출생지 경고는 출생지별로 한 번만 출력 (대량 계산 시 로그 폭주 방지)
 # pip install prettytable requests
 
-import requests
-import xml.etree.ElementTree as ET
+import importlib
+import os
 from datetime import datetime, timedelta
-from prettytable import PrettyTable
+from functools import lru_cache
+
+from saju_engine import events
+from saju_engine.chart_cache import ChartCache, get_chart_cache
+from saju_engine.gazetteer import KST_COUNTRIES, get_gazetteer
+from saju_engine.kasi_cache import get_kasi_cache
+from saju_engine.luck import great_luck_timeline
+from saju_engine.lunar_table import get_lunar_table
+from saju_engine.reverse_index import get_reverse_index
+from saju_engine.sexagenary import pillar_index
+from saju_engine.solar_terms import datetime_to_minute, get_solar_term_table
+from saju_engine.time_rules import SOLAR_TERM_ADJUSTMENT_PERIODS, SUMMERTIME_PERIODS, TIME_RULES
+
+log = events.get_logger("calculator")
+
+# 무거운 의존성(HTTP 클라이언트, XML 파서, 표 출력)은 KASI 조회/결과 출력 시에만 필요하므로 지연 import
+# 이름 → (모듈, 속성) - 속성이 None 이면 모듈 자체
+_LAZY_ATTRIBUTES = {
+    'requests': ('requests', None),
+    'ET': ('xml.etree.ElementTree', None),
+    'PrettyTable': ('prettytable', 'PrettyTable'),
+    'LUNAR_TO_SOLAR_URL': ('saju_engine.kasi_client', 'LUNAR_TO_SOLAR_URL'),
+    'division_cache_key': ('saju_engine.kasi_client', 'division_cache_key'),
+    'get_kasi_client': ('saju_engine.kasi_client', 'get_kasi_client'),
+    'lunar_cache_key': ('saju_engine.kasi_client', 'lunar_cache_key'),
+    'lunar_to_solar_params': ('saju_engine.kasi_client', 'lunar_to_solar_params'),
+}
+
+
+def __getattr__(name):
+    """PEP 562 지연 속성 (saju_calculator.requests 등 기존 접근 호환)"""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 # 천간지 및 오행 상수
 STEMS = '甲乙丙丁戊己庚辛壬癸'
@@ -20,27 +78,8 @@ ELEMENT = {
     '巳':'火','午':'火','未':'土','申':'金','酉':'金','戌':'土','亥':'水'
 }
 
-# 써머타임 실시 기간 (한국천문연구원 만세력 기준)
-SUMMERTIME_PERIODS = [
-    ("1948-06-01 00:00", "1948-09-13 00:00"),
-    ("1949-04-03 00:00", "1949-09-11 00:00"),
-    ("1950-04-01 00:00", "1950-09-10 00:00"),
-    ("1951-05-06 00:00", "1951-09-09 00:00"),
-    ("1955-05-05 00:00", "1955-09-09 00:00"),
-    ("1956-05-20 00:00", "1956-09-30 00:00"),
-    ("1957-05-05 00:00", "1957-09-22 00:00"),
-    ("1958-05-04 00:00", "1958-09-21 00:00"),
-    ("1959-05-03 00:00", "1959-09-20 00:00"),
-    ("1960-05-01 00:00", "1960-09-18 00:00"),
-    ("1987-05-10 02:00", "1987-10-11 03:00"),
-    ("1988-05-08 02:00", "1988-10-09 03:00")
-]
-
-# 절입조정 기간 (동경 127도 30분 사용 기간)
-SOLAR_TERM_ADJUSTMENT_PERIODS = [
-    ("1908-04-01", "1911-12-31"),
-    ("1954-03-21", "1961-08-09")
-]
+# 써머타임/절입조정 기간은 saju_engine.time_rules 에서 컴파일된 규칙으로 관리
+# (SUMMERTIME_PERIODS, SOLAR_TERM_ADJUSTMENT_PERIODS 는 호환을 위해 다시 노출)
 
 # KASI API 설정
 # 음력→양력 변환용 ServiceKey
@@ -94,99 +133,47 @@ CITY_LONGITUDES = {
     "청주": 127.4890, "안양": 126.9568
 }
 
-# 절기 캐시 (API 호출 최소화)
-solar_terms_cache = {}
+# KASI 응답 캐시 (API 호출 최소화) - saju_engine.kasi_cache 의 공용 캐시 사용
+# (메모리 LRU + SQLite 파일, 재시작/워커 간 공유, 설정은 KASI_CACHE_* 환경 변수)
 
 def get_24_divisions_from_kasi(year, month):
-    """KASI API에서 24절기 정보 가져오기"""
-    global solar_terms_cache
+    """KASI API에서 24절기 정보 가져오기 (캐시 미스 시 1년치를 한 번에 조회)"""
+    from saju_engine.kasi_client import division_cache_key, get_kasi_client
+    
+    cache = get_kasi_cache()
     
     # 캐시 확인
-    cache_key = f"{year}-{month}"
-    if cache_key in solar_terms_cache:
-        return solar_terms_cache[cache_key]
+    cache_key = division_cache_key(year, month)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        events.debug(log, "kasi.cache_hit", "KASI 캐시 적중: {key}", key=cache_key)
+        return cached
     
     try:
-        url = "http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/get24DivisionsInfo"
-        params = {
-            'serviceKey': SERVICE_KEY_24_DIVISIONS,
-            'solYear': str(year),
-            'solMonth': f"{month:02d}",
-            'numOfRows': 10
-        }
-        
-        print(f"🌙 {year}년 {month}월 24절기 정보 조회 중...")
-        
-        # SSL 문제 해결을 위한 세션 설정
-        session = requests.Session()
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/xml, text/xml, */*'
-        }
-        
-        response = session.get(url, params=params, headers=headers, timeout=15)
-        
-        if response.status_code != 200:
-            print(f"🔍 24절기 API 응답 상태: {response.status_code}")
-            print(f"🔍 24절기 API 응답 내용 (처음 500자):")
-            print(response.text[:500])
+        events.info(log, "kasi.divisions.fetch", "🌙 {year}년 24절기 정보 조회 중...", year=year)
         
-        if response.status_code == 200:
-            root = ET.fromstring(response.text)
-            result_code = root.find('.//resultCode')
-            result_msg = root.find('.//resultMsg')
-            
-            if result_code is not None and result_code.text == '00':
-                items = root.findall('.//item')
-                solar_terms = []
-                
-                for item in items:
-                    date_name = item.find('dateName').text if item.find('dateName') is not None else ""
-                    locdate = item.find('locdate').text if item.find('locdate') is not None else ""
-                    kst_time = item.find('kst').text if item.find('kst') is not None else "0000"
-                    sun_longitude = item.find('sunLongitude').text if item.find('sunLongitude') is not None else "0"
-                    
-                    if locdate and len(locdate) == 8:
-                        # YYYYMMDD -> datetime 변환
-                        term_year = int(locdate[:4])
-                        term_month = int(locdate[4:6])
-                        term_day = int(locdate[6:8])
-                        
-                        # HHMM 시간 파싱 (공백 제거)
-                        kst_time = kst_time.strip()
-                        if len(kst_time) == 4:
-                            term_hour = int(kst_time[:2])
-                            term_minute = int(kst_time[2:4])
-                        else:
-                            term_hour = 0
-                            term_minute = 0
-                        
-                        term_datetime = datetime(term_year, term_month, term_day, term_hour, term_minute)
-                        
-                        solar_terms.append({
-                            'name': date_name,
-                            'datetime': term_datetime,
-                            'sun_longitude': int(sun_longitude)
-                        })
-                
-                # 캐시에 저장
-                solar_terms_cache[cache_key] = solar_terms
-                print(f"✅ {year}년 {month}월 절기 {len(solar_terms)}개 조회 완료")
-                return solar_terms
-            else:
-                print(f"❌ KASI 24절기 API 오류: {result_code.text if result_code is not None else 'Unknown'}")
-        else:
-            print(f"❌ 24절기 API 호출 실패: HTTP {response.status_code}")
+        # 공용 연결 풀 클라이언트로 1년치 조회 후 월별로 캐시에 저장
+        client = get_kasi_client()
+        if client.load_24_divisions_year(year, SERVICE_KEY_24_DIVISIONS, cache):
+            # 인접 연도는 백그라운드에서 미리 조회
+            client.prefetch_24_divisions([year - 1, year + 1], SERVICE_KEY_24_DIVISIONS, cache)
+            return cache.get(cache_key) or []
             
     except Exception as e:
-        print(f"❌ 24절기 조회 오류: {str(e)}")
+        events.error(log, "kasi.divisions.error", "24절기 조회 오류: {error}", year=year, error=str(e))
     
     return []
 
 def get_precise_solar_term_month(birth_datetime):
-    """절기 기준 월 계산 (API 사용 안함, 안정적인 fallback 방식만 사용)"""
-    # KASI API 대신 검증된 fallback 방식만 사용
-    print("📅 API 대신 안정적인 절기 계산 방식 사용")
+    """절기 기준 월 계산 (오프라인 절기 테이블, 범위 밖이면 fallback 방식)"""
+    table = get_solar_term_table()
+    month_idx = table.month_index(birth_datetime) if table is not None else None
+    
+    if month_idx is not None:
+        return month_idx
+    
+    events.warning(log, "solar_terms.out_of_range", "절기 테이블 범위 밖이므로 근사 절기 계산 방식 사용",
+                   datetime=birth_datetime)
     return get_solar_term_month_fallback(birth_datetime.month, birth_datetime.day)
 
 def get_solar_term_month_fallback(birth_month, birth_day):
@@ -247,114 +234,227 @@ def get_solar_term_month_fallback(birth_month, birth_day):
 
 def is_in_summertime_period(birth_datetime):
     """써머타임 기간 내인지 확인"""
-    for start_str, end_str in SUMMERTIME_PERIODS:
-        start_dt = datetime.strptime(start_str, "%Y-%m-%d %H:%M")
-        end_dt = datetime.strptime(end_str, "%Y-%m-%d %H:%M")
-        
-        if start_dt <= birth_datetime <= end_dt:
-            return True
-    return False
+    return TIME_RULES.rule("summertime").contains(birth_datetime)
 
 def is_in_solar_term_adjustment_period(birth_datetime):
     """절입조정 기간 내인지 확인"""
-    birth_date = birth_datetime.date()
+    return TIME_RULES.rule("standard_meridian").contains(birth_datetime)
+
+# 경도조정 생략 경고를 이미 낸 출생지 수 상한 (대량 계산에서 같은 출생지 경고가 행마다 반복되지 않도록)
+CITY_WARNING_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=CITY_WARNING_CACHE_SIZE)
+def _warn_unknown_city(city):
+    events.warning(log, "time.unknown_city", "알 수 없는 출생지입니다: {city} (경도조정 생략)", city=city)
+
+@lru_cache(maxsize=CITY_WARNING_CACHE_SIZE)
+def _warn_foreign_city(city, country, full_name):
+    events.warning(log, "time.foreign_city", "해외 출생지입니다: {city} ({country}, 경도조정 생략)",
+                   city=city, country=country, place=full_name)
+
+def get_city_longitude(city):
+    """출생지 경도 (주요 도시 → 오프라인 지명 사전), 국내 지명이 아니면 None (경고는 출생지별 한 번)"""
+    if city in CITY_LONGITUDES:
+        return CITY_LONGITUDES[city]
     
-    for start_str, end_str in SOLAR_TERM_ADJUSTMENT_PERIODS:
-        start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
-        end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
-        
-        if start_date <= birth_date <= end_date:
-            return True
-    return False
+    gazetteer = get_gazetteer() if city else None
+    place = gazetteer.lookup(city) if gazetteer is not None else None
+    if place is None:
+        _warn_unknown_city(city)
+        return None
+    if place.country not in KST_COUNTRIES:
+        # 해외 출생은 현지 표준시 기준이라 동경 135도 기준 경도조정을 적용할 수 없음
+        _warn_foreign_city(city, place.country, place.full_name)
+        return None
+    return place.longitude
 
 def apply_comprehensive_time_adjustment(birth_datetime, city):
     """통합 시간 조정 (써머타임 + 절입조정 + 경도조정)"""
+    # 1~2. 기간 규칙 (써머타임 -60분, 절입조정 -30분 및 기준 자오선) - 규칙별 bisect 한 번
+    offset_minutes, reference_longitude, active_rules = TIME_RULES.resolve(datetime_to_minute(birth_datetime))
+    adjusted_time = birth_datetime + timedelta(minutes=offset_minutes)
+    
     adjustments = []
-    adjusted_time = birth_datetime
-    
-    # 1. 써머타임 조정 (-60분)
-    if is_in_summertime_period(birth_datetime):
-        adjusted_time = adjusted_time - timedelta(hours=1)
-        adjustments.append("써머타임: -60분")
-    
-    # 2. 절입조정 (-30분, 동경 135도 → 127도 30분)
-    if is_in_solar_term_adjustment_period(birth_datetime):
-        adjusted_time = adjusted_time - timedelta(minutes=30)
-        adjustments.append("절입조정: -30분 (E135→E127.5)")
-        reference_longitude = 127.5  # 절입조정 기간에는 127도 30분 기준
-    else:
-        reference_longitude = 135.0  # 일반적으로는 동경 135도 기준
+    for rule in active_rules:
+        adjustments.append(rule.label)
+        events.debug(log, "time.adjustment", "{label}", code=rule.code, minutes=float(rule.offset_minutes),
+                     label=rule.label)
     
     # 3. 경도 조정 (지역별)
-    if city in CITY_LONGITUDES:
-        city_longitude = CITY_LONGITUDES[city]
+    city_longitude = get_city_longitude(city)
+    if city_longitude is not None:
         longitude_diff = city_longitude - reference_longitude
         time_diff_minutes = longitude_diff * 4  # 경도 1도당 4분
         
         adjusted_time = adjusted_time + timedelta(minutes=time_diff_minutes)
         adjustments.append(f"경도조정: {time_diff_minutes:+.1f}분 ({city})")
+        events.debug(log, "time.adjustment", "경도조정: {minutes:+.1f}분 ({city})", code="longitude",
+                     minutes=time_diff_minutes, city=city)
     
     return adjusted_time, adjustments
 
-def convert_lunar_to_solar(lunar_year, lunar_month, lunar_day, is_leap_month=False):
+def invert_time_adjustment(adjusted_time, city):
+    """조정된 시각 → 그 시각 이후 처음으로 해당 시각에 도달하는 현지 시계 시각 (분 단위 올림)"""
+    city_longitude = get_city_longitude(city) if city else None
+    
+    # 적용 규칙은 현지 시각에 따라 달라지므로 고정점 반복 (써머타임 경계에서는 근사)
+    local_time = adjusted_time
+    for _ in range(3):
+        offset_minutes, reference_longitude, _ = TIME_RULES.resolve(datetime_to_minute(local_time))
+        if city_longitude is not None:
+            offset_minutes += (city_longitude - reference_longitude) * 4
+        local_time = adjusted_time - timedelta(minutes=offset_minutes)
+    
+    rounded = local_time.replace(second=0, microsecond=0)
+    return rounded if rounded == local_time else rounded + timedelta(minutes=1)
+
+def find_same_saju_times(year_pillar, month_pillar, day_pillar, hour_pillar, city="서울", limit=None):
+    """네 기둥(예: '庚午')이 같은 사주가 나오는 출생 시각 구간 목록 (사주 역색인 사용)
+    
+    각 항목은 조정된 시각 구간과 city 기준 현지 시계 구간을 함께 담으며, 범위는 [시작, 끝) 입니다.
+    색인이 없으면 None, 존재할 수 없는 조합이면 빈 목록을 반환합니다. limit 은 None(전체) 또는 1 이상입니다.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit 은 1 이상이어야 합니다: {limit}")
+    
+    index = get_reverse_index()
+    if index is None:
+        return None
+    
+    ranges = index.find(*(pillar_index(p) for p in (year_pillar, month_pillar, day_pillar, hour_pillar)))
+    if limit is not None:
+        ranges = ranges[:limit]
+    
+    return [
+        {
+            'adjusted_start': start,
+            'adjusted_end': end,
+            'local_start': invert_time_adjustment(start, city),
+            'local_end': invert_time_adjustment(end, city)
+        }
+        for start, end in ranges
+    ]
+
+def convert_lunar_to_solar(lunar_year, lunar_month, lunar_day, is_leap_month=False, verify_with_kasi=False):
+    """음력→양력 변환 (오프라인 테이블, 범위 밖이면 KASI API)"""
+    table = get_lunar_table()
+    
+    if table is None or not table.covers(lunar_year):
+        return convert_lunar_to_solar_kasi(lunar_year, lunar_month, lunar_day, is_leap_month)
+    
+    solar_date = table.to_solar(lunar_year, lunar_month, lunar_day, is_leap_month)
+    if solar_date is None:
+        events.warning(log, "lunar.invalid_date", "존재하지 않는 음력 날짜입니다: {year}년 {leap}{month}월 {day}일",
+                       year=lunar_year, month=lunar_month, day=lunar_day,
+                       leap="윤" if is_leap_month else "", is_leap_month=bool(is_leap_month))
+        return None, None, None
+    
+    result = (solar_date.year, solar_date.month, solar_date.day)
+    
+    # 선택적으로 KASI API와 결과 비교
+    if verify_with_kasi:
+        kasi_result = convert_lunar_to_solar_kasi(lunar_year, lunar_month, lunar_day, is_leap_month)
+        if kasi_result[0] is not None and kasi_result != result:
+            events.warning(log, "lunar.verify_mismatch", "오프라인 변환 결과 {offline}와 KASI 결과 {kasi}가 다릅니다. KASI 결과 사용",
+                           offline=result, kasi=kasi_result)
+            return kasi_result
+    
+    return result
+
+def convert_solar_to_lunar(solar_year, solar_month, solar_day):
+    """양력→음력 변환 (오프라인 테이블) - (연, 월, 일, 윤달 여부)"""
+    table = get_lunar_table()
+    lunar = table.to_lunar(datetime(solar_year, solar_month, solar_day).date()) if table is not None else None
+    
+    if lunar is None:
+        events.warning(log, "lunar.out_of_range", "음력 테이블 범위 밖의 날짜입니다: {year}년 {month}월 {day}일",
+                       year=solar_year, month=solar_month, day=solar_day)
+        return None, None, None, None
+    
+    return lunar
+
+async def convert_lunar_to_solar_async(lunar_year, lunar_month, lunar_day, is_leap_month=False):
+    """음력→양력 변환 비동기 버전 (오프라인 테이블, 범위 밖이면 비동기 KASI API) - API 서버용"""
+    table = get_lunar_table()
+
+    if table is not None and table.covers(lunar_year):
+        solar_date = table.to_solar(lunar_year, lunar_month, lunar_day, is_leap_month)
+        if solar_date is None:
+            return None, None, None
+        return solar_date.year, solar_date.month, solar_date.day
+
+    from saju_engine.kasi_async import get_async_kasi_client
+
+    try:
+        solar = await get_async_kasi_client().convert_lunar_to_solar(
+            lunar_year, lunar_month, lunar_day, is_leap_month, SERVICE_KEY_LUNAR, get_kasi_cache()
+        )
+    except Exception as e:
+        events.error(log, "kasi.lunar.error", "음력 변환 오류: {error}", error=str(e))
+        solar = None
+
+    return solar if solar is not None else (None, None, None)
+
+async def get_24_divisions_from_kasi_async(year, month):
+    """KASI 24절기 조회 비동기 버전 (캐시 미스 시 1년치를 한 번에 조회) - API 서버용"""
+    from saju_engine.kasi_async import get_async_kasi_client
+
+    try:
+        return await get_async_kasi_client().get_24_divisions(
+            year, month, SERVICE_KEY_24_DIVISIONS, get_kasi_cache()
+        )
+    except Exception as e:
+        events.error(log, "kasi.divisions.error", "24절기 조회 오류: {error}", year=year, error=str(e))
+        return []
+
+def convert_lunar_to_solar_kasi(lunar_year, lunar_month, lunar_day, is_leap_month=False):
     """KASI API를 사용한 음력→양력 변환"""
+    import xml.etree.ElementTree as ET
+    
+    import requests
+    
+    from saju_engine.kasi_client import LUNAR_TO_SOLAR_URL, get_kasi_client, lunar_cache_key, lunar_to_solar_params
+    
+    cache = get_kasi_cache()
+    
+    # 캐시 확인
+    cache_key = lunar_cache_key(lunar_year, lunar_month, lunar_day, is_leap_month)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        events.debug(log, "kasi.cache_hit", "KASI 캐시 적중: {key}", key=cache_key)
+        return tuple(cached)
     
     # 음력→양력 변환을 위한 정확한 API URL (사용자 제공 정보 기반)
     urls_to_try = [
-        "http://apis.data.go.kr/B090041/openapi/service/LrsrCldInfoService/getSolCalInfo"
+        LUNAR_TO_SOLAR_URL
     ]
     
     for url in urls_to_try:
         try:
-            params = {
-                'serviceKey': SERVICE_KEY_LUNAR,
-                'lunYear': str(lunar_year),
-                'lunMonth': f"{lunar_month:02d}",
-                'lunDay': f"{lunar_day:02d}",
-                'lunLeapmonth': 'true' if is_leap_month else 'false'
-            }
+            params = lunar_to_solar_params(SERVICE_KEY_LUNAR, lunar_year, lunar_month, lunar_day, is_leap_month)
             
-            print(f"🌙 음력 {lunar_year}년 {lunar_month}월 {lunar_day}일 → 양력 변환 중...")
-            print(f"🔍 시도 중인 URL: {url}")
-            print(f"🔍 ServiceKey (처음 20자): {SERVICE_KEY_LUNAR[:20]}...")
+            events.info(log, "kasi.lunar.request", "🌙 음력 {year}년 {month}월 {day}일 → 양력 변환 중...",
+                        year=lunar_year, month=lunar_month, day=lunar_day, url=url)
             
-            # SSL 문제 해결을 위한 세션 설정
-            session = requests.Session()
+            # 공용 연결 풀 클라이언트 (일시적 오류는 지수 백오프로 재시도)
+            response = get_kasi_client().get(url, params)
             
-            if url.startswith('https'):
-                session.verify = False  # SSL 인증서 검증 비활성화
-                # 경고 메시지 비활성화
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
-            # 헤더 추가
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/xml, text/xml, */*'
-            }
-            
-            response = session.get(url, params=params, headers=headers, timeout=15)
-            
-            print(f"🔍 응답 상태코드: {response.status_code}")
-            print(f"🔍 응답 내용 (처음 500자):")
-            print(response.text[:500])
-            print("="*50)
+            # 응답 본문은 DEBUG 레벨에서만 잘라서 기록
+            if log.isEnabledFor(events.DEBUG):
+                events.debug(log, "kasi.lunar.response", "응답 상태코드 {status}: {body}",
+                             status=response.status_code, body=response.text[:500])
             
             if response.status_code == 200:
                 root = ET.fromstring(response.text)
                 result_code = root.find('.//resultCode')
                 result_msg = root.find('.//resultMsg')
                 
-                print(f"🔍 결과코드: {result_code.text if result_code is not None else 'None'}")
-                print(f"🔍 결과메시지: {result_msg.text if result_msg is not None else 'None'}")
-                
                 if result_code is not None and result_code.text == '00':
                     item = root.find('.//item')
                     if item is not None:
-                        # 모든 하위 요소 확인
-                        print("🔍 item의 모든 하위 요소:")
-                        for child in item:
-                            print(f"   {child.tag}: {child.text}")
+                        if log.isEnabledFor(events.DEBUG):
+                            events.debug(log, "kasi.lunar.item", "item 하위 요소: {item}",
+                                         item={child.tag: child.text for child in item})
                         
                         sol_year_elem = item.find('solYear')
                         sol_month_elem = item.find('solMonth')
@@ -365,51 +465,46 @@ def convert_lunar_to_solar(lunar_year, lunar_month, lunar_day, is_leap_month=Fal
                             sol_month = int(sol_month_elem.text)
                             sol_day = int(sol_day_elem.text)
                             
-                            print(f"✅ 변환 완료: 양력 {sol_year}년 {sol_month}월 {sol_day}일")
+                            events.info(log, "kasi.lunar.converted", "✅ 변환 완료: 양력 {year}년 {month}월 {day}일",
+                                        year=sol_year, month=sol_month, day=sol_day)
+                            cache.set(cache_key, [sol_year, sol_month, sol_day])
                             return sol_year, sol_month, sol_day
                         else:
-                            print("❌ 응답에서 솔라 날짜 요소를 찾을 수 없습니다.")
+                            events.error(log, "kasi.lunar.bad_item", "응답에서 솔라 날짜 요소를 찾을 수 없습니다.")
                     else:
-                        print("❌ 응답에서 item 요소를 찾을 수 없습니다.")
+                        events.error(log, "kasi.lunar.no_item", "응답에서 item 요소를 찾을 수 없습니다.")
                 else:
-                    print(f"❌ KASI 24절기 API 오류:")
-                    print(f"   결과코드: {result_code.text if result_code is not None else 'None'}")
-                    print(f"   결과메시지: {result_msg.text if result_msg is not None else 'None'}")
-                    if result_code is not None and result_code.text in ['20', '30']:
-                        print(f"   권한 오류: ServiceKey 확인 필요")
+                    code = result_code.text if result_code is not None else None
+                    events.error(log, "kasi.lunar.api_error", "KASI API 오류: 결과코드 {code}, 결과메시지 {msg}",
+                                 code=code, msg=result_msg.text if result_msg is not None else None,
+                                 auth_error=code in ('20', '30'))
                     # 다음 URL 시도
                     continue
             else:
-                print(f"❌ API 호출 실패: HTTP {response.status_code}")
-                print(f"응답 내용: {response.text}")
+                events.error(log, "kasi.lunar.http_error", "API 호출 실패: HTTP {status}", status=response.status_code)
                 # 다음 URL 시도
                 continue
         
         except requests.exceptions.SSLError as e:
-            print(f"❌ SSL 연결 오류: {str(e)}")
-            print("💡 HTTP로 재시도 중...")
+            events.error(log, "kasi.lunar.ssl_error", "SSL 연결 오류: {error}", error=str(e))
             # 다음 URL(HTTP) 시도
             continue
         except requests.exceptions.Timeout as e:
-            print(f"❌ 연결 시간 초과: 네트워크를 확인해주세요.")
+            events.error(log, "kasi.lunar.timeout", "연결 시간 초과: 네트워크를 확인해주세요.")
             continue
         except requests.exceptions.RequestException as e:
-            print(f"❌ 네트워크 오류: {str(e)}")
+            events.error(log, "kasi.lunar.network_error", "네트워크 오류: {error}", error=str(e))
             continue
         except ET.ParseError as e:
-            print(f"❌ XML 파싱 오류: {str(e)}")
-            print(f"응답 내용: {response.text if 'response' in locals() else 'No response'}")
+            events.error(log, "kasi.lunar.parse_error", "XML 파싱 오류: {error}", error=str(e))
             continue
         except Exception as e:
-            print(f"❌ 음력 변환 오류: {str(e)}")
-            import traceback
-            print(f"상세 오류: {traceback.format_exc()}")
+            events.exception(log, "kasi.lunar.error", "음력 변환 오류: {error}", error=str(e))
             continue
     
     # 모든 URL 시도 실패
-    print("❌ 모든 API 호출 시도가 실패했습니다.")
-    print("💡 방법1: 인터넷에서 음력→양력 변환 후 양력 날짜로 다시 실행")
-    print("💡 방법2: 간단한 추정 방법 사용")
+    events.error(log, "kasi.lunar.failed", "모든 API 호출 시도가 실패했습니다.",
+                 year=lunar_year, month=lunar_month, day=lunar_day)
     return None, None, None
 
 def simple_lunar_to_solar_estimate(lunar_year, lunar_month, lunar_day):
@@ -442,13 +537,20 @@ def calculate_year_pillar(birth_datetime):
     """연주 계산 (절기 기준 - 입춘 이전은 전년도)"""
     birth_year = birth_datetime.year
     
-    # 입춘 이전은 전년도 연주 사용
-    # 입춘은 대략 2월 4일경이므로 2월 4일 이전은 전년도로 계산
-    if birth_datetime.month < 2 or (birth_datetime.month == 2 and birth_datetime.day < 4):
-        actual_year = birth_year - 1
-        print(f"📅 입춘 이전이므로 {birth_year}년 → {actual_year}년 연주 적용")
-    else:
-        actual_year = birth_year
+    # 입춘 이전은 전년도 연주 사용 (절기 테이블의 정확한 입춘 시각 기준)
+    table = get_solar_term_table()
+    actual_year = table.saju_year(birth_datetime) if table is not None else None
+    
+    if actual_year is None:
+        # 테이블 범위 밖: 입춘은 대략 2월 4일경이므로 2월 4일 이전은 전년도로 계산
+        if birth_datetime.month < 2 or (birth_datetime.month == 2 and birth_datetime.day < 4):
+            actual_year = birth_year - 1
+        else:
+            actual_year = birth_year
+    
+    if actual_year != birth_year:
+        events.debug(log, "saju.before_ipchun", "입춘 이전이므로 {year}년 → {saju_year}년 연주 적용",
+                     year=birth_year, saju_year=actual_year)
     
     year_stem_idx = (actual_year - 4) % 10
     year_branch_idx = (actual_year - 4) % 12
@@ -462,7 +564,7 @@ def calculate_month_pillar(birth_datetime, year_stem):
     year_stem_idx = STEMS.index(year_stem)
     month_stem_start_idx = STEMS.index(month_stem_starts[year_stem_idx % 5])
     
-    # KASI API를 사용한 정확한 절기 기준 월지 계산
+    # 절기 테이블을 사용한 정확한 절기 기준 월지 계산
     month_branch_idx = get_precise_solar_term_month(birth_datetime)
     month_branch = MONTH_BRANCHES[month_branch_idx]
     
@@ -516,12 +618,12 @@ def calculate_great_luck(year_stem, month_pillar, male, birth_datetime):
     else:
         direction = "역행"
     
-    # 간단한 대운 시작 나이 계산
-    start_age = 3 + (birth_datetime.month % 3)
+    # 대운수: 다음(순행)/직전(역행) 절입까지의 거리 (3일 = 1년), 대운 간지는 월주에서 한 칸씩
+    timeline = great_luck_timeline(birth_datetime, month_pillar, direction == "순행")
     
     return {
         'direction': direction,
-        'start_age': start_age
+        **timeline
     }
 
 def calculate_five_elements(stems, branches):
@@ -535,25 +637,8 @@ def calculate_five_elements(stems, branches):
     
     return elements
 
-def calculate_solar_saju(birth_year, birth_month, birth_day, birth_hour, birth_minute=0, 
-                        male=True, city="서울"):
-    """양력 기준 사주계산"""
-    
-    print(f"\n🎯 사주 계산 시작...")
-    print(f"📅 양력 날짜: {birth_year}년 {birth_month}월 {birth_day}일 {birth_hour}시 {birth_minute}분")
-    print(f"🏙️  도시: {city}")
-    
-    birth_datetime = datetime(birth_year, birth_month, birth_day, birth_hour, birth_minute)
-    
-    # 통합 시간 조정 적용 (써머타임 + 절입조정 + 경도조정)
-    adjusted_birth_time, adjustments = apply_comprehensive_time_adjustment(birth_datetime, city)
-    
-    print(f"🌍 시간 조정:")
-    for adj in adjustments:
-        print(f"   {adj}")
-    print(f"🕐 최종 조정 시간: {adjusted_birth_time.strftime('%Y-%m-%d %H:%M')}")
-    
-    # 사주 계산 (조정된 시간 사용)
+def _calculate_chart(adjusted_birth_time, male):
+    """조정된 출생 시각 → 사주 원국 (사주/대운/오행)"""
     year_stem, year_branch = calculate_year_pillar(adjusted_birth_time)
     month_pillar = calculate_month_pillar(adjusted_birth_time, year_stem)
     day_stem, day_branch = calculate_day_pillar(adjusted_birth_time)
@@ -562,31 +647,87 @@ def calculate_solar_saju(birth_year, birth_month, birth_day, birth_hour, birth_m
     # 대운 계산
     great_luck = calculate_great_luck(year_stem, month_pillar, male, adjusted_birth_time)
     
-    result = {
+    return {
         'year_pillar': year_stem + year_branch,
         'month_pillar': month_pillar,
         'day_pillar': day_stem + day_branch,
         'hour_pillar': hour_stem + hour_branch,
         'great_luck': great_luck,
         'elements': calculate_five_elements([year_stem, month_pillar[0], day_stem, hour_stem],
-                                         [year_branch, month_pillar[1], day_branch, hour_branch]),
-        'birth_info': {
-            'original_time': f"{birth_year}-{birth_month:02d}-{birth_day:02d} {birth_hour:02d}:{birth_minute:02d}",
-            'adjusted_time': adjusted_birth_time.strftime('%Y-%m-%d %H:%M'),
-            'city': city,
-            'adjustments': adjustments
-        }
+                                         [year_branch, month_pillar[1], day_branch, hour_branch])
+    }
+
+def calculate_chart(adjusted_birth_time, male=True, use_cache=True):
+    """조정된 출생 시각 → 사주 원국 (같은 분 + 성별이면 캐시된 결과 재사용, 반환값은 호출자 소유의 복사본)"""
+    if use_cache:
+        # 절기/시주 판정은 모두 분 단위이므로 초 이하는 키에서 제외
+        minute_time = adjusted_birth_time.replace(second=0, microsecond=0)
+        key = ChartCache.key(datetime_to_minute(minute_time), male)
+        chart = get_chart_cache().get_or_compute(key, lambda: _calculate_chart(minute_time, male))
+    else:
+        chart = _calculate_chart(adjusted_birth_time, male)
+    
+    chart = dict(chart)
+    chart['great_luck'] = dict(chart['great_luck'])
+    chart['great_luck']['pillars'] = [dict(period) for period in chart['great_luck']['pillars']]
+    chart['elements'] = dict(chart['elements'])
+    return chart
+
+def calculate_solar_saju(birth_year, birth_month, birth_day, birth_hour, birth_minute=0, 
+                        male=True, city="서울", use_cache=True):
+    """양력 기준 사주계산"""
+    
+    birth_datetime = datetime(birth_year, birth_month, birth_day, birth_hour, birth_minute)
+    
+    # 통합 시간 조정 적용 (써머타임 + 절입조정 + 경도조정)
+    adjusted_birth_time, adjustments = apply_comprehensive_time_adjustment(birth_datetime, city)
+    
+    events.info(log, "saju.time_adjusted", "🕐 최종 조정 시간: {adjusted_time:%Y-%m-%d %H:%M} ({city})",
+                birth_time=birth_datetime, adjusted_time=adjusted_birth_time, city=city,
+                adjustments=adjustments)
+    
+    # 사주 계산 (조정된 시간 사용, 같은 분이면 메모이제이션된 결과)
+    result = calculate_chart(adjusted_birth_time, male, use_cache=use_cache)
+    result['birth_info'] = {
+        'original_time': f"{birth_year}-{birth_month:02d}-{birth_day:02d} {birth_hour:02d}:{birth_minute:02d}",
+        'adjusted_time': adjusted_birth_time.strftime('%Y-%m-%d %H:%M'),
+        'city': city,
+        'adjustments': adjustments
     }
     
     return result
 
+def calculate_solar_saju_batch(birth_year, birth_month, birth_day, birth_hour, birth_minute=0,
+                               male=True, city_code=0, city_longitude=None):
+    """양력 기준 배치 사주계산 (NumPy 배열 입력, 정수 간지 배열 반환)
+
+    상세 내용은 saju_engine.batch.calculate_solar_saju_batch 참고
+    """
+    # numpy는 배치 계산에서만 필요하므로 호출 시점에 import
+    from saju_engine.batch import calculate_solar_saju_batch as _calculate_batch
+    
+    return _calculate_batch(birth_year, birth_month, birth_day, birth_hour, birth_minute,
+                            male=male, city_code=city_code, city_longitude=city_longitude)
+
+def iter_charts(start, end, step='hour', city="서울", male=True, chunk_size=65536):
+    """[start, end) 구간을 step 간격으로 열거하며 사주 배열 묶음을 생성 (사전 계산/감사 작업용)
+
+    상세 내용은 saju_engine.batch.iter_charts 참고
+    """
+    # numpy는 배치 계산에서만 필요하므로 호출 시점에 import
+    from saju_engine.batch import iter_charts as _iter_charts
+    
+    return _iter_charts(start, end, step=step, city=city, male=male, chunk_size=chunk_size)
+
 def display_result(result):
     """결과 출력"""
     print("\n" + "="*60)
     print("🎯 사주 계산 결과")
     print("="*60)
     
-    # 사주 정보
+    # 사주 정보 (prettytable 은 출력할 때만 필요)
+    from prettytable import PrettyTable
+    
     table = PrettyTable()
     table.field_names = ["구분", "천간", "지지", "사주"]
     table.add_row(["시주", result['hour_pillar'][0], result['hour_pillar'][1], result['hour_pillar']])
@@ -614,13 +755,15 @@ def display_result(result):
     great_luck = result['great_luck']
     print(f"\n🔮 대운 정보:")
     print(f"  방향: {great_luck['direction']}")
-    print(f"  시작 나이: {great_luck['start_age']}세")
+    print(f"  시작 나이: {great_luck['start_age']}세 (정확히 {great_luck['start_years']:.2f}년, {great_luck['start_date']})")
+    if great_luck.get('pillars'):
+        print("  " + " → ".join(f"{p['start_age']}세 {p['pillar']}" for p in great_luck['pillars'][:8]))
 
 def get_user_input():
     """사용자 입력 받기"""
     print("🌟 양력 만세력 - 양력/음력 기준 사주계산기")
     print("  - 양력/음력 날짜 기준 간지 계산")
-    print("  - KASI API 음력→양력 변환")
+    print("  - 음력→양력 변환 (오프라인 테이블)")
     print("  - 써머타임 조정 (1948-1960, 1987-1988)")
     print("  - 절입조정 (1908-1911, 1954-1961)")
     print("  - 경도 조정 적용")
@@ -629,7 +772,7 @@ def get_user_input():
     # 양력/음력 선택
     print("\n📅 날짜 형식을 선택하세요:")
     print("1. 양력")
-    print("2. 음력 (KASI API 변환)")
+    print("2. 음력 (오프라인 테이블 변환)")
     
     while True:
         calendar_type = input("선택 (1-2): ").strip()
@@ -699,7 +842,7 @@ def get_user_input():
         )
         
         if solar_year is None:
-            print("\n⚠️  KASI API 변환에 실패했습니다.")
+            print("\n⚠️  음력→양력 변환에 실패했습니다.")
             print("🔄 간단한 추정 방법을 사용하시겠습니까?")
             print("1. 간단한 추정으로 계속 진행")
             print("2. 프로그램 종료 (인터넷에서 변환 후 양력으로 다시 실행)")
@@ -791,6 +934,9 @@ def get_user_input():
 
 def main():
     """사주 계산기 메인 함수"""
+    # 계산 과정 이벤트를 콘솔에 출력 (SAJU_LOG_LEVEL=DEBUG 로 상세 출력)
+    events.configure_logging("console", os.getenv("SAJU_LOG_LEVEL", "INFO"))
+    
     # 테스트 모드 추가
     print("🧪 테스트 모드를 실행하시겠습니까?")
     print("1. 일반 모드 (사용자 입력)")
@@ -814,6 +960,13 @@ def main():
         else:
             print("❌ 24절기 API 테스트 실패")
         
+        # 오프라인 절기 테이블 확인
+        table = get_solar_term_table()
+        if table is not None:
+            print(f"\n📚 오프라인 절기 테이블 ({table.first_year}~{table.last_year}년) 2024년 3월:")
+            for term in table.terms_for_month(2024, 3):
+                print(f"   {term['name']}: {term['datetime'].strftime('%Y-%m-%d %H:%M')} (태양황경: {term['sun_longitude']}도)")
+        
         print("\n" + "-" * 40)
         
         # 예제 1: 양력 1955-08-08 17:28 서울 출생 (써머타임 적용 시기)
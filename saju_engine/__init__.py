@@ -0,0 +1,10 @@
+# 사주 계산 엔진 모듈
+# 대량(배치) 계산 및 오프라인 데이터 기반 계산 기능 제공
+#
+# NOTE: saju_calculator가 이 패키지의 일부 모듈을 사용하므로
+# 순환 import를 피하기 위해 하위 모듈은 필요한 곳에서 개별적으로 import 합니다.
+#   from saju_engine.batch import calculate_solar_saju_batch
+
+__all__ = [
+    "batch",
+]
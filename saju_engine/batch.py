@@ -0,0 +1,294 @@
+# saju_engine/batch.py
+# NumPy 기반 배치 사주 계산 엔진
+# saju_calculator.calculate_solar_saju 와 동일한 규칙을 배열 연산으로 수행
+# (임의 입력 배열: calculate_solar_saju_batch, 일정 간격 구간 열거: iter_charts)
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from saju_calculator import CITY_LONGITUDES, get_city_longitude
+from saju_engine.luck import great_luck_arrays
+from saju_engine.sexagenary import sexagenary_index
+from saju_engine.solar_terms import TERMS_PER_YEAR, EPOCH, get_solar_term_table
+from saju_engine.time_rules import TIME_RULES
+
+# 도시 코드 (CITY_LONGITUDES 순서, -1 = 경도 조정 없음)
+CITY_CODES = tuple(CITY_LONGITUDES.keys())
+
+# 오행 순서 (elements 배열의 열 순서)
+ELEMENT_ORDER = '木火土金水'
+
+# 천간/지지 → 오행 인덱스 (ELEMENT_ORDER 기준)
+STEM_ELEMENT = np.array([0, 0, 1, 1, 2, 2, 3, 3, 4, 4], dtype=np.int8)
+BRANCH_ELEMENT = np.array([4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4], dtype=np.int8)
+
+# 월별 절입일 근사치 (get_solar_term_month_fallback 과 동일, 인덱스 = 양력 월)
+# 절기 테이블 범위 밖의 날짜에만 사용
+_TERM_BOUNDARY_DAY = np.array([0, 6, 4, 6, 5, 6, 6, 7, 8, 8, 8, 7, 7], dtype=np.int64)
+
+_JD_UNIX_EPOCH = 2440588  # 1970-01-01 의 율리우스일
+_US_PER_MINUTE = 60 * 1_000_000
+_US_PER_HOUR = 60 * _US_PER_MINUTE
+_US_PER_DAY = 24 * _US_PER_HOUR
+
+
+def city_code(city: str) -> int:
+    """도시명 → 배치 계산용 도시 코드 (미등록 도시는 -1)"""
+    try:
+        return CITY_CODES.index(city)
+    except ValueError:
+        return -1
+
+
+def city_longitudes(cities) -> np.ndarray:
+    """출생지 이름 목록 → 경도 배열 (주요 도시 + 지명 사전, 국내 지명이 아니면 NaN)"""
+    lookup = {}
+    for city in cities:
+        if city not in lookup:
+            longitude = get_city_longitude(city)
+            lookup[city] = np.nan if longitude is None else longitude
+    return np.array([lookup[city] for city in cities], dtype=np.float64)
+
+
+def _julian_day(year, month, day):
+    """율리우스일 계산 (calculate_day_pillar 와 동일한 정수 공식)"""
+    a = (14 - month) // 12
+    y = year - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 + 1721119
+
+
+_EPOCH_JD = _julian_day(EPOCH.year, EPOCH.month, EPOCH.day)  # 절기 테이블 기준점의 율리우스일
+
+
+def _civil_from_julian_day(jd):
+    """율리우스일 → (년, 월, 일) 배열"""
+    dates = (jd - _JD_UNIX_EPOCH).astype('datetime64[D]')
+    months = dates.astype('datetime64[M]')
+    year = months.astype(np.int64) // 12 + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates - months).astype(np.int64) + 1
+    return year, month, day
+
+
+def _solar_term_arrays():
+    """절기 테이블 → (절입 분 배열, 첫 연도, 커버리지 끝 분), 테이블이 없으면 None"""
+    table = get_solar_term_table()
+    if table is None:
+        return None
+    minutes = np.frombuffer(table.minutes, dtype=np.int32).astype(np.int64)
+    end_minute = (int(_julian_day(table.last_year + 1, 1, 1)) - _EPOCH_JD) * 1440
+    return minutes, table.first_year, end_minute
+
+
+def _longitude_offsets_us(reference_longitude: float) -> np.ndarray:
+    """도시별 경도 조정량 (마이크로초), 마지막 원소는 미등록 도시(-1)용 0"""
+    # timedelta 로 계산해서 스칼라 버전과 반올림까지 동일하게 맞춤
+    offsets = [
+        (timedelta(minutes=(longitude - reference_longitude) * 4)) // timedelta(microseconds=1)
+        for longitude in CITY_LONGITUDES.values()
+    ]
+    offsets.append(0)
+    return np.array(offsets, dtype=np.int64)
+
+
+def _city_offset_matrix() -> np.ndarray:
+    """[표준 자오선 인덱스, 도시 코드] → 경도 조정량 (마이크로초)"""
+    return np.stack([_longitude_offsets_us(longitude) for longitude in TIME_RULES.reference_longitudes()])
+
+
+def _longitude_offsets_by_value_us(longitude: np.ndarray, reference_index: np.ndarray) -> np.ndarray:
+    """임의 경도 배열의 경도 조정량 (마이크로초, NaN 은 0) - (자오선, 경도) 조합별로 한 번만 계산"""
+    references = TIME_RULES.reference_longitudes()
+    known = ~np.isnan(longitude)
+    offsets = np.zeros(longitude.shape, dtype=np.int64)
+    if not known.any():
+        return offsets
+
+    pairs, inverse = np.unique(np.stack([reference_index[known], longitude[known]], axis=1),
+                               axis=0, return_inverse=True)
+    values = np.array([
+        timedelta(minutes=(lon - references[int(ref)]) * 4) // timedelta(microseconds=1)
+        for ref, lon in pairs
+    ], dtype=np.int64)
+    offsets[known] = values[np.ravel(inverse)]
+    return offsets
+
+
+def calculate_solar_saju_batch(birth_year, birth_month, birth_day, birth_hour,
+                               birth_minute=0, male=True, city_code=0, city_longitude=None) -> Dict[str, np.ndarray]:
+    """양력 기준 배치 사주계산
+
+    모든 인자는 같은 길이의 배열(또는 브로드캐스트 가능한 스칼라)이며,
+    city_code 는 CITY_CODES 인덱스(-1 은 경도 조정 없음)입니다.
+    city_longitude(동경, NaN 은 경도 조정 없음)를 주면 city_code 대신 사용합니다
+    (지명 사전의 출생지는 city_longitudes() 로 변환).
+    결과는 calculate_solar_saju 와 동일한 간지를 정수 인덱스로 반환합니다
+    (천간은 STEMS, 지지는 BRANCH, 오행은 ELEMENT_ORDER 기준).
+    """
+    by_longitude = city_longitude is not None
+    year, month, day, hour, minute, male, city, longitude = np.broadcast_arrays(
+        np.asarray(birth_year, dtype=np.int64),
+        np.asarray(birth_month, dtype=np.int64),
+        np.asarray(birth_day, dtype=np.int64),
+        np.asarray(birth_hour, dtype=np.int64),
+        np.asarray(birth_minute, dtype=np.int64),
+        np.asarray(male, dtype=bool),
+        np.asarray(-1 if by_longitude else city_code, dtype=np.int64),
+        np.asarray(city_longitude if by_longitude else np.nan, dtype=np.float64),
+    )
+    year, month, day, hour, minute, male, city, longitude = (
+        np.ravel(a) for a in (year, month, day, hour, minute, male, city, longitude)
+    )
+
+    # 입력 검증 (datetime 생성과 동일한 범위 검사)
+    jd = _julian_day(year, month, day)
+    check_year, check_month, check_day = _civil_from_julian_day(jd)
+    invalid = (
+        (month < 1) | (month > 12) | (check_year != year) | (check_month != month) | (check_day != day)
+        | (hour < 0) | (hour > 23) | (minute < 0) | (minute > 59)
+        | (city < -1) | (city >= len(CITY_CODES)) | (np.abs(longitude) > 180)
+    )
+    if invalid.any():
+        i = int(np.flatnonzero(invalid)[0])
+        raise ValueError(
+            f"잘못된 입력 (index {i}): {year[i]}-{month[i]}-{day[i]} {hour[i]}:{minute[i]}, city_code={city[i]}"
+        )
+
+    # 통합 시간 조정 (시간 조정 규칙 엔진의 벡터 버전 + 표준 자오선별 경도조정)
+    birth_minutes = jd * 1440 + hour * 60 + minute
+    adjusted_us, reference_index = _rule_adjusted_us(birth_minutes)
+    if by_longitude:
+        adjusted_us += _longitude_offsets_by_value_us(longitude, reference_index)
+    else:
+        adjusted_us += _city_offset_matrix()[reference_index, city]
+
+    return _chart_arrays(adjusted_us, male)
+
+
+def _rule_adjusted_us(birth_minutes: np.ndarray):
+    """출생 분(율리우스일 × 1440 기준) → (규칙 조정 후 마이크로초, 표준 자오선 인덱스)"""
+    rule_offset, reference_index, _ = TIME_RULES.resolve_array(birth_minutes - _EPOCH_JD * 1440)
+    return (birth_minutes + rule_offset) * _US_PER_MINUTE, reference_index
+
+
+def _chart_arrays(adjusted_us: np.ndarray, male) -> Dict[str, np.ndarray]:
+    """조정된 시각(마이크로초) 배열 → 간지/오행/대운 배열"""
+    adjusted_jd = adjusted_us // _US_PER_DAY
+    adjusted_hour = (adjusted_us % _US_PER_DAY) // _US_PER_HOUR
+    adj_year, adj_month, adj_day = _civil_from_julian_day(adjusted_jd)
+
+    # 연주/월지 - 근사 절기 (테이블 범위 밖용)
+    before_ipchun = (adj_month < 2) | ((adj_month == 2) & (adj_day < 4))
+    saju_year = adj_year - before_ipchun
+    month_idx = np.where(
+        adj_day >= _TERM_BOUNDARY_DAY[adj_month], (adj_month - 2) % 12, (adj_month - 3) % 12
+    )
+
+    # 연주/월지 - 절기 테이블 (직전 절입 시각 기준, 입춘 이전은 전년도)
+    term_arrays = _solar_term_arrays()
+    if term_arrays is not None:
+        term_minutes, first_year, end_minute = term_arrays
+        adjusted_minute = adjusted_us // _US_PER_MINUTE - _EPOCH_JD * 1440
+        k = np.searchsorted(term_minutes, adjusted_minute, side='right') - 1
+        covered = (k >= 0) & (adjusted_minute < end_minute)
+        term_year = first_year + k // TERMS_PER_YEAR
+        term_pos = k % TERMS_PER_YEAR
+        saju_year = np.where(covered, term_year - (term_pos < 2), saju_year)
+        month_idx = np.where(covered, ((term_pos - 2) // 2) % 12, month_idx)
+
+    year_stem = (saju_year - 4) % 10
+    year_branch = (saju_year - 4) % 12
+
+    # 월주 (연간별 월간 시작)
+    month_branch = (month_idx + 2) % 12
+    month_stem = (2 + 2 * (year_stem % 5) + month_idx) % 10
+
+    # 일주
+    day_stem = (adjusted_jd + 9) % 10
+    day_branch = (adjusted_jd + 1) % 12
+
+    # 시주
+    hour_branch = ((adjusted_hour + 1) // 2) % 12
+    hour_stem = (day_stem * 2 + hour_branch) % 10
+
+    # 오행 분포
+    chars = np.stack([
+        STEM_ELEMENT[year_stem], STEM_ELEMENT[month_stem], STEM_ELEMENT[day_stem], STEM_ELEMENT[hour_stem],
+        BRANCH_ELEMENT[year_branch], BRANCH_ELEMENT[month_branch], BRANCH_ELEMENT[day_branch],
+        BRANCH_ELEMENT[hour_branch],
+    ], axis=1)
+    elements = np.stack([(chars == e).sum(axis=1) for e in range(5)], axis=1).astype(np.int8)
+
+    # 대운 (양년생 남성/음년생 여성 = 순행, 대운수는 절입까지의 거리, 테이블 범위 밖은 근사식)
+    is_yang_year = (year_stem % 2) == 0
+    great_luck_forward = is_yang_year == male
+    great_luck = great_luck_arrays(
+        adjusted_us // _US_PER_MINUTE - _EPOCH_JD * 1440, great_luck_forward,
+        sexagenary_index(month_stem, month_branch), legacy_age=3 + adj_month % 3
+    )
+
+    adjusted_time = (adjusted_us - _JD_UNIX_EPOCH * _US_PER_DAY).astype('datetime64[us]')
+
+    return {
+        'year_stem': year_stem.astype(np.int8),
+        'year_branch': year_branch.astype(np.int8),
+        'month_stem': month_stem.astype(np.int8),
+        'month_branch': month_branch.astype(np.int8),
+        'day_stem': day_stem.astype(np.int8),
+        'day_branch': day_branch.astype(np.int8),
+        'hour_stem': hour_stem.astype(np.int8),
+        'hour_branch': hour_branch.astype(np.int8),
+        'elements': elements,
+        'great_luck_forward': great_luck_forward,
+        'great_luck_start_age': great_luck['start_age'].astype(np.int8),
+        'great_luck_start_years': great_luck['start_years'],
+        'great_luck_pillars': great_luck['pillars'],
+        'adjusted_time': adjusted_time,
+    }
+
+
+# iter_charts 의 간격 이름 → 분
+CHART_STEPS = {'minute': 1, 'hour': 60, 'day': 1440}
+
+
+def iter_charts(start: datetime, end: datetime, step='hour', city: Optional[str] = "서울", male=True,
+                chunk_size: int = 65536) -> Iterator[Dict[str, np.ndarray]]:
+    """[start, end) 구간의 일정 간격 출생 시각별 사주를 chunk_size 개씩 배열 묶음으로 생성
+
+    출생 시각은 시작 분에서 등차수열로 만들고(행마다 날짜를 해석하지 않음), 경도 조정량은
+    표준 자오선별로 한 번만 계산합니다. 각 묶음은 calculate_solar_saju_batch 와 같은 키에
+    'birth_time'(datetime64[m], 조정 전 출생 시각) 이 추가된 dict 입니다.
+    step 은 'minute' / 'hour' / 'day' 또는 분 단위로 나누어떨어지는 timedelta 입니다.
+    """
+    if isinstance(step, str):
+        if step not in CHART_STEPS:
+            raise ValueError(f"지원하지 않는 간격입니다: {step} ({', '.join(CHART_STEPS)})")
+        step_minutes = CHART_STEPS[step]
+    else:
+        step_minutes, remainder = divmod(step, timedelta(minutes=1))
+        if remainder or step_minutes <= 0:
+            raise ValueError(f"간격은 1분 이상의 분 단위여야 합니다: {step}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 는 1 이상이어야 합니다.")
+
+    start = start.replace(second=0, microsecond=0)
+    total = max(0, -(-((end - start) // timedelta(minutes=1)) // step_minutes))
+
+    # 표준 자오선 인덱스별 경도 조정량 (국내 지명이 아니면 0)
+    longitude = get_city_longitude(city) if city else None
+    longitude_offsets = np.array([
+        0 if longitude is None
+        else timedelta(minutes=(longitude - reference) * 4) // timedelta(microseconds=1)
+        for reference in TIME_RULES.reference_longitudes()
+    ], dtype=np.int64)
+
+    first_minute = int(_julian_day(start.year, start.month, start.day)) * 1440 + start.hour * 60 + start.minute
+    for offset in range(0, total, chunk_size):
+        birth_minutes = first_minute + np.arange(offset, min(offset + chunk_size, total), dtype=np.int64) * step_minutes
+        adjusted_us, reference_index = _rule_adjusted_us(birth_minutes)
+        chunk = _chart_arrays(adjusted_us + longitude_offsets[reference_index], male)
+        chunk['birth_time'] = (birth_minutes - _JD_UNIX_EPOCH * 1440).astype('datetime64[m]')
+        yield chunk
@@ -0,0 +1,324 @@
+# saju_engine/build.py
+# 오프라인 데이터 테이블 생성 도구
+#
+# 사용법:
+#   python -m saju_engine.build solar-terms [--ephemeris de440s.bsp] [--start-year 1900] [--end-year 2100]
+#   python -m saju_engine.build lunar [--start-year 1900] [--end-year 2100]
+#   python -m saju_engine.build gazetteer [--source data/gazetteer_kr.csv] [--min-population 1000000]
+#   python -m saju_engine.build reverse-index  (solar-terms 테이블로부터 생성)
+#   python -m saju_engine.build calendar [--start-year 1900] [--end-year 2052]  (solar-terms 테이블로부터 생성)
+
+import argparse
+import csv
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from saju_engine.calendar_table import CALENDAR_TABLE_PATH, EPOCH, compute_calendar_planes, write_calendar_table
+from saju_engine.gazetteer import (
+    GAZETTEER_PATH,
+    KIND_CITY,
+    KIND_COUNTY,
+    KIND_DISTRICT,
+    KIND_PROVINCE,
+    write_gazetteer,
+)
+from saju_engine.lunar_table import LUNAR_TABLE_PATH, write_lunar_table
+from saju_engine.reverse_index import REVERSE_INDEX_PATH, month_intervals, write_reverse_index
+from saju_engine.solar_terms import (
+    SOLAR_TERM_TABLE_PATH,
+    TERMS_PER_YEAR,
+    TERM_LONGITUDES,
+    SolarTermTable,
+    datetime_to_minute,
+    write_solar_term_table,
+)
+
+KST = timedelta(hours=9)
+
+# 1900-01-01 의 율리우스일 (음력 테이블 기준점)
+_LUNAR_EPOCH_JD = 2415021
+
+
+def compute_solar_terms(start_year: int, end_year: int, ephemeris: str = "de440s.bsp") -> List[List[int]]:
+    """skyfield 로 연도별 24절기 절입 시각(KST, 분 단위 반올림)을 계산"""
+    from skyfield import almanac
+    from skyfield.api import Loader, load_file
+    from skyfield.framelib import ecliptic_frame
+
+    loader = Loader(os.path.expanduser("~/.skyfield"))
+    eph = load_file(ephemeris) if os.path.exists(ephemeris) else loader(ephemeris)
+    ts = loader.timescale(builtin=True)
+    earth, sun = eph['earth'], eph['sun']
+
+    def term_index_at(t):
+        """시각 t 의 태양 시황경 15도 구간 번호"""
+        _, longitude, _ = earth.at(t).observe(sun).apparent().frame_latlon(ecliptic_frame)
+        return (longitude.degrees // 15).astype(int)
+
+    term_index_at.step_days = 7
+
+    rows = []
+    for year in range(start_year, end_year + 1):
+        # KST 기준 연도 경계 (UTC 로 9시간 앞당김)
+        t0 = ts.utc(year - 1, 12, 31, 15)
+        t1 = ts.utc(year, 12, 31, 15)
+        times, indexes = almanac.find_discrete(t0, t1, term_index_at)
+
+        terms = {}
+        for t, index in zip(times, indexes):
+            kst = t.utc_datetime().replace(tzinfo=None) + KST
+            # KASI 발표값과 같이 분 단위 반올림
+            kst = (kst + timedelta(seconds=30)).replace(second=0, microsecond=0)
+            terms[int(index) * 15] = datetime_to_minute(kst)
+
+        if len(terms) != TERMS_PER_YEAR:
+            raise ValueError(f"{year}년 절기 {len(terms)}개만 계산되었습니다. 천체력 범위를 확인하세요.")
+        rows.append([terms[longitude] for longitude in TERM_LONGITUDES])
+        print(f"✅ {year}년 24절기 계산 완료")
+
+    return rows
+
+
+def build_solar_term_table(path: str = SOLAR_TERM_TABLE_PATH, start_year: int = 1900,
+                           end_year: int = 2100, ephemeris: str = "de440s.bsp") -> str:
+    """24절기 바이너리 테이블 생성"""
+    rows = compute_solar_terms(start_year, end_year, ephemeris)
+    write_solar_term_table(path, start_year, rows)
+    print(f"💾 절기 테이블 저장: {path} ({start_year}~{end_year}년)")
+    return path
+
+
+def compute_lunar_records(start_year: int, end_year: int) -> List[Tuple[int, int, int, int]]:
+    """lunar_python 으로 음력 연도별 (설날 경과일, 월 대소 비트, 윤달, 달 수) 계산"""
+    from lunar_python import LunarYear
+
+    records = []
+    for year in range(start_year, end_year + 1):
+        lunar_year = LunarYear.fromYear(year)
+        months = lunar_year.getMonthsInYear()
+
+        month_bits = 0
+        for position, month in enumerate(months):
+            if month.getDayCount() == 30:
+                month_bits |= 1 << position
+
+        new_year = int(months[0].getFirstJulianDay()) - _LUNAR_EPOCH_JD
+        records.append((new_year, month_bits, lunar_year.getLeapMonth(), len(months)))
+
+    return records
+
+
+def build_lunar_table(path: str = LUNAR_TABLE_PATH, start_year: int = 1900, end_year: int = 2100) -> str:
+    """음력↔양력 변환 바이너리 테이블 생성"""
+    records = compute_lunar_records(start_year, end_year)
+    write_lunar_table(path, start_year, records)
+    print(f"💾 음력 테이블 저장: {path} ({start_year}~{end_year}년)")
+    return path
+
+
+GAZETTEER_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer_kr.csv")
+
+_HANGUL = re.compile(r'[가-힣]')
+
+# GeoNames 이름 → 표준 한글 표기 (외래어 표기법; 한자음·약칭·옛 표기보다 우선)
+WORLD_EXONYMS = {
+    'Beijing': '베이징', 'Shanghai': '상하이', 'Los Angeles': '로스앤젤레스', 'Mexico City': '멕시코시티',
+    'Saint Petersburg': '상트페테르부르크', 'Istanbul': '이스탄불', 'Singapore': '싱가포르', 'Dallas': '댈러스',
+    'San Diego': '샌디에이고', 'Melbourne': '멜버른', 'São Paulo': '상파울루', 'Bengaluru': '벵갈루루',
+    'Kyiv': '키이우', 'Kharkiv': '하르키우', 'Ashgabat': '아시가바트',
+}
+
+# GeoNames 이름 → 추가 검색 이름 (약칭, 옛 이름)
+WORLD_ALIASES = {
+    'Los Angeles': ['LA', 'L.A.'], 'New York City': ['NYC', 'NY'], 'Ho Chi Minh City': ['Saigon', '사이공'],
+    'Mumbai': ['Bombay', '봄베이'], 'Kolkata': ['Calcutta'], 'Chennai': ['Madras'], 'Beijing': ['Peking'],
+    'Saint Petersburg': ['St. Petersburg'], 'Kyiv': ['Kiev'], 'Yangon': ['Rangoon'],
+}
+
+
+def _world_display_name(city: Dict, hangul_names: List[str]) -> str:
+    """해외 도시 표시 이름 (표준 표기 → GeoNames 의 '○○ 시' 표기 → 가장 짧은 한글 이름 → 영문 이름)"""
+    if city['name'] in WORLD_EXONYMS:
+        return WORLD_EXONYMS[city['name']]
+    # '톈진 시'/'천진' 처럼 ' 시' 가 붙은 쪽이 외래어 표기법 표기인 경우가 대부분
+    spaced = [name[:-2] for name in hangul_names if name.endswith(' 시')]
+    if spaced:
+        return spaced[0]
+    return min(hangul_names, key=len) if hangul_names else city['name']
+
+
+def _korean_kind(name: str) -> int:
+    """시군구 이름의 끝 글자 → 지명 종류"""
+    return {'시': KIND_CITY, '군': KIND_COUNTY, '구': KIND_DISTRICT}[name[-1]]
+
+
+def load_korean_places(source: str = GAZETTEER_SOURCE_PATH) -> List[Dict]:
+    """한국 시도/시군구/일반구 CSV → 지명 목록 (파일 순서, parent 는 목록 내 번호)"""
+    places = []
+    index = {}  # (시도, 시군구, 구) → 번호
+
+    with open(source, encoding='utf-8') as fh:
+        rows = csv.DictReader(line for line in fh if not line.startswith('#'))
+        for row in rows:
+            sido, sigungu, gu = row['sido'], row['sigungu'], row['gu']
+            aliases = [alias for alias in row['aliases'].split('|') if alias]
+
+            if gu:
+                name, parent, kind = gu, index[(sido, sigungu, '')], KIND_DISTRICT
+            elif sigungu:
+                name, parent, kind = sigungu, index[(sido, '', '')], _korean_kind(sigungu)
+            else:
+                name, parent, kind = sido, None, KIND_PROVINCE
+
+            # 상위 지명을 붙인 이름도 검색 키로 등록 (부산 중구, 경남 고성군, 수원시 장안구)
+            keys = [name] + aliases
+            if parent is not None:
+                keys += [f"{parent_key} {key}" for parent_key in places[parent]['keys'] for key in [name] + aliases]
+
+            index[(sido, sigungu, gu)] = len(places)
+            places.append({
+                'name': name, 'latitude': float(row['latitude']), 'longitude': float(row['longitude']),
+                'country': 'KR', 'kind': kind, 'parent': parent, 'population': 0, 'keys': keys,
+            })
+
+    return places
+
+
+def load_world_places(min_population: int = 1_000_000, kp_min_population: int = 100_000) -> List[Dict]:
+    """GeoNames(geonamescache) 도시 목록 → 북한 주요 도시 + 세계 주요 도시 (한국은 CSV 사용)"""
+    try:
+        import geonamescache
+    except ImportError:
+        raise RuntimeError("지명 사전 생성에는 geonamescache 가 필요합니다: pip install geonamescache==3.0.2") from None
+
+    places = []
+    for city in geonamescache.GeonamesCache().get_cities().values():
+        country = city['countrycode']
+        hangul_names = [name for name in city['alternatenames'] if _HANGUL.search(name)]
+        if country == 'KR':
+            continue
+        if country == 'KP':
+            if city['population'] < kp_min_population or not hangul_names:
+                continue
+        elif city['population'] < min_population:
+            continue
+
+        name = _world_display_name(city, hangul_names)
+        places.append({
+            'name': name,
+            'latitude': float(city['latitude']), 'longitude': float(city['longitude']),
+            'country': country, 'kind': KIND_CITY, 'parent': None,
+            'population': int(city['population']),
+            'keys': [city['name'], name] + hangul_names + WORLD_ALIASES.get(city['name'], []),
+        })
+
+    return places
+
+
+def compute_gazetteer_places(source: str = GAZETTEER_SOURCE_PATH, min_population: int = 1_000_000) -> List[Dict]:
+    """지명 사전용 목록 (우선순위 순: 국내 광역 → 시 → 군 → 구, 이어서 해외 인구순)"""
+    korean = load_korean_places(source)
+    world = load_world_places(min_population)
+
+    order = sorted(range(len(korean)), key=lambda i: korean[i]['kind'])
+    world.sort(key=lambda place: -place['population'])
+
+    remap = {old: new for new, old in enumerate(order)}
+    places = []
+    for old in order:
+        place = dict(korean[old])
+        if place['parent'] is not None:
+            place['parent'] = remap[place['parent']]
+        places.append(place)
+    return places + world
+
+
+def build_gazetteer(path: str = GAZETTEER_PATH, source: str = GAZETTEER_SOURCE_PATH,
+                    min_population: int = 1_000_000) -> str:
+    """오프라인 지명 사전 바이너리 생성"""
+    places = compute_gazetteer_places(source, min_population)
+    write_gazetteer(path, places)
+    korean = sum(1 for place in places if place['country'] == 'KR')
+    print(f"💾 지명 사전 저장: {path} (국내 {korean}곳, 해외 {len(places) - korean}곳)")
+    return path
+
+
+def build_reverse_index(path: str = REVERSE_INDEX_PATH, solar_term_table: str = SOLAR_TERM_TABLE_PATH) -> str:
+    """24절기 테이블 → 사주 역색인 바이너리 생성"""
+    table = SolarTermTable(solar_term_table)
+    n_years = table.last_year - table.first_year + 1
+    end_minute = datetime_to_minute(datetime(table.last_year + 1, 1, 1))
+    intervals = list(month_intervals(table.minutes, table.first_year, end_minute))
+    write_reverse_index(path, table.first_year, n_years, intervals)
+    print(f"💾 사주 역색인 저장: {path} ({table.first_year}~{table.last_year}년, 절기 월 {len(intervals)}개)")
+    return path
+
+
+def build_calendar_table(path: str = CALENDAR_TABLE_PATH, solar_term_table: str = SOLAR_TERM_TABLE_PATH,
+                         start_year: Optional[int] = None, end_year: Optional[int] = None) -> str:
+    """24절기 테이블 → 만세력(세운/월운/일진) 바이너리 생성 (기본: 절기 테이블 전체 범위)"""
+    table = SolarTermTable(solar_term_table)
+    start_year = table.first_year if start_year is None else start_year
+    end_year = table.last_year if end_year is None else end_year
+    if start_year < table.first_year or end_year > table.last_year:
+        raise ValueError(f"절기 테이블 범위({table.first_year}~{table.last_year}년) 밖은 만들 수 없습니다.")
+
+    first_day = (datetime(start_year, 1, 1).date() - EPOCH).days
+    n_days = (datetime(end_year + 1, 1, 1).date() - EPOCH).days - first_day
+    planes = compute_calendar_planes(table.minutes, table.first_year, first_day, n_days)
+    write_calendar_table(path, start_year, planes)
+    print(f"💾 만세력 테이블 저장: {path} ({start_year}~{end_year}년, {n_days}일)")
+    return path
+
+
+def main(argv=None):
+    """데이터 테이블 생성 CLI"""
+    parser = argparse.ArgumentParser(description="사주 계산용 오프라인 데이터 테이블 생성")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    terms_parser = subparsers.add_parser("solar-terms", help="24절기 테이블 생성 (skyfield)")
+    terms_parser.add_argument("--ephemeris", default="de440s.bsp",
+                              help="JPL 천체력 파일 (기본: de440s.bsp, 1849~2150년)")
+    terms_parser.add_argument("--start-year", type=int, default=1900)
+    terms_parser.add_argument("--end-year", type=int, default=2100)
+    terms_parser.add_argument("--output", default=SOLAR_TERM_TABLE_PATH)
+
+    lunar_parser = subparsers.add_parser("lunar", help="음력↔양력 변환 테이블 생성 (lunar_python)")
+    lunar_parser.add_argument("--start-year", type=int, default=1900)
+    lunar_parser.add_argument("--end-year", type=int, default=2100)
+    lunar_parser.add_argument("--output", default=LUNAR_TABLE_PATH)
+
+    gazetteer_parser = subparsers.add_parser("gazetteer", help="출생지 지명 사전 생성 (CSV + geonamescache)")
+    gazetteer_parser.add_argument("--source", default=GAZETTEER_SOURCE_PATH, help="한국 시군구 좌표 CSV")
+    gazetteer_parser.add_argument("--min-population", type=int, default=1_000_000,
+                                  help="포함할 해외 도시의 최소 인구 (기본: 100만)")
+    gazetteer_parser.add_argument("--output", default=GAZETTEER_PATH)
+
+    reverse_parser = subparsers.add_parser("reverse-index", help="사주 역색인 생성 (24절기 테이블 필요)")
+    reverse_parser.add_argument("--solar-terms", default=SOLAR_TERM_TABLE_PATH)
+    reverse_parser.add_argument("--output", default=REVERSE_INDEX_PATH)
+
+    calendar_parser = subparsers.add_parser("calendar", help="만세력(세운/월운/일진) 테이블 생성 (24절기 테이블 필요)")
+    calendar_parser.add_argument("--solar-terms", default=SOLAR_TERM_TABLE_PATH)
+    calendar_parser.add_argument("--start-year", type=int, default=None, help="기본: 절기 테이블 시작 연도")
+    calendar_parser.add_argument("--end-year", type=int, default=None, help="기본: 절기 테이블 마지막 연도")
+    calendar_parser.add_argument("--output", default=CALENDAR_TABLE_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "solar-terms":
+        build_solar_term_table(args.output, args.start_year, args.end_year, args.ephemeris)
+    elif args.command == "lunar":
+        build_lunar_table(args.output, args.start_year, args.end_year)
+    elif args.command == "gazetteer":
+        build_gazetteer(args.output, args.source, args.min_population)
+    elif args.command == "reverse-index":
+        build_reverse_index(args.output, args.solar_terms)
+    elif args.command == "calendar":
+        build_calendar_table(args.output, args.solar_terms, args.start_year, args.end_year)
+
+
+if __name__ == "__main__":
+    main()
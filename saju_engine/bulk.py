@@ -0,0 +1,436 @@
+# saju_engine/bulk.py
+# 대량 사주 계산 (CSV/JSONL 입력 → JSONL/CSV/Parquet 출력, 프로세스 풀, 체크포인트 재개)
+#
+# 사용법:
+#   python run_calculator.py bulk births.csv -o charts.jsonl --workers 8 --analysis
+#   python -m saju_engine.bulk births.jsonl -o charts.parquet --resume
+#
+# 입력 필드는 API 의 SajuRequest 와 같습니다 (birth_year, birth_month, birth_day, birth_hour 필수,
+# birth_minute=0, is_male=true, city=서울, is_lunar=false, is_leap_month=false) + 선택 id.
+# 행 단위 오류는 <출력>.errors.jsonl 에 줄 번호/원본과 함께 기록하고 계속 진행합니다.
+# 청크를 출력에 쓸 때마다 <출력>.checkpoint 에 처리한 입력 행 수와 출력 파일 크기를 저장하므로
+# --resume 은 마지막 체크포인트 이후 부분을 잘라내고 이어서 처리합니다.
+# Parquet 출력은 청크별 part 파일 디렉터리이며 pyarrow 가 필요합니다.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from saju_engine import events
+
+DEFAULT_CHUNK_SIZE = 5000
+FORMATS = ('jsonl', 'csv', 'parquet')
+
+# 출력 열 (CSV/Parquet 에서는 dict/list 값을 JSON 문자열로 저장)
+BASE_COLUMNS = [
+    'line', 'id', 'original_time', 'adjusted_time', 'city',
+    'year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar', 'elements',
+    'great_luck_direction', 'great_luck_start_age', 'great_luck_start_years', 'great_luck_pillars'
+]
+ANALYSIS_COLUMNS = [
+    'hidden_stems', 'ten_gods', 'element_relations', 'seasonal_balance', 'conflicts', 'branch_interactions',
+    'day_master_strength', 'day_master_score'
+]
+
+_TRUE_VALUES = {'1', 'true', 't', 'yes', 'y', 'm', 'male', '남', '남성', '남자'}
+_FALSE_VALUES = {'0', 'false', 'f', 'no', 'n', 'female', '여', '여성', '여자'}
+
+log = events.get_logger("bulk")
+
+_analyzer = None
+
+
+def _parse_bool(value, default: bool) -> bool:
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"참/거짓 값이 아닙니다: {value!r}")
+
+
+def parse_record(raw: Dict) -> Dict:
+    """입력 행 → 계산 인자 (CSV 의 문자열 값도 허용)"""
+    def integer(name, default=None):
+        value = raw.get(name)
+        if value is None or value == '':
+            if default is None:
+                raise ValueError(f"필수 필드가 없습니다: {name}")
+            return default
+        return int(value)
+
+    return {
+        'birth_year': integer('birth_year'),
+        'birth_month': integer('birth_month'),
+        'birth_day': integer('birth_day'),
+        'birth_hour': integer('birth_hour'),
+        'birth_minute': integer('birth_minute', 0),
+        'is_male': _parse_bool(raw.get('is_male'), True),
+        'city': raw.get('city') or "서울",
+        'is_lunar': _parse_bool(raw.get('is_lunar'), False),
+        'is_leap_month': _parse_bool(raw.get('is_leap_month'), False)
+    }
+
+
+def compute_row(line: int, raw: Dict, analysis: bool = False) -> Dict:
+    """입력 행 하나 → 출력 행 (사주/대운, analysis=True 면 확장 분석 포함)"""
+    from saju_calculator import calculate_solar_saju, convert_lunar_to_solar
+
+    record = parse_record(raw)
+    year, month, day = record['birth_year'], record['birth_month'], record['birth_day']
+    if record['is_lunar']:
+        year, month, day = convert_lunar_to_solar(year, month, day, record['is_leap_month'])
+        if year is None:
+            raise ValueError("음력→양력 변환에 실패했습니다.")
+
+    result = calculate_solar_saju(year, month, day, record['birth_hour'], record['birth_minute'],
+                                  male=record['is_male'], city=record['city'])
+    great_luck = result['great_luck']
+    row = {
+        'line': line,
+        'id': raw.get('id'),
+        'original_time': result['birth_info']['original_time'],
+        'adjusted_time': result['birth_info']['adjusted_time'],
+        'city': record['city'],
+        'year_pillar': result['year_pillar'],
+        'month_pillar': result['month_pillar'],
+        'day_pillar': result['day_pillar'],
+        'hour_pillar': result['hour_pillar'],
+        'elements': result['elements'],
+        'great_luck_direction': great_luck['direction'],
+        'great_luck_start_age': great_luck['start_age'],
+        'great_luck_start_years': great_luck['start_years'],
+        'great_luck_pillars': [period['pillar'] for period in great_luck['pillars']]
+    }
+
+    if analysis:
+        global _analyzer
+        from saju_analyzer.core import SajuAnalyzer, SajuData
+
+        if _analyzer is None:
+            _analyzer = SajuAnalyzer()
+        extended = _analyzer.analyze_extended_saju(SajuData(
+            year_pillar=result['year_pillar'], month_pillar=result['month_pillar'],
+            day_pillar=result['day_pillar'], hour_pillar=result['hour_pillar'],
+            birth_info=result['birth_info'], elements=result['elements'], great_luck=great_luck
+        )).to_dict()
+        row.update({column: extended[column] for column in ANALYSIS_COLUMNS})
+
+    return row
+
+
+def process_chunk(chunk: List[Tuple[int, object]], analysis: bool = False) -> Tuple[List[Dict], List[Dict]]:
+    """(줄 번호, 원본) 묶음 → (출력 행, 오류 행) - 프로세스 풀 작업 단위"""
+    rows, errors = [], []
+    for line, raw in chunk:
+        record = raw
+        try:
+            # JSONL 은 파싱도 작업 프로세스에서 수행
+            record = json.loads(raw) if isinstance(raw, str) else raw
+            if not isinstance(record, dict):
+                raise ValueError("JSON 객체가 아닙니다.")
+            rows.append(compute_row(line, record, analysis))
+        except Exception as e:
+            errors.append({
+                'line': line,
+                'id': record.get('id') if isinstance(record, dict) else None,
+                'error': f"{type(e).__name__}: {e}",
+                'record': raw.rstrip('\n') if isinstance(raw, str) else raw
+            })
+    return rows, errors
+
+
+def _init_worker(log_level: str) -> None:
+    events.configure_logging("console", log_level)
+
+
+def detect_format(path: str, default: str = 'jsonl') -> str:
+    extension = os.path.splitext(path.rstrip('/'))[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.parquet', '.pq'):
+        return 'parquet'
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    return default
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, object]]:
+    """입력 파일 → (줄 번호, 원본) - CSV 는 dict, JSONL 은 파싱 전 문자열 (빈 줄은 건너뜀)"""
+    fmt = fmt or detect_format(path)
+    if fmt == 'csv':
+        with open(path, newline='', encoding='utf-8-sig') as fh:
+            reader = csv.DictReader(fh)
+            for raw in reader:
+                yield reader.line_num, raw
+    elif fmt == 'jsonl':
+        with open(path, encoding='utf-8') as fh:
+            for line_number, line in enumerate(fh, 1):
+                if line.strip():
+                    yield line_number, line
+    else:
+        raise ValueError(f"지원하지 않는 입력 형식입니다: {fmt}")
+
+
+def _chunked(records: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _flatten(row: Dict, columns: List[str]) -> Dict:
+    """dict/list 값을 JSON 문자열로 (CSV/Parquet 용)"""
+    return {
+        column: json.dumps(row.get(column), ensure_ascii=False) if isinstance(row.get(column), (dict, list))
+        else row.get(column)
+        for column in columns
+    }
+
+
+class _JSONLWriter:
+    """JSONL 출력 (position = 파일 크기)"""
+
+    def __init__(self, path: str, position: Optional[int] = None):
+        self._fh = _open_for_resume(path, position, binary=True)
+
+    def write(self, rows: List[Dict]) -> None:
+        self._fh.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows).encode('utf-8'))
+
+    def position(self) -> int:
+        self._fh.flush()
+        return self._fh.tell()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _CSVWriter:
+    """CSV 출력 (처음 시작할 때만 헤더, position = 파일 크기)"""
+
+    def __init__(self, path: str, columns: List[str], position: Optional[int] = None):
+        self._columns = columns
+        self._fh = _open_for_resume(path, position, binary=False)
+        self._writer = csv.DictWriter(self._fh, fieldnames=columns)
+        if position is None:
+            self._writer.writeheader()
+
+    def write(self, rows: List[Dict]) -> None:
+        self._writer.writerows(_flatten(row, self._columns) for row in rows)
+
+    def position(self) -> int:
+        self._fh.flush()
+        return os.fstat(self._fh.fileno()).st_size
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _ParquetWriter:
+    """Parquet part 파일 디렉터리 출력 (청크마다 part-NNNNNN.parquet, position = part 수)"""
+
+    def __init__(self, path: str, columns: List[str], position: Optional[int] = None):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet 출력에는 pyarrow 가 필요합니다: pip install pyarrow") from None
+
+        self._pa, self._pq = pa, pq
+        self._path, self._columns = path, columns
+        self._parts = position or 0
+        os.makedirs(path, exist_ok=True)
+        # 마지막 체크포인트 이후에 쓰인 part 는 삭제
+        for name in os.listdir(path):
+            if name.startswith('part-') and name.endswith('.parquet') and int(name[5:11]) >= self._parts:
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows: List[Dict]) -> None:
+        if not rows:
+            return
+        table = self._pa.Table.from_pylist([_flatten(row, self._columns) for row in rows])
+        self._pq.write_table(table, os.path.join(self._path, f"part-{self._parts:06d}.parquet"))
+        self._parts += 1
+
+    def position(self) -> int:
+        return self._parts
+
+    def close(self) -> None:
+        pass
+
+
+def _open_for_resume(path: str, position: Optional[int], binary: bool):
+    """position 이 있으면 그 크기로 잘라낸 뒤 이어 쓰기, 없으면 새로 쓰기"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    if position is None:
+        return open(path, 'wb') if binary else open(path, 'w', newline='', encoding='utf-8')
+    with open(path, 'ab') as fh:
+        fh.truncate(position)
+    return open(path, 'ab') if binary else open(path, 'a', newline='', encoding='utf-8')
+
+
+def _load_checkpoint(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def _save_checkpoint(path: str, state: Dict) -> None:
+    """원자적 저장 (임시 파일 작성 후 교체)"""
+    state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+    temporary = path + '.tmp'
+    with open(temporary, 'w', encoding='utf-8') as fh:
+        json.dump(state, fh, ensure_ascii=False)
+    os.replace(temporary, path)
+
+
+def _ordered_results(chunks: Iterator[List], analysis: bool, workers: int,
+                     log_level: str) -> Iterator[Tuple[int, Tuple[List[Dict], List[Dict]]]]:
+    """청크 결과를 입력 순서대로 생성 (프로세스 풀에 최대 workers × 2 청크만 대기)"""
+    if workers <= 1:
+        for chunk in chunks:
+            yield len(chunk), process_chunk(chunk, analysis)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(log_level,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), executor.submit(process_chunk, chunk, analysis)))
+            if len(pending) >= workers * 2:
+                size, future = pending.popleft()
+                yield size, future.result()
+        while pending:
+            size, future = pending.popleft()
+            yield size, future.result()
+
+
+def run_bulk(input_path: str, output_path: str, input_format: Optional[str] = None,
+             output_format: Optional[str] = None, workers: Optional[int] = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE, analysis: bool = False, resume: bool = False,
+             errors_path: Optional[str] = None, progress_interval: float = 10.0,
+             log_level: str = "WARNING") -> Dict:
+    """대량 계산 실행 → 통계 dict (rows, errors, elapsed, rows_per_second)"""
+    input_format = input_format or detect_format(input_path)
+    output_format = output_format or detect_format(output_path)
+    if output_format not in FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+    workers = workers or os.cpu_count() or 1
+    errors_path = errors_path or output_path.rstrip('/') + '.errors.jsonl'
+    checkpoint_path = output_path.rstrip('/') + '.checkpoint'
+    columns = BASE_COLUMNS + (ANALYSIS_COLUMNS if analysis else [])
+
+    state = _load_checkpoint(checkpoint_path) if resume else None
+    if state is not None:
+        if state['input'] != os.path.abspath(input_path) or state['format'] != output_format \
+                or state['analysis'] != analysis:
+            raise ValueError(f"체크포인트가 다른 작업의 것입니다: {checkpoint_path}")
+        print(f"🔁 {state['rows_done']:,}행 처리 지점부터 이어서 계산합니다.")
+    else:
+        state = {
+            'input': os.path.abspath(input_path), 'format': output_format, 'analysis': analysis,
+            'rows_done': 0, 'rows_written': 0, 'errors': 0, 'output_position': None, 'errors_position': None
+        }
+
+    if output_format == 'jsonl':
+        writer = _JSONLWriter(output_path, state['output_position'])
+    elif output_format == 'csv':
+        writer = _CSVWriter(output_path, columns, state['output_position'])
+    else:
+        writer = _ParquetWriter(output_path, columns, state['output_position'])
+    error_writer = _JSONLWriter(errors_path, state['errors_position'])
+
+    events.configure_logging("console", log_level)
+    records = islice(read_records(input_path, input_format), state['rows_done'], None)
+
+    started = last_report = time.perf_counter()
+    processed = 0
+    try:
+        for size, (rows, errors) in _ordered_results(_chunked(records, chunk_size), analysis, workers, log_level):
+            writer.write(rows)
+            error_writer.write(errors)
+            processed += size
+            state.update(
+                rows_done=state['rows_done'] + size,
+                rows_written=state['rows_written'] + len(rows),
+                errors=state['errors'] + len(errors),
+                output_position=writer.position(),
+                errors_position=error_writer.position()
+            )
+            _save_checkpoint(checkpoint_path, state)
+
+            now = time.perf_counter()
+            if now - last_report >= progress_interval:
+                last_report = now
+                print(f"⏳ {state['rows_done']:,}행 처리 ({processed / (now - started):,.0f}행/초, 오류 {state['errors']:,}건)")
+    finally:
+        writer.close()
+        error_writer.close()
+
+    elapsed = time.perf_counter() - started
+    state['completed'] = True
+    _save_checkpoint(checkpoint_path, state)
+
+    stats = {
+        'rows': processed,
+        'rows_total': state['rows_done'],
+        'written': state['rows_written'],
+        'errors': state['errors'],
+        'elapsed': round(elapsed, 3),
+        'rows_per_second': round(processed / elapsed, 1) if elapsed > 0 else None,
+        'workers': workers
+    }
+    events.info(log, "bulk.completed", "대량 계산 완료: {rows}행 ({rows_per_second}행/초)", **stats)
+    return stats
+
+
+def main(argv=None) -> int:
+    """대량 계산 CLI"""
+    parser = argparse.ArgumentParser(description="CSV/JSONL 출생 정보 → 사주 대량 계산")
+    parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("-o", "--output", required=True, help="출력 경로 (.jsonl, .csv, .parquet 디렉터리)")
+    parser.add_argument("--input-format", choices=('csv', 'jsonl'), help="기본: 확장자로 판단")
+    parser.add_argument("--output-format", choices=FORMATS, help="기본: 확장자로 판단")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 1 이면 풀 없이 실행)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="작업/체크포인트 단위 행 수")
+    parser.add_argument("--analysis", action="store_true", help="확장 분석(십신, 지장간, 형충파해 등) 포함")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 이어서 처리")
+    parser.add_argument("--errors", default=None, help="행 오류 JSONL 경로 (기본: <출력>.errors.jsonl)")
+    parser.add_argument("--progress-interval", type=float, default=10.0, help="진행 상황 출력 간격(초)")
+    parser.add_argument("--log-level", default=os.getenv("SAJU_LOG_LEVEL", "WARNING"))
+    args = parser.parse_args(argv)
+
+    print(f"🚀 대량 사주 계산: {args.input} → {args.output}")
+    try:
+        stats = run_bulk(
+            args.input, args.output, input_format=args.input_format, output_format=args.output_format,
+            workers=args.workers, chunk_size=args.chunk_size, analysis=args.analysis, resume=args.resume,
+            errors_path=args.errors, progress_interval=args.progress_interval, log_level=args.log_level
+        )
+    except KeyboardInterrupt:
+        print("\n⏸️  중단되었습니다. 같은 명령에 --resume 을 붙이면 마지막 체크포인트부터 이어서 계산합니다.")
+        return 130
+
+    print(f"📊 {stats['rows']:,}행 처리 (누적 {stats['rows_total']:,}행), 출력 {stats['written']:,}행, "
+          f"오류 {stats['errors']:,}건")
+    print(f"⏱️  {stats['elapsed']:.1f}초, {stats['rows_per_second'] or 0:,.0f}행/초 (프로세스 {stats['workers']}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
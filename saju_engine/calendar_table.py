@@ -0,0 +1,180 @@
+# saju_engine/calendar_table.py
+# 만세력 테이블: 날짜별 세운(연주)/월운(월주)/일진(일주) 육십갑자 인덱스 (mmap 로드)
+#
+# 날짜는 KST 양력 날짜이고, 절입이 있는 날은 그날부터 새 월주/연주로 봅니다 (만세력 표기와 같음).
+# 값은 그날 23:59 의 간지이며 시간 조정(경도/써머타임)은 적용하지 않습니다.
+#
+# 파일 형식 (little-endian):
+#   헤더 16바이트: magic(4s) 'SJCL', version(H), first_year(H), n_days(I), 예약(4)
+#   uint8[n_days] × 4 평면 - 연주, 월주, 일주 육십갑자 인덱스, 절입 표시(그날 시작하는 절기 번호 + 1, 없으면 0)
+# 평면별로 연속 저장하므로 기간 조회는 파싱 없이 memoryview 슬라이스로 끝납니다.
+# 테이블은 `python -m saju_engine.build calendar` 로 생성합니다 (24절기 테이블 필요).
+
+import bisect
+import mmap
+import os
+import struct
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from saju_engine import events
+from saju_engine.sexagenary import month_stem_for, pillar_name, sexagenary_index
+from saju_engine.solar_terms import TERMS_PER_YEAR, TERM_NAMES
+
+CALENDAR_TABLE_PATH = os.getenv(
+    "SAJU_CALENDAR_TABLE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "calendar.bin")
+)
+
+# 경과 일수의 기준점 (solar_terms 의 경과 분과 같은 1900-01-01)
+EPOCH = date(1900, 1, 1)
+
+_MAGIC = b'SJCL'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHI4x')
+_PLANES = ('year', 'month', 'day', 'term')
+
+_MINUTES_PER_DAY = 1440
+_EPOCH_JD = 2415021  # 1900-01-01 의 율리우스일
+
+
+def compute_calendar_planes(term_minutes: Sequence[int], first_year: int,
+                            first_day: int, n_days: int) -> Tuple[bytes, bytes, bytes, bytes]:
+    """절기 테이블 → (연주, 월주, 일주, 절입 표시) uint8 평면
+
+    first_day: 첫 날짜의 경과 일수, n_days: 날짜 수 (절기 테이블 범위 안이어야 함)
+    """
+    year_plane, month_plane = bytearray(n_days), bytearray(n_days)
+    day_plane, term_plane = bytearray(n_days), bytearray(n_days)
+
+    for i in range(n_days):
+        days = first_day + i
+        day_start, day_end = days * _MINUTES_PER_DAY, (days + 1) * _MINUTES_PER_DAY
+
+        # 그날 마지막 분에 유효한 절기, 테이블 첫 소한 이전은 전년도 대설(子월)
+        k = bisect.bisect_left(term_minutes, day_end) - 1
+        if k < 0:
+            k = -2
+        term_year, term_pos = first_year + k // TERMS_PER_YEAR, k % TERMS_PER_YEAR
+        saju_year = term_year if term_pos >= 2 else term_year - 1
+        month_branch = (((term_pos - 2) // 2) % 12 + 2) % 12
+        year_stem, year_branch = (saju_year - 4) % 10, (saju_year - 4) % 12
+
+        year_plane[i] = sexagenary_index(year_stem, year_branch)
+        month_plane[i] = sexagenary_index(month_stem_for(year_stem, month_branch), month_branch)
+        day_plane[i] = (_EPOCH_JD + days + 49) % 60
+        if k >= 0 and term_minutes[k] >= day_start:
+            term_plane[i] = term_pos + 1
+
+    return bytes(year_plane), bytes(month_plane), bytes(day_plane), bytes(term_plane)
+
+
+def write_calendar_table(path: str, first_year: int, planes: Sequence[bytes]) -> None:
+    """(연주, 월주, 일주, 절입 표시) 평면을 바이너리 테이블로 저장"""
+    n_days = len(planes[0])
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, first_year, n_days))
+        for plane in planes:
+            fh.write(plane)
+
+
+class CalendarSlice(NamedTuple):
+    """기간 조회 결과: start 날짜부터의 평면별 memoryview (육십갑자 인덱스)"""
+    start: date
+    year: memoryview
+    month: memoryview
+    day: memoryview
+    term: memoryview
+
+    def __len__(self):
+        return len(self.day)
+
+    def rows(self) -> Iterator[Dict]:
+        """날짜별 dict (달력 위젯 등 표시용)"""
+        for i in range(len(self.day)):
+            term = self.term[i]
+            yield {
+                'date': (self.start + timedelta(days=i)).isoformat(),
+                'year_pillar': pillar_name(self.year[i]),
+                'month_pillar': pillar_name(self.month[i]),
+                'day_pillar': pillar_name(self.day[i]),
+                'solar_term': TERM_NAMES[term - 1] if term else None
+            }
+
+
+class CalendarTable:
+    """mmap 기반 만세력 테이블"""
+
+    def __init__(self, path: str = CALENDAR_TABLE_PATH):
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, first_year, n_days = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"지원하지 않는 만세력 테이블 형식입니다: {path}")
+
+        self.path = path
+        self.first_date = date(first_year, 1, 1)
+        self.last_date = self.first_date + timedelta(days=n_days - 1)
+        self.n_days = n_days
+
+        body = memoryview(self._mmap)[_HEADER.size:_HEADER.size + 4 * n_days]
+        self._planes = {name: body[i * n_days:(i + 1) * n_days] for i, name in enumerate(_PLANES)}
+
+    def covers(self, day: date) -> bool:
+        """날짜가 테이블 범위 안인지"""
+        return self.first_date <= day <= self.last_date
+
+    def pillars_for_range(self, start: date, end: date) -> CalendarSlice:
+        """[start, end] 기간의 평면 슬라이스 (범위 밖은 잘라냄, 복사 없음)"""
+        lo = max((start - self.first_date).days, 0)
+        hi = min((end - self.first_date).days + 1, self.n_days)
+        hi = max(hi, lo)
+        return CalendarSlice(self.first_date + timedelta(days=lo),
+                             *(self._planes[name][lo:hi] for name in _PLANES))
+
+    def pillars(self, day: date) -> Optional[Dict]:
+        """하루의 세운/월운/일진 (범위 밖이면 None)"""
+        if not self.covers(day):
+            return None
+        return next(self.pillars_for_range(day, day).rows())
+
+    def year_pillar(self, year: int) -> Optional[str]:
+        """양력 연도의 세운 (입춘 이후인 7월 1일 기준)"""
+        day = date(year, 7, 1)
+        if not self.covers(day):
+            return None
+        return pillar_name(self._planes['year'][(day - self.first_date).days])
+
+    def month_transitions(self, start: date, end: date) -> List[Dict]:
+        """기간 안의 월운 목록 (시작일, 월주, 연주) - 첫 항목은 start 시점의 월운"""
+        view = self.pillars_for_range(start, end)
+        transitions = []
+        for i in range(len(view)):
+            if i == 0 or view.month[i] != view.month[i - 1]:
+                transitions.append({
+                    'start_date': (view.start + timedelta(days=i)).isoformat(),
+                    'month_pillar': pillar_name(view.month[i]),
+                    'year_pillar': pillar_name(view.year[i])
+                })
+        return transitions
+
+
+log = events.get_logger("calendar_table")
+
+_table = None
+_table_loaded = False
+
+
+def get_calendar_table() -> Optional[CalendarTable]:
+    """프로세스 공용 만세력 테이블 (파일이 없으면 None)"""
+    global _table, _table_loaded
+
+    if not _table_loaded:
+        _table_loaded = True
+        if os.path.exists(CALENDAR_TABLE_PATH):
+            _table = CalendarTable(CALENDAR_TABLE_PATH)
+        else:
+            events.warning(log, "calendar.table_missing", "만세력 테이블이 없습니다: {path}", path=CALENDAR_TABLE_PATH)
+    return _table
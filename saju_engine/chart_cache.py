@@ -0,0 +1,83 @@
+# saju_engine/chart_cache.py
+# 사주 원국 계산 결과 메모이제이션 (프로세스 내 LRU)
+#
+# 키는 (조정된 출생 시각의 분, 성별) 입니다. 도시/써머타임/절입조정은 모두 조정된 시각에 반영되므로
+# 쌍둥이, 재시도, 같은 프로필의 중복 저장은 물론 다른 입력이라도 같은 분으로 조정되면 결과를 공유합니다.
+# 시간 조정 규칙이 바뀌면(TIME_RULES.register_rule) 자동으로 비워지고, 절기 테이블 교체 등
+# 그 밖의 변경은 invalidate_chart_cache() 로 직접 비웁니다.
+#
+# 환경 변수:
+#   SAJU_CHART_CACHE_SIZE  최대 항목 수 (기본: 4096, 0 이면 캐시 사용 안 함)
+
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from saju_engine import events
+from saju_engine.kasi_cache import MemoryLRUCache
+from saju_engine.time_rules import TIME_RULES
+
+DEFAULT_CHART_CACHE_SIZE = 4096
+
+log = events.get_logger("chart_cache")
+
+
+class ChartCache:
+    """사주 원국 결과 LRU (max_entries=0 이면 항상 새로 계산)"""
+
+    def __init__(self, max_entries: int = DEFAULT_CHART_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.invalidations = 0
+        self._lru = MemoryLRUCache(max_entries, default_ttl=None) if max_entries > 0 else None
+
+    @staticmethod
+    def key(adjusted_minute: int, male: bool) -> Hashable:
+        return adjusted_minute, bool(male)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """캐시 조회, 없으면 compute() 결과를 저장 후 반환 (반환값은 공유 객체이므로 수정 금지)"""
+        if self._lru is None:
+            return compute()
+
+        value = self._lru.get(key)
+        if value is None:
+            value = compute()
+            self._lru.set(key, value)
+        return value
+
+    def invalidate(self, reason: str = "manual") -> None:
+        """전체 무효화"""
+        if self._lru is not None:
+            self._lru.clear()
+        self.invalidations += 1
+        events.info(log, "chart_cache.invalidated", "사주 계산 캐시 초기화: {reason}", reason=reason)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit_rate 포함)"""
+        if self._lru is None:
+            return {'enabled': False, 'invalidations': self.invalidations}
+        stats = self._lru.stats()
+        stats.update({'enabled': True, 'max_entries': self.max_entries, 'invalidations': self.invalidations})
+        return stats
+
+
+_chart_cache: Optional[ChartCache] = None
+_chart_cache_lock = threading.Lock()
+
+
+def get_chart_cache() -> ChartCache:
+    """프로세스 공용 사주 계산 캐시 (최초 사용 시 생성, 규칙 변경 시 자동 무효화)"""
+    global _chart_cache
+
+    if _chart_cache is None:
+        with _chart_cache_lock:
+            if _chart_cache is None:
+                cache = ChartCache(int(os.getenv("SAJU_CHART_CACHE_SIZE", DEFAULT_CHART_CACHE_SIZE)))
+                TIME_RULES.add_listener(lambda engine: cache.invalidate("time_rules"))
+                _chart_cache = cache
+    return _chart_cache
+
+
+def invalidate_chart_cache(reason: str = "manual") -> None:
+    """공용 사주 계산 캐시 무효화 (절기/규칙 테이블 교체 후 호출)"""
+    get_chart_cache().invalidate(reason)
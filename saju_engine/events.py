@@ -0,0 +1,135 @@
+# saju_engine/events.py
+# 구조화 이벤트 로깅 (표준 logging 기반, 비활성화 시 비용 없음)
+#
+# 각 이벤트는 이름(event)과 기계 판독용 필드(fields)를 가지며, 사람이 읽는 메시지는
+# 출력될 때만 템플릿에서 만들어집니다. 기본 상태는 NullHandler 라서 아무것도 출력하지 않고,
+# configure_logging() 으로 콘솔 렌더러(CLI) 또는 JSON 한 줄 형식(서버)을 붙입니다.
+#
+# 환경 변수:
+#   SAJU_LOG_FORMAT  console(기본) | json
+#   SAJU_LOG_LEVEL   DEBUG | INFO | WARNING(기본) | ERROR
+
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from logging import DEBUG, ERROR, INFO, WARNING  # noqa: F401  (호출부 편의용 재노출)
+
+LOGGER_NAME = "saju"
+
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+def get_logger(name: str) -> logging.Logger:
+    """saju 하위 로거 (예: get_logger("calculator") → saju.calculator)"""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+class EventMessage:
+    """출력 시점에만 템플릿을 채우는 지연 메시지"""
+
+    __slots__ = ('template', 'fields')
+
+    def __init__(self, template: str, fields: Dict[str, Any]):
+        self.template = template
+        self.fields = fields
+
+    def __str__(self) -> str:
+        try:
+            return self.template.format(**self.fields)
+        except (KeyError, IndexError, ValueError):
+            return self.template
+
+
+def emit(logger: logging.Logger, level: int, event: str, message: str = "", **fields) -> None:
+    """이벤트 기록 (레벨이 꺼져 있으면 레코드를 만들지 않음)"""
+    if logger.isEnabledFor(level):
+        logger.log(level, EventMessage(message or event, fields),
+                   extra={'event': event, 'fields': fields})
+
+
+def debug(logger: logging.Logger, event: str, message: str = "", **fields) -> None:
+    emit(logger, DEBUG, event, message, **fields)
+
+
+def info(logger: logging.Logger, event: str, message: str = "", **fields) -> None:
+    emit(logger, INFO, event, message, **fields)
+
+
+def warning(logger: logging.Logger, event: str, message: str = "", **fields) -> None:
+    emit(logger, WARNING, event, message, **fields)
+
+
+def error(logger: logging.Logger, event: str, message: str = "", **fields) -> None:
+    emit(logger, ERROR, event, message, **fields)
+
+
+def exception(logger: logging.Logger, event: str, message: str = "", **fields) -> None:
+    """ERROR 이벤트 + 현재 처리 중인 예외의 traceback (except 블록 안에서 호출)"""
+    if logger.isEnabledFor(ERROR):
+        logger.error(EventMessage(message or event, fields), exc_info=True,
+                     extra={'event': event, 'fields': fields})
+
+
+class JSONFormatter(logging.Formatter):
+    """이벤트 → JSON 한 줄 (로그 수집기용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'event': getattr(record, 'event', None),
+            'message': record.getMessage()
+        }
+        payload.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class ConsoleRenderer(logging.Formatter):
+    """이벤트 → 사람이 읽는 한 줄 (CLI 출력용)"""
+
+    LEVEL_PREFIXES = {
+        DEBUG: "🔍 ",
+        WARNING: "⚠️  ",
+        ERROR: "❌ ",
+        logging.CRITICAL: "❌ "
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = self.LEVEL_PREFIXES.get(record.levelno, "") + record.getMessage()
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+
+_handler = None
+
+
+def configure_logging(fmt: Optional[str] = None, level: Optional[str] = None, stream=None) -> logging.Handler:
+    """saju 로거에 출력 핸들러 연결 (여러 번 호출하면 기존 핸들러 교체)"""
+    global _handler
+
+    fmt = (fmt or os.getenv("SAJU_LOG_FORMAT", "console")).lower()
+    level = (level or os.getenv("SAJU_LOG_LEVEL", "WARNING")).upper()
+
+    root = logging.getLogger(LOGGER_NAME)
+    if _handler is not None:
+        root.removeHandler(_handler)
+
+    if fmt == "json":
+        _handler = logging.StreamHandler(stream or sys.stderr)
+        _handler.setFormatter(JSONFormatter())
+    else:
+        _handler = logging.StreamHandler(stream or sys.stdout)
+        _handler.setFormatter(ConsoleRenderer())
+
+    root.addHandler(_handler)
+    root.setLevel(level)
+    root.propagate = False
+    return _handler
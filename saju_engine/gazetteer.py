@@ -0,0 +1,346 @@
+# saju_engine/gazetteer.py
+# 오프라인 지명 사전 (출생지 → 좌표, mmap 로드)
+#
+# 한국 시도/시군구/일반구 + 북한 주요 도시 + 세계 주요 도시(인구 100만 이상)의 좌표를 담고,
+# - 이름 조회: 한글/로마자 정규화(NFC, 공백, 행정구역 접미사 제거) 후 해시 조회
+# - 접두어 검색: 정렬된 정규화 이름 목록에서 bisect
+# - 최근접 지명: 단위 구면 벡터의 암시적 KD-tree (파일에 트리 순서로 저장)
+#
+# 파일 형식 (little-endian, 각 구역은 8바이트 정렬):
+#   헤더 16바이트: magic(4s) 'SJGZ', version(H), 예약(H), n_places(I), n_keys(I)
+#   float64[n] latitude, float64[n] longitude, int32[n] parent(-1 = 없음), uint32[n] population,
+#   uint8[n] kind, 2s[n] country, uint32[n+1] name_offsets + UTF-8 이름,
+#   uint32[n_keys+1] key_offsets + UTF-8 정규화 이름(정렬), uint32[n_keys] key_place,
+#   uint32[n] kd_order, float64[n][3] kd_xyz
+# 지명은 우선순위 순서(국내 → 광역 단위 → 인구)로 저장되어, 같은 이름이면 번호가 작은 쪽이 우선입니다.
+# 좌표/이름/트리는 mmap 으로 워커 간 공유되고, 프로세스별로는 이름 → 번호 해시만 만듭니다.
+# 사전은 `python -m saju_engine.build gazetteer` 로 생성합니다.
+
+import bisect
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import unicodedata
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from saju_engine import events
+
+GAZETTEER_PATH = os.getenv(
+    "SAJU_GAZETTEER",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer.bin")
+)
+
+# 지명 종류
+KIND_PROVINCE = 0   # 특별시/광역시/도 (해외는 사용하지 않음)
+KIND_CITY = 1       # 시 (해외 도시 포함)
+KIND_COUNTY = 2     # 군
+KIND_DISTRICT = 3   # 구
+
+# 출생 시각이 한국 표준시 기준으로 기록되는 국가 (경도 조정 대상)
+KST_COUNTRIES = ('KR', 'KP')
+
+EARTH_RADIUS_KM = 6371.0
+
+_MAGIC = b'SJGZ'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHII')
+
+# 긴 접미사부터 제거 (서울특별시 → 서울, 수원시 → 수원, 강남구 → 강남)
+_SUFFIXES = ('특별자치시', '특별자치도', '특별시', '광역시', '시', '군', '구', '도')
+# 첫 토큰 뒤에 단독으로 오면 버리는 행정구역 단어 (오사카 시, Gangnam-gu, New York City, Busan Metropolitan City)
+_SUFFIX_TOKENS = frozenset(_SUFFIXES + ('si', 'gun', 'gu', 'do', 'city', 'county', 'district', 'province',
+                                        'metropolitan', 'special', 'self', 'governing'))
+_SEPARATORS = re.compile(r"[\s\-_.,·/()]+")
+_DROPPED = re.compile(r"[’'`ʼ]")
+
+
+def _strip_suffix(token: str) -> str:
+    for suffix in _SUFFIXES:
+        # 접미사를 떼고 두 글자 이상 남을 때만 (중구, 남구 등은 그대로)
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            return token[:-len(suffix)]
+    return token
+
+
+@lru_cache(maxsize=4096)
+def normalize_place_name(text: str) -> str:
+    """지명 정규화 (NFC, 소문자, 발음 기호/구두점 제거, 토큰별 행정구역 접미사 제거) - 최근 입력은 캐시"""
+    # NFKD 로 라틴 발음 기호를 떼어낸 뒤 NFC 로 한글 음절 재조합
+    text = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+    text = _DROPPED.sub('', unicodedata.normalize('NFC', text).lower())
+    tokens = [token for token in _SEPARATORS.split(text) if token]
+    tokens = tokens[:1] + [token for token in tokens[1:] if token not in _SUFFIX_TOKENS]
+    return ' '.join(_strip_suffix(token) for token in tokens)
+
+
+class Place(NamedTuple):
+    """지명 조회 결과"""
+    name: str
+    latitude: float
+    longitude: float
+    country: str
+    kind: int
+    parent: Optional[str] = None
+    population: int = 0
+
+    @property
+    def full_name(self) -> str:
+        """상위 행정구역을 포함한 이름 (예: 부산광역시 중구)"""
+        return f"{self.parent} {self.name}" if self.parent else self.name
+
+
+def _unit_vector(latitude: float, longitude: float):
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    return math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat)
+
+
+def _kd_order(points: Sequence[Sequence[float]]) -> List[int]:
+    """점 목록 → 암시적 KD-tree 순서 (구간 [lo, hi) 의 중앙 (lo+hi)//2 가 노드, 축은 깊이 % 3)"""
+    order = list(range(len(points)))
+
+    def build(lo: int, hi: int, depth: int) -> None:
+        if hi - lo <= 1:
+            return
+        axis = depth % 3
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: points[i][axis])
+        mid = (lo + hi) // 2
+        build(lo, mid, depth + 1)
+        build(mid + 1, hi, depth + 1)
+
+    build(0, len(order), 0)
+    return order
+
+
+def _pack_strings(strings: Iterable[str]):
+    """문자열 목록 → (uint32 오프셋 배열, UTF-8 바이트)"""
+    offsets = array('I', [0])
+    blob = bytearray()
+    for s in strings:
+        blob += s.encode('utf-8')
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def write_gazetteer(path: str, places: Sequence[Dict]) -> None:
+    """지명 목록을 바이너리 사전으로 저장
+
+    places 는 우선순위 순서의 dict 목록이며 각 항목은
+    name, latitude, longitude, country, kind, parent(상위 지명 번호 또는 None), population,
+    keys(정규화 전 검색 이름 목록) 를 가집니다.
+    """
+    n = len(places)
+    keys = sorted({(normalize_place_name(key), i)
+                   for i, place in enumerate(places) for key in place['keys']
+                   if normalize_place_name(key)})
+
+    points = [_unit_vector(p['latitude'], p['longitude']) for p in places]
+    kd_order = _kd_order(points)
+
+    name_offsets, name_blob = _pack_strings(p['name'] for p in places)
+    key_offsets, key_blob = _pack_strings(key for key, _ in keys)
+
+    sections = [
+        array('d', (p['latitude'] for p in places)),
+        array('d', (p['longitude'] for p in places)),
+        array('i', (-1 if p.get('parent') is None else p['parent'] for p in places)),
+        array('I', (p.get('population', 0) for p in places)),
+        array('B', (p['kind'] for p in places)),
+        b''.join(p['country'].encode('ascii')[:2].ljust(2) for p in places),
+        name_offsets, name_blob,
+        key_offsets, key_blob,
+        array('I', (i for _, i in keys)),
+        array('I', kd_order),
+        array('d', (c for i in kd_order for c in points[i])),
+    ]
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, 0, n, len(keys)))
+        for section in sections:
+            if isinstance(section, array):
+                if sys.byteorder != 'little':
+                    section.byteswap()
+                section = section.tobytes()
+            fh.write(section)
+            fh.write(b'\0' * (-len(section) % 8))
+
+
+class Gazetteer:
+    """mmap 기반 오프라인 지명 사전"""
+
+    def __init__(self, path: str = GAZETTEER_PATH):
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, n, n_keys = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"지원하지 않는 지명 사전 형식입니다: {path}")
+
+        self.path = path
+        self._buffer = memoryview(self._mmap)
+        self._offset = _HEADER.size
+
+        self.latitudes = self._take('d', n)
+        self.longitudes = self._take('d', n)
+        self.parents = self._take('i', n)
+        self.populations = self._take('I', n)
+        self.kinds = self._take('B', n)
+        self.countries = self._take_bytes(2 * n)
+        self._name_offsets = self._take('I', n + 1)
+        self._names = self._take_bytes(self._name_offsets[n])
+        key_offsets = self._take('I', n_keys + 1)
+        key_blob = self._take_bytes(key_offsets[n_keys])
+        self._key_place = self._take('I', n_keys)
+        self._kd_order = self._take('I', n)
+        self._kd_xyz = self._take('d', 3 * n)
+
+        # 정렬된 정규화 이름 (접두어 검색) + 이름 → 지명 번호 (정확 조회, 번호가 작은 쪽 우선)
+        key_text = bytes(key_blob)
+        self._keys = [key_text[key_offsets[i]:key_offsets[i + 1]].decode('utf-8') for i in range(n_keys)]
+        self._index: Dict[str, int] = {}
+        for key, place_id in zip(self._keys, self._key_place):
+            self._index.setdefault(key, place_id)
+        for place_id in range(n):
+            self._index.setdefault(self.name(place_id), place_id)
+
+        self._places: List[Optional[Place]] = [None] * n
+
+    def _take(self, typecode: str, count: int):
+        size = array(typecode).itemsize * count
+        view = self._buffer[self._offset:self._offset + size]
+        self._offset += size + (-size % 8)
+        if sys.byteorder == 'little':
+            return view.cast(typecode)
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def _take_bytes(self, size: int) -> memoryview:
+        view = self._buffer[self._offset:self._offset + size]
+        self._offset += size + (-size % 8)
+        return view
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    def name(self, place_id: int) -> str:
+        """지명 번호 → 이름"""
+        return bytes(self._names[self._name_offsets[place_id]:self._name_offsets[place_id + 1]]).decode('utf-8')
+
+    def place(self, place_id: int) -> Place:
+        """지명 번호 → Place (한 번 만든 객체는 재사용)"""
+        place = self._places[place_id]
+        if place is None:
+            parent_id = self.parents[place_id]
+            place = Place(
+                name=self.name(place_id),
+                latitude=self.latitudes[place_id],
+                longitude=self.longitudes[place_id],
+                country=bytes(self.countries[2 * place_id:2 * place_id + 2]).decode('ascii'),
+                kind=self.kinds[place_id],
+                parent=self.name(parent_id) if parent_id >= 0 else None,
+                population=self.populations[place_id],
+            )
+            self._places[place_id] = place
+        return place
+
+    def find(self, name: str) -> Optional[int]:
+        """이름 → 지명 번호 (원문 그대로 먼저 찾고, 없으면 정규화해서 조회)"""
+        place_id = self._index.get(name)
+        if place_id is None:
+            place_id = self._index.get(normalize_place_name(name))
+        return place_id
+
+    def lookup(self, name: str) -> Optional[Place]:
+        """이름 → Place (같은 이름이 여럿이면 국내/광역 단위/인구 순 우선, '부산 중구' 처럼 상위 지명 지정 가능)"""
+        place_id = self.find(name)
+        return None if place_id is None else self.place(place_id)
+
+    def longitude(self, name: str) -> Optional[float]:
+        """이름 → 경도 (Place 를 만들지 않는 빠른 경로)"""
+        place_id = self.find(name)
+        return None if place_id is None else self.longitudes[place_id]
+
+    def search(self, prefix: str, limit: int = 10) -> List[Place]:
+        """정규화한 접두어로 시작하는 지명 (우선순위 순, 최대 limit 개)"""
+        prefix = normalize_place_name(prefix)
+        if not prefix:
+            return []
+
+        place_ids = set()
+        i = bisect.bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            place_ids.add(self._key_place[i])
+            i += 1
+        return [self.place(place_id) for place_id in sorted(place_ids)[:limit]]
+
+    def nearest(self, latitude: float, longitude: float, country: Optional[str] = None) -> Optional[Place]:
+        """좌표에서 가장 가까운 지명 (country 를 주면 해당 국가 안에서만)"""
+        place_id = self.nearest_id(latitude, longitude, country)
+        return None if place_id is None else self.place(place_id)
+
+    def nearest_id(self, latitude: float, longitude: float, country: Optional[str] = None) -> Optional[int]:
+        """좌표에서 가장 가까운 지명 번호 (KD-tree 탐색)"""
+        target = _unit_vector(latitude, longitude)
+        country_code = country.encode('ascii') if country else None
+        xyz, order, countries = self._kd_xyz, self._kd_order, self.countries
+        best = [math.inf, -1]
+
+        def visit(lo: int, hi: int, depth: int) -> None:
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            base = 3 * mid
+            dx = target[0] - xyz[base]
+            dy = target[1] - xyz[base + 1]
+            dz = target[2] - xyz[base + 2]
+            distance = dx * dx + dy * dy + dz * dz
+            if distance < best[0]:
+                place_id = order[mid]
+                if country_code is None or countries[2 * place_id:2 * place_id + 2] == country_code:
+                    best[0], best[1] = distance, place_id
+
+            diff = (dx, dy, dz)[depth % 3]
+            if diff < 0:
+                visit(lo, mid, depth + 1)
+                if diff * diff < best[0]:
+                    visit(mid + 1, hi, depth + 1)
+            else:
+                visit(mid + 1, hi, depth + 1)
+                if diff * diff < best[0]:
+                    visit(lo, mid, depth + 1)
+
+        visit(0, len(order), 0)
+        return best[1] if best[1] >= 0 else None
+
+    @staticmethod
+    def distance_km(place: Place, latitude: float, longitude: float) -> float:
+        """지명과 좌표 사이의 대권 거리 (km)"""
+        a, b = _unit_vector(place.latitude, place.longitude), _unit_vector(latitude, longitude)
+        chord = math.sqrt(sum((p - q) ** 2 for p, q in zip(a, b)))
+        return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+log = events.get_logger("gazetteer")
+
+_gazetteer = None
+_gazetteer_loaded = False
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """프로세스 공용 지명 사전 (파일이 없으면 None)"""
+    global _gazetteer, _gazetteer_loaded
+
+    if not _gazetteer_loaded:
+        _gazetteer_loaded = True
+        if os.path.exists(GAZETTEER_PATH):
+            _gazetteer = Gazetteer(GAZETTEER_PATH)
+        else:
+            events.warning(log, "gazetteer.missing", "지명 사전이 없습니다: {path} (주요 도시 경도만 사용)",
+                           path=GAZETTEER_PATH)
+    return _gazetteer
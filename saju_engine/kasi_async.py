@@ -0,0 +1,186 @@
+# saju_engine/kasi_async.py
+# KASI API 비동기 클라이언트 (aiohttp, FastAPI 이벤트 루프용)
+#
+# - 요청 단위 타임아웃, 재시도(지수 백오프 + jitter), 호스트별 동시 연결 제한
+# - 같은 키(같은 날짜/연도)의 동시 요청은 하나의 조회 작업을 공유 (request coalescing)
+# - 호출자가 취소되어도 공유 작업은 계속 진행되어 다른 대기자와 캐시에 결과를 남김
+# - SQLite 등 블로킹 캐시 조회/저장은 스레드에서 실행 (메모리 캐시만 이벤트 루프에서 바로 처리)
+
+import asyncio
+import xml.etree.ElementTree as ET
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from saju_engine import events
+from saju_engine.kasi_cache import MemoryLRUCache
+from saju_engine.kasi_client import (
+    DEFAULT_HEADERS,
+    DIVISIONS_URL,
+    DivisionsYearPages,
+    LUNAR_TO_SOLAR_URL,
+    RETRY_STATUS_CODES,
+    backoff_delay,
+    division_cache_key,
+    lunar_cache_key,
+    lunar_to_solar_params,
+    parse_solar_date_item,
+    xml_result_root,
+)
+
+log = events.get_logger("kasi")
+
+
+async def _cache_get(cache, key: str):
+    """캐시 조회 (메모리 캐시가 아니면 이벤트 루프를 막지 않도록 스레드에서)"""
+    if isinstance(cache, MemoryLRUCache):
+        return cache.get(key)
+    return await asyncio.to_thread(cache.get, key)
+
+
+async def _cache_set_many(cache, items: Dict[str, object]) -> None:
+    """여러 항목을 한 번에 캐시에 저장 (메모리 캐시가 아니면 스레드에서)"""
+    def store():
+        for key, value in items.items():
+            cache.set(key, value)
+
+    if isinstance(cache, MemoryLRUCache):
+        store()
+    else:
+        await asyncio.to_thread(store)
+
+
+class AsyncKasiClient:
+    """aiohttp 기반 KASI 클라이언트 (세션은 실행 중인 이벤트 루프에서 최초 사용 시 생성)"""
+
+    def __init__(self, pool_size: int = 10, max_per_host: int = 4, max_retries: int = 2,
+                 backoff_base: float = 0.5, backoff_max: float = 4.0, timeout: float = 5,
+                 connect_timeout: float = 3):
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+
+        self._session = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.max_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout, headers=DEFAULT_HEADERS
+            )
+        return self._session
+
+    async def _coalesce(self, key: str, factory: Callable[[], Awaitable]):
+        """같은 키의 진행 중인 조회가 있으면 그 결과를 함께 기다림"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 대기자 한 명의 취소가 공유 작업을 취소하지 않도록 shield
+        return await asyncio.shield(task)
+
+    async def get_text(self, url: str, params: Dict) -> Tuple[int, str]:
+        """GET 요청 (네트워크 오류/타임아웃/일시적 HTTP 오류 시 재시도) → (상태 코드, 본문)"""
+        session = self._get_session()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(url, params=params) as response:
+                    text = await response.text()
+                    if response.status not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                        return response.status, text
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+
+            await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+
+    async def get_xml(self, url: str, params: Dict) -> Optional[ET.Element]:
+        """GET 요청 후 정상 응답(resultCode 00)의 XML 루트 반환, 실패 시 None"""
+        status, text = await self.get_text(url, params)
+        if status != 200:
+            events.error(log, "kasi.http_error", "KASI API 호출 실패: HTTP {status}", status=status, url=url)
+            return None
+        return xml_result_root(text)
+
+    async def convert_lunar_to_solar(self, lunar_year: int, lunar_month: int, lunar_day: int,
+                                     is_leap_month: bool, service_key: str, cache) -> Optional[Tuple[int, int, int]]:
+        """음력→양력 변환 (캐시 → KASI), 실패 시 None"""
+        cache_key = lunar_cache_key(lunar_year, lunar_month, lunar_day, is_leap_month)
+        cached = await _cache_get(cache, cache_key)
+        if cached is not None:
+            events.debug(log, "kasi.cache_hit", "KASI 캐시 적중: {key}", key=cache_key)
+            return tuple(cached)
+
+        async def fetch():
+            params = lunar_to_solar_params(service_key, lunar_year, lunar_month, lunar_day, is_leap_month)
+            root = await self.get_xml(LUNAR_TO_SOLAR_URL, params)
+            item = root.find('.//item') if root is not None else None
+            solar = parse_solar_date_item(item) if item is not None else None
+            if solar is not None:
+                await _cache_set_many(cache, {cache_key: list(solar)})
+            return solar
+
+        return await self._coalesce(cache_key, fetch)
+
+    async def fetch_24_divisions_year(self, year: int, service_key: str) -> Optional[Dict[int, List[Dict]]]:
+        """1년치 24절기를 페이지 단위로 조회 → {월: [절기, ...]}, 실패 시 None"""
+        pages = DivisionsYearPages(year, service_key)
+        while True:
+            root = await self.get_xml(DIVISIONS_URL, pages.params())
+            if root is None:
+                return None
+            if not pages.add_page(root):
+                return pages.by_month
+
+    async def get_24_divisions(self, year: int, month: int, service_key: str, cache) -> List[Dict]:
+        """해당 연월의 24절기 (캐시 미스 시 1년치 조회 후 월별로 캐시)"""
+        cache_key = division_cache_key(year, month)
+        cached = await _cache_get(cache, cache_key)
+        if cached is not None:
+            events.debug(log, "kasi.cache_hit", "KASI 캐시 적중: {key}", key=cache_key)
+            return cached
+
+        async def fetch():
+            by_month = await self.fetch_24_divisions_year(year, service_key)
+            if by_month is not None:
+                await _cache_set_many(cache, {division_cache_key(year, m): terms for m, terms in by_month.items()})
+            return by_month
+
+        by_month = await self._coalesce(f"24div:{year}", fetch)
+        return by_month.get(month, []) if by_month is not None else []
+
+    async def close(self) -> None:
+        """진행 중인 조회 취소 및 연결 풀 정리"""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+_client = None
+
+
+def get_async_kasi_client() -> AsyncKasiClient:
+    """프로세스 공용 비동기 KASI 클라이언트"""
+    global _client
+
+    if _client is None:
+        _client = AsyncKasiClient()
+    return _client
+
+
+async def close_async_kasi_client() -> None:
+    """공용 비동기 클라이언트 정리 (앱 종료 시)"""
+    global _client
+
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -0,0 +1,330 @@
+# saju_engine/kasi_cache.py
+# KASI API 응답 캐시 (메모리 LRU + SQLite 영속 캐시)
+#
+# 기본 구성: 프로세스 내 LRU(앞단) → SQLite 파일(뒷단, 워커 간 공유/재시작 후 유지)
+# 환경 변수:
+#   KASI_CACHE_BACKEND       tiered(기본) | sqlite | memory
+#   KASI_CACHE_PATH          SQLite 파일 경로 (기본: ~/.saju_cache/kasi.sqlite3)
+#   KASI_CACHE_TTL           항목 유효 기간(초), 0 이면 만료 없음 (기본: 1년)
+#   KASI_CACHE_MAX_ENTRIES   SQLite 최대 항목 수 (기본: 100000, 초과분 정리는 EVICT_INTERVAL 번 쓸 때마다)
+#   KASI_CACHE_MEMORY_ENTRIES 메모리 LRU 최대 항목 수 (기본: 1024)
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from saju_engine import events
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".saju_cache", "kasi.sqlite3")
+DEFAULT_TTL = 365 * 24 * 3600
+EVICT_INTERVAL = 64     # SQLite 만료/초과 항목 정리 주기 (쓰기 횟수)
+
+log = events.get_logger("kasi_cache")
+
+
+def _encode(value: Any) -> str:
+    """캐시 값 → JSON 문자열 (datetime 지원)"""
+    def default(obj):
+        if isinstance(obj, datetime):
+            return {'__datetime__': obj.isoformat()}
+        raise TypeError(f"캐시에 저장할 수 없는 타입입니다: {type(obj)}")
+
+    return json.dumps(value, ensure_ascii=False, default=default)
+
+
+def _decode(text: str) -> Any:
+    """JSON 문자열 → 캐시 값"""
+    def object_hook(obj):
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        return obj
+
+    return json.loads(text, object_hook=object_hook)
+
+
+class CacheBackend(ABC):
+    """캐시 백엔드 기본 클래스 (hit/miss 카운터 포함)"""
+
+    def __init__(self, default_ttl: Optional[float] = DEFAULT_TTL):
+        self.default_ttl = default_ttl or None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl 미지정 시 default_ttl, 0 이면 만료 없음)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """값 삭제"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 삭제"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """항목 수"""
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """값과 만료 시각 (expires_at, 만료 없음이면 None) 조회
+
+        만료 시각을 알 수 없는 백엔드는 지금부터 default_ttl 로 간주합니다.
+        """
+        value = self.get(key)
+        return None if value is None else (value, self._expires_at(None))
+
+    def _expires_at(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = ttl if ttl is not None else self.default_ttl
+        return time.time() + ttl if ttl else None
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'backend': type(self).__name__,
+            'entries': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+class MemoryLRUCache(CacheBackend):
+    """프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[float] = DEFAULT_TTL):
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self._record(True)
+                    return value, expires_at
+                del self._data[key]
+            self._record(False)
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (self._expires_at(ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache(CacheBackend):
+    """SQLite 파일 기반 영속 캐시 (여러 워커가 같은 파일 공유)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = 100000,
+                 default_ttl: Optional[float] = DEFAULT_TTL, evict_interval: int = EVICT_INTERVAL):
+        import sqlite3  # SQLite 캐시를 쓸 때만 import (계산 전용 프로세스의 시작 시간 단축)
+
+        super().__init__(default_ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_interval = max(1, evict_interval)
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kasi_cache ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS kasi_cache_accessed ON kasi_cache (accessed_at)")
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM kasi_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                value, expires_at = row
+                if expires_at is None or expires_at > now:
+                    self._conn.execute("UPDATE kasi_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                    self._record(True)
+                    return _decode(value), expires_at
+                self._conn.execute("DELETE FROM kasi_cache WHERE key = ?", (key,))
+            self._record(False)
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kasi_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, _encode(value), self._expires_at(ttl), time.time())
+            )
+            # 정리는 테이블 전체를 훑으므로 evict_interval 번 쓸 때마다 한 번 (그 사이 최대 항목 수를 잠시 넘을 수 있음)
+            self._writes += 1
+            if self._writes % self.evict_interval == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        """만료 항목 및 최대 항목 수 초과분(오래 사용되지 않은 순) 삭제"""
+        cursor = self._conn.execute(
+            "DELETE FROM kasi_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+        self.evictions += max(cursor.rowcount, 0)
+
+        count = self._conn.execute("SELECT COUNT(*) FROM kasi_cache").fetchone()[0]
+        if count > self.max_entries:
+            cursor = self._conn.execute(
+                "DELETE FROM kasi_cache WHERE key IN ("
+                " SELECT key FROM kasi_cache ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM kasi_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM kasi_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM kasi_cache").fetchone()[0]
+
+
+class TieredCache(CacheBackend):
+    """메모리 LRU(앞단) + 영속 캐시(뒷단) 2단 캐시"""
+
+    def __init__(self, front: CacheBackend, back: CacheBackend):
+        super().__init__(back.default_ttl)
+        self.front = front
+        self.back = back
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = self.front.get_entry(key)
+        if entry is None:
+            entry = self.back.get_entry(key)
+            if entry is not None:
+                # 앞단에도 뒷단의 남은 유효 기간만큼만 저장 (만료 없음이면 ttl=0)
+                value, expires_at = entry
+                self.front.set(key, value, 0 if expires_at is None else max(expires_at - time.time(), 1e-3))
+        self._record(entry is not None)
+        return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.back.set(key, value, ttl)
+        self.front.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.front.delete(key)
+        self.back.delete(key)
+
+    def clear(self) -> None:
+        self.front.clear()
+        self.back.clear()
+
+    def __len__(self) -> int:
+        return len(self.back)
+
+    def stats(self) -> Dict[str, Any]:
+        result = super().stats()
+        result['front'] = self.front.stats()
+        result['back'] = self.back.stats()
+        return result
+
+
+def create_kasi_cache_from_env() -> CacheBackend:
+    """환경 변수 설정에 따른 KASI 캐시 생성"""
+    backend = os.getenv("KASI_CACHE_BACKEND", "tiered").lower()
+    path = os.path.expanduser(os.getenv("KASI_CACHE_PATH", DEFAULT_CACHE_PATH))
+    ttl = float(os.getenv("KASI_CACHE_TTL", DEFAULT_TTL))
+    max_entries = int(os.getenv("KASI_CACHE_MAX_ENTRIES", 100000))
+    memory_entries = int(os.getenv("KASI_CACHE_MEMORY_ENTRIES", 1024))
+
+    if backend == "memory":
+        return MemoryLRUCache(memory_entries, ttl)
+
+    import sqlite3
+
+    try:
+        sqlite_cache = SQLiteCache(path, max_entries, ttl)
+    except (sqlite3.Error, OSError) as e:
+        events.warning(log, "kasi_cache.sqlite_unavailable",
+                       "KASI SQLite 캐시를 열 수 없어 메모리 캐시만 사용합니다: {path} ({error})",
+                       path=path, error=str(e))
+        return MemoryLRUCache(memory_entries, ttl)
+
+    if backend == "sqlite":
+        return sqlite_cache
+    return TieredCache(MemoryLRUCache(memory_entries, ttl), sqlite_cache)
+
+
+_kasi_cache = None
+_kasi_cache_lock = threading.Lock()
+
+
+def get_kasi_cache() -> CacheBackend:
+    """프로세스 공용 KASI 캐시 (최초 사용 시 생성)"""
+    global _kasi_cache
+
+    if _kasi_cache is None:
+        with _kasi_cache_lock:
+            if _kasi_cache is None:
+                _kasi_cache = create_kasi_cache_from_env()
+    return _kasi_cache
+
+
+def set_kasi_cache(cache: CacheBackend) -> None:
+    """KASI 캐시 백엔드 교체 (Redis 등 사용자 정의 백엔드 연결용)"""
+    global _kasi_cache
+    _kasi_cache = cache
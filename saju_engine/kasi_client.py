@@ -0,0 +1,267 @@
+# saju_engine/kasi_client.py
+# KASI API 공용 HTTP 클라이언트 (연결 풀, 재시도, 호스트별 동시 요청 제한, 연 단위 절기 프리페치)
+
+import random
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from saju_engine import events
+
+KASI_BASE_URL = "http://apis.data.go.kr/B090041/openapi/service"
+DIVISIONS_URL = f"{KASI_BASE_URL}/SpcdeInfoService/get24DivisionsInfo"
+LUNAR_TO_SOLAR_URL = f"{KASI_BASE_URL}/LrsrCldInfoService/getSolCalInfo"
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/xml, text/xml, */*'
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 한 페이지에서 받을 최대 항목 수 (1년 24절기를 한 번에)
+DIVISIONS_PAGE_SIZE = 50
+
+log = events.get_logger("kasi")
+
+
+def division_cache_key(year: int, month: int) -> str:
+    """24절기 캐시 키 (연-월 단위)"""
+    return f"24div:{year}-{month}"
+
+
+def lunar_cache_key(lunar_year: int, lunar_month: int, lunar_day: int, is_leap_month: bool) -> str:
+    """음력→양력 변환 캐시 키"""
+    return f"lunar:{lunar_year}-{lunar_month}-{lunar_day}-{int(bool(is_leap_month))}"
+
+
+def lunar_to_solar_params(service_key: str, lunar_year: int, lunar_month: int, lunar_day: int,
+                          is_leap_month: bool) -> Dict[str, str]:
+    """getSolCalInfo 요청 파라미터"""
+    return {
+        'serviceKey': service_key,
+        'lunYear': str(lunar_year),
+        'lunMonth': f"{lunar_month:02d}",
+        'lunDay': f"{lunar_day:02d}",
+        'lunLeapmonth': 'true' if is_leap_month else 'false'
+    }
+
+
+def parse_division_item(item: ET.Element) -> Optional[Dict]:
+    """get24DivisionsInfo 응답의 item → 절기 dict (name, datetime, sun_longitude)"""
+    date_name = item.find('dateName').text if item.find('dateName') is not None else ""
+    locdate = item.find('locdate').text if item.find('locdate') is not None else ""
+    kst_time = item.find('kst').text if item.find('kst') is not None else "0000"
+    sun_longitude = item.find('sunLongitude').text if item.find('sunLongitude') is not None else "0"
+
+    if not locdate or len(locdate) != 8:
+        return None
+
+    # HHMM 시간 파싱 (공백 제거)
+    kst_time = (kst_time or "").strip()
+    if len(kst_time) == 4:
+        term_hour, term_minute = int(kst_time[:2]), int(kst_time[2:4])
+    else:
+        term_hour, term_minute = 0, 0
+
+    return {
+        'name': date_name,
+        'datetime': datetime(int(locdate[:4]), int(locdate[4:6]), int(locdate[6:8]), term_hour, term_minute),
+        'sun_longitude': int(sun_longitude)
+    }
+
+
+def parse_solar_date_item(item: ET.Element) -> Optional[Tuple[int, int, int]]:
+    """getSolCalInfo 응답의 item → (양력 연, 월, 일), 요소가 없으면 None"""
+    values = [item.find(tag) for tag in ('solYear', 'solMonth', 'solDay')]
+    if any(value is None or not value.text for value in values):
+        return None
+    return tuple(int(value.text) for value in values)
+
+
+def division_terms_by_month(year: int, items: Iterable[ET.Element], by_month: Dict[int, List[Dict]]) -> None:
+    """절기 item 목록을 해당 연도의 월별 목록에 추가"""
+    for item in items:
+        term = parse_division_item(item)
+        if term is not None and term['datetime'].year == year:
+            by_month[term['datetime'].month].append(term)
+
+
+class DivisionsYearPages:
+    """1년치 24절기 페이지 조회 상태 (요청 파라미터와 페이지 파싱, HTTP 호출은 동기/비동기 클라이언트가 담당)"""
+
+    def __init__(self, year: int, service_key: str):
+        self.year = year
+        self.service_key = service_key
+        self.by_month: Dict[int, List[Dict]] = {month: [] for month in range(1, 13)}
+        self.page = 1
+        self.fetched = 0
+
+    def params(self) -> Dict:
+        """현재 페이지의 get24DivisionsInfo 요청 파라미터"""
+        return {
+            'serviceKey': self.service_key,
+            'solYear': str(self.year),
+            'numOfRows': DIVISIONS_PAGE_SIZE,
+            'pageNo': self.page
+        }
+
+    def add_page(self, root: ET.Element) -> bool:
+        """응답 페이지를 월별 목록에 추가, 다음 페이지가 더 있으면 True"""
+        items = root.findall('.//item')
+        division_terms_by_month(self.year, items, self.by_month)
+        self.fetched += len(items)
+
+        total_count = root.find('.//totalCount')
+        total = int(total_count.text) if total_count is not None and total_count.text else self.fetched
+        if not items or self.fetched >= total:
+            return False
+        self.page += 1
+        return True
+
+
+def xml_result_root(text: str) -> Optional[ET.Element]:
+    """KASI 응답 본문 → 정상 응답(resultCode 00)의 XML 루트, 오류 응답이면 None"""
+    root = ET.fromstring(text)
+    result_code = root.find('.//resultCode')
+    if result_code is None or result_code.text != '00':
+        events.error(log, "kasi.api_error", "KASI API 오류: {code}",
+                     code=result_code.text if result_code is not None else 'Unknown')
+        return None
+    return root
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """지수 백오프 + full jitter 대기 시간"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class KasiClient:
+    """KASI 공공데이터 API 클라이언트 (프로세스 공용 연결 풀)"""
+
+    def __init__(self, pool_size: int = 10, max_per_host: int = 4, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 8.0, timeout: float = 15):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+
+        # keep-alive 연결 재사용 (재시도는 아래에서 직접 처리)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kasi-prefetch")
+        self._prefetching = set()
+        self._prefetch_lock = threading.Lock()
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 요청 제한 세마포어"""
+        host = urlparse(url).netloc
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def get(self, url: str, params: Dict) -> requests.Response:
+        """GET 요청 (네트워크 오류/일시적 HTTP 오류 시 재시도, 최종 실패 시 예외 또는 마지막 응답 반환)"""
+        limit = self._host_limit(url)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                with limit:
+                    response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+
+            time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+
+    def get_xml(self, url: str, params: Dict) -> Optional[ET.Element]:
+        """GET 요청 후 정상 응답(resultCode 00)의 XML 루트 반환, 실패 시 None"""
+        response = self.get(url, params)
+        if response.status_code != 200:
+            events.error(log, "kasi.http_error", "KASI API 호출 실패: HTTP {status}",
+                         status=response.status_code, url=url)
+            return None
+
+        return xml_result_root(response.text)
+
+    def fetch_24_divisions_year(self, year: int, service_key: str) -> Optional[Dict[int, List[Dict]]]:
+        """1년치 24절기를 페이지 단위로 조회 → {월: [절기, ...]}, 실패 시 None"""
+        pages = DivisionsYearPages(year, service_key)
+        while True:
+            root = self.get_xml(DIVISIONS_URL, pages.params())
+            if root is None:
+                return None
+            if not pages.add_page(root):
+                return pages.by_month
+
+    def load_24_divisions_year(self, year: int, service_key: str, cache) -> bool:
+        """1년치 24절기를 조회해 월별 캐시에 저장"""
+        by_month = self.fetch_24_divisions_year(year, service_key)
+        if by_month is None:
+            return False
+
+        for month, terms in by_month.items():
+            cache.set(division_cache_key(year, month), terms)
+        events.info(log, "kasi.divisions.loaded", "✅ {year}년 24절기 {count}개 조회 완료",
+                    year=year, count=sum(len(t) for t in by_month.values()))
+        return True
+
+    def prefetch_24_divisions(self, years: Iterable[int], service_key: str, cache) -> None:
+        """캐시에 없는 연도의 24절기를 백그라운드에서 미리 조회"""
+        for year in years:
+            if cache.get(division_cache_key(year, 1)) is not None:
+                continue
+            with self._prefetch_lock:
+                if year in self._prefetching:
+                    continue
+                self._prefetching.add(year)
+            self._prefetch_executor.submit(self._prefetch_year, year, service_key, cache)
+
+    def _prefetch_year(self, year: int, service_key: str, cache) -> None:
+        try:
+            self.load_24_divisions_year(year, service_key, cache)
+        except Exception as e:
+            events.warning(log, "kasi.prefetch_error", "{year}년 24절기 프리페치 실패: {error}", year=year, error=str(e))
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(year)
+
+    def close(self) -> None:
+        """연결 풀 및 프리페치 스레드 정리"""
+        self._prefetch_executor.shutdown(wait=False)
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_kasi_client() -> KasiClient:
+    """프로세스 공용 KASI 클라이언트"""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = KasiClient()
+    return _client
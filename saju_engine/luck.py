@@ -0,0 +1,166 @@
+# saju_engine/luck.py
+# 대운(大運) 계산: 절입 시각까지의 거리로 대운수를, 월주에서 10년 단위 대운 간지를 구함
+#
+# - 순행(양년생 남성/음년생 여성)은 다음 절(節), 역행은 직전 절까지의 시간을 잽니다.
+# - 3일 = 1년 (1일 = 4개월, 2시간 = 10일) 로 환산한 값이 대운이 시작되는 정확한 나이이고,
+#   대운수(start_age)는 이를 반올림한 정수입니다 (나머지 2일 이상이면 올림, 최소 1).
+# - 절기 테이블 범위 밖이면 기존 근사식(3 + 월 % 3)을 사용하고 approximate=True 로 표시합니다.
+#
+# 스칼라 함수는 표준 라이브러리만, great_luck_arrays / current_period_arrays 는 NumPy 를 사용합니다.
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from saju_engine.sexagenary import pillar_index, pillar_name
+from saju_engine.solar_terms import TERMS_PER_YEAR, datetime_to_minute, get_solar_term_table
+
+DAYS_PER_LUCK_YEAR = 3          # 절입까지 3일 = 대운 1년
+YEAR_DAYS = 365.2425            # 대운 시작일/교운일 환산용 평균 태양년
+LUCK_PERIOD_YEARS = 10
+DEFAULT_PERIOD_COUNT = 12       # 대운 12개 = 120년
+
+_MINUTES_PER_DAY = 1440
+_MINUTES_PER_LUCK_YEAR = DAYS_PER_LUCK_YEAR * _MINUTES_PER_DAY
+
+
+def luck_number(start_years: float) -> int:
+    """정확한 대운 시작 나이 → 대운수 (반올림, 최소 1)"""
+    return max(1, int(start_years + 0.5))
+
+
+def legacy_start_age(birth_datetime: datetime) -> int:
+    """절기 테이블 범위 밖에서 쓰는 근사 대운수"""
+    return 3 + (birth_datetime.month % 3)
+
+
+def term_distance_minutes(birth_datetime: datetime, forward: bool) -> Optional[int]:
+    """출생 시각에서 다음(순행) 또는 직전(역행) 절입까지의 분, 테이블 범위 밖이면 None"""
+    table = get_solar_term_table()
+    if table is None:
+        return None
+
+    located = table.locate(birth_datetime)
+    if located is None:
+        return None
+    minute = datetime_to_minute(birth_datetime)
+    k = (located[0] - table.first_year) * TERMS_PER_YEAR + located[1]
+
+    # 절(節)은 연도 내 짝수 위치 (소한, 입춘, 경칩 …), 중기(中氣)는 건너뜀
+    previous = k - (k % TERMS_PER_YEAR) % 2
+    if not forward:
+        return minute - table.minutes[previous]
+    following = previous + 2
+    if following >= len(table.minutes):
+        return None
+    return table.minutes[following] - minute
+
+
+def luck_pillar_indexes(month_pillar: int, forward: bool, count: int = DEFAULT_PERIOD_COUNT) -> List[int]:
+    """월주 육십갑자 인덱스 → 대운 간지 인덱스 목록 (순행은 다음 간지, 역행은 이전 간지부터)"""
+    step = 1 if forward else -1
+    return [(month_pillar + step * k) % 60 for k in range(1, count + 1)]
+
+
+def great_luck_timeline(birth_datetime: datetime, month_pillar: str, forward: bool,
+                        count: int = DEFAULT_PERIOD_COUNT) -> Dict:
+    """대운수, 정확한 시작 나이/날짜, 10년 단위 대운 간지 목록"""
+    distance = term_distance_minutes(birth_datetime, forward)
+    if distance is None:
+        start_age = legacy_start_age(birth_datetime)
+        start_years, approximate = float(start_age), True
+    else:
+        start_years = distance / _MINUTES_PER_LUCK_YEAR
+        start_age, approximate = luck_number(start_years), False
+
+    # 시작일도 절입 거리와 같은 분 단위 출생 시각 기준 (초는 버림 → 캐시 키와 결과가 일치)
+    anchor = birth_datetime.replace(second=0, microsecond=0)
+    pillars = []
+    for order, index in enumerate(luck_pillar_indexes(pillar_index(month_pillar), forward, count), 1):
+        offset_years = start_years + LUCK_PERIOD_YEARS * (order - 1)
+        pillars.append({
+            'order': order,
+            'pillar': pillar_name(index),
+            'start_age': start_age + LUCK_PERIOD_YEARS * (order - 1),
+            'end_age': start_age + LUCK_PERIOD_YEARS * order - 1,
+            'start_date': (anchor + timedelta(days=offset_years * YEAR_DAYS)).strftime('%Y-%m-%d')
+        })
+
+    return {
+        'start_age': start_age,
+        'start_years': round(start_years, 3),
+        'start_date': pillars[0]['start_date'] if pillars else None,
+        'approximate': approximate,
+        'pillars': pillars
+    }
+
+
+def current_period(great_luck: Dict, reference: datetime) -> Optional[Dict]:
+    """기준일의 대운 (calculate_great_luck 결과 사용, 첫 대운 시작 전이면 None)"""
+    reference_date = reference.strftime('%Y-%m-%d')
+    current = None
+    for period in great_luck.get('pillars', []):
+        if period['start_date'] > reference_date:
+            break
+        current = period
+    return current
+
+
+def great_luck_arrays(adjusted_minutes, forward, month_pillar, count: int = DEFAULT_PERIOD_COUNT,
+                      legacy_age=None) -> Dict:
+    """대운 배치 계산 (NumPy)
+
+    adjusted_minutes: 조정된 출생 시각 (1900-01-01 00:00 기준 경과 분) 배열
+    forward: 순행 여부 bool 배열, month_pillar: 월주 육십갑자 인덱스 배열
+    legacy_age: 절기 테이블 범위 밖에 쓸 근사 대운수 배열 (없으면 범위 밖은 3)
+    결과: start_age(int16), start_years(float64), approximate(bool), pillars(int8 [N, count])
+    """
+    import numpy as np
+
+    adjusted_minutes = np.asarray(adjusted_minutes, dtype=np.int64)
+    forward = np.asarray(forward, dtype=bool)
+    month_pillar = np.asarray(month_pillar, dtype=np.int64)
+    fallback = np.full(adjusted_minutes.shape, 3, dtype=np.int64) if legacy_age is None \
+        else np.asarray(legacy_age, dtype=np.int64)
+
+    distance = np.full(adjusted_minutes.shape, -1, dtype=np.int64)
+    table = get_solar_term_table()
+    if table is not None:
+        terms = np.frombuffer(table.minutes, dtype=np.int32).astype(np.int64)
+        end_minute = datetime_to_minute(datetime(table.last_year + 1, 1, 1))
+        k = np.searchsorted(terms, adjusted_minutes, side='right') - 1
+        previous = k - (k % TERMS_PER_YEAR) % 2
+        following = previous + 2
+        valid = (k >= 0) & (adjusted_minutes < end_minute) & np.where(forward, following < len(terms), True)
+        previous_minute = terms[np.clip(previous, 0, len(terms) - 1)]
+        following_minute = terms[np.clip(following, 0, len(terms) - 1)]
+        distance = np.where(
+            valid, np.where(forward, following_minute - adjusted_minutes, adjusted_minutes - previous_minute), -1
+        )
+
+    approximate = distance < 0
+    start_years = np.where(approximate, fallback, distance / _MINUTES_PER_LUCK_YEAR)
+    start_age = np.where(approximate, fallback, np.maximum(1, np.floor(start_years + 0.5))).astype(np.int16)
+
+    steps = np.arange(1, count + 1, dtype=np.int64)
+    pillars = (month_pillar[:, None] + np.where(forward, 1, -1)[:, None] * steps[None, :]) % 60
+
+    return {
+        'start_age': start_age,
+        'start_years': start_years,
+        'approximate': approximate,
+        'pillars': pillars.astype(np.int8)
+    }
+
+
+def current_period_arrays(birth_minutes, start_years, reference_minutes) -> Tuple:
+    """기준 시각의 대운 순번 배열 (0 = 첫 대운 전, k = k번째 대운) 과 기준 시각의 만 나이(년)
+
+    birth_minutes, reference_minutes: 1900-01-01 00:00 기준 경과 분 (reference 는 스칼라 가능)
+    """
+    import numpy as np
+
+    age_years = (np.asarray(reference_minutes, dtype=np.float64) - np.asarray(birth_minutes, dtype=np.float64)) \
+        / (YEAR_DAYS * _MINUTES_PER_DAY)
+    elapsed = age_years - np.asarray(start_years, dtype=np.float64)
+    period = np.where(elapsed >= 0, np.floor(elapsed / LUCK_PERIOD_YEARS) + 1, 0).astype(np.int16)
+    return period, age_years
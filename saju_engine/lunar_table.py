@@ -0,0 +1,155 @@
+# saju_engine/lunar_table.py
+# 오프라인 음력↔양력 변환 테이블 (mmap 로드, O(1) 변환)
+#
+# 파일 형식 (little-endian):
+#   헤더 16바이트: magic(4s) 'SJLN', version(H), first_year(H), n_years(H), 예약(6)
+#   본문: 음력 연도별 레코드 8바이트
+#     new_year(i)    - 음력 1월 1일의 양력 날짜 (1900-01-01 기준 경과 일수)
+#     month_bits(H)  - 연도 내 i번째 달(윤달 포함 순서)이 30일이면 bit i = 1, 29일이면 0
+#     leap_month(B)  - 윤달이 들어가는 달 (0 = 윤달 없음)
+#     n_months(B)    - 연도 내 달 수 (12 또는 13)
+# 테이블은 `python -m saju_engine.build lunar` 로 생성합니다.
+
+import mmap
+import os
+import struct
+from datetime import date, timedelta
+from typing import Optional, Sequence, Tuple
+
+from saju_engine import events
+
+LUNAR_TABLE_PATH = os.getenv(
+    "SAJU_LUNAR_TABLE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "lunar.bin")
+)
+
+# 경과 일수의 기준점
+EPOCH = date(1900, 1, 1)
+
+_MAGIC = b'SJLN'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHH6x')
+_RECORD = struct.Struct('<iHBB')
+
+
+def write_lunar_table(path: str, first_year: int, records: Sequence[Tuple[int, int, int, int]]) -> None:
+    """(new_year, month_bits, leap_month, n_months) 레코드 목록을 바이너리 테이블로 저장"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, first_year, len(records)))
+        for record in records:
+            fh.write(_RECORD.pack(*record))
+
+
+def _month_position(month: int, is_leap_month: bool, leap_month: int) -> Optional[int]:
+    """(월, 윤달 여부) → 연도 내 달 순서 (윤달 포함), 없는 달이면 None"""
+    if is_leap_month:
+        return leap_month if leap_month and month == leap_month else None
+    if leap_month and month > leap_month:
+        return month
+    return month - 1
+
+
+def _days_before(position: int, month_bits: int) -> int:
+    """연도 내 position 번째 달 이전까지의 일수"""
+    return 29 * position + bin(month_bits & ((1 << position) - 1)).count('1')
+
+
+class LunarTable:
+    """mmap 기반 음력↔양력 변환 테이블"""
+
+    def __init__(self, path: str = LUNAR_TABLE_PATH):
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, first_year, n_years = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"지원하지 않는 음력 테이블 형식입니다: {path}")
+
+        self.path = path
+        self.first_year = first_year
+        self.last_year = first_year + n_years - 1
+
+    def covers(self, lunar_year: int) -> bool:
+        """음력 연도가 테이블 범위 안인지"""
+        return self.first_year <= lunar_year <= self.last_year
+
+    def year_record(self, lunar_year: int) -> Tuple[int, int, int, int]:
+        """음력 연도의 (new_year, month_bits, leap_month, n_months)"""
+        offset = _HEADER.size + (lunar_year - self.first_year) * _RECORD.size
+        return _RECORD.unpack_from(self._mmap, offset)
+
+    def leap_month(self, lunar_year: int) -> int:
+        """해당 음력 연도의 윤달 (0 = 없음)"""
+        return self.year_record(lunar_year)[2]
+
+    def month_length(self, lunar_year: int, lunar_month: int, is_leap_month: bool = False) -> Optional[int]:
+        """음력 월의 일수 (29/30), 없는 달이면 None"""
+        _, month_bits, leap_month, _ = self.year_record(lunar_year)
+        position = _month_position(lunar_month, is_leap_month, leap_month)
+        if position is None or not 1 <= lunar_month <= 12:
+            return None
+        return 30 if month_bits >> position & 1 else 29
+
+    def to_solar(self, lunar_year: int, lunar_month: int, lunar_day: int,
+                 is_leap_month: bool = False) -> Optional[date]:
+        """음력 → 양력 (범위 밖이거나 존재하지 않는 날짜면 None)"""
+        if not self.covers(lunar_year) or not 1 <= lunar_month <= 12:
+            return None
+
+        new_year, month_bits, leap_month, _ = self.year_record(lunar_year)
+        position = _month_position(lunar_month, is_leap_month, leap_month)
+        if position is None:
+            return None
+
+        length = 30 if month_bits >> position & 1 else 29
+        if not 1 <= lunar_day <= length:
+            return None
+
+        return EPOCH + timedelta(days=new_year + _days_before(position, month_bits) + lunar_day - 1)
+
+    def to_lunar(self, solar_date: date) -> Optional[Tuple[int, int, int, bool]]:
+        """양력 → 음력 (연, 월, 일, 윤달 여부), 범위 밖이면 None"""
+        days = (solar_date - EPOCH).days
+
+        # 음력 설날은 양력 1월 하순~2월 중순이므로 양력 연도 또는 전년도
+        lunar_year = solar_date.year
+        if not self.covers(lunar_year) or days < self.year_record(lunar_year)[0]:
+            lunar_year -= 1
+        if not self.covers(lunar_year):
+            return None
+
+        new_year, month_bits, leap_month, n_months = self.year_record(lunar_year)
+        day_of_year = days - new_year
+
+        # 한 달은 29~30일이므로 추정 위치에서 최대 한 칸만 보정
+        position = min(day_of_year // 30, n_months - 1)
+        while position + 1 < n_months and _days_before(position + 1, month_bits) <= day_of_year:
+            position += 1
+        if day_of_year >= _days_before(n_months, month_bits):
+            return None
+
+        lunar_day = day_of_year - _days_before(position, month_bits) + 1
+        if leap_month and position == leap_month:
+            return lunar_year, leap_month, lunar_day, True
+        lunar_month = position if leap_month and position > leap_month else position + 1
+        return lunar_year, lunar_month, lunar_day, False
+
+
+log = events.get_logger("lunar_table")
+
+_table = None
+_table_loaded = False
+
+
+def get_lunar_table() -> Optional[LunarTable]:
+    """프로세스 공용 음력 테이블 (파일이 없으면 None)"""
+    global _table, _table_loaded
+
+    if not _table_loaded:
+        _table_loaded = True
+        if os.path.exists(LUNAR_TABLE_PATH):
+            _table = LunarTable(LUNAR_TABLE_PATH)
+        else:
+            events.warning(log, "lunar.table_missing", "음력 테이블이 없습니다: {path} (KASI API 사용)", path=LUNAR_TABLE_PATH)
+    return _table
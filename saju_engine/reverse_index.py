@@ -0,0 +1,191 @@
+# saju_engine/reverse_index.py
+# 사주 역색인: 네 기둥이 같은 출생 시각 구간 찾기 (mmap 로드)
+#
+# 연주/월주는 절입 시각으로만 바뀌므로 (연주, 월주) 12비트 코드 → 절기 월 구간 목록을 미리 만들어 두고,
+# 일주/시주는 조회 시 60일 주기와 시지 구간으로 그 월 구간 안에서 직접 계산합니다.
+# 한 (연주, 월주) 조합은 60년마다 한 번 나오므로 조회는 구간 몇 개의 산술 연산으로 끝납니다.
+#
+# 시각은 모두 조정된 시각(써머타임/절입조정/경도조정 후, 1900-01-01 00:00 기준 경과 분)입니다.
+#
+# 파일 형식 (little-endian):
+#   헤더 16바이트: magic(4s) 'SJRV', version(H), 예약(H), first_year(H), n_years(H), n_months(I)
+#   uint32[4097] offsets - (연주 << 6 | 월주) 코드별 레코드 시작 위치
+#   레코드 int32[n_months][2] - 절기 월 구간 [시작 분, 끝 분), 코드 안에서는 시간순
+# 색인은 `python -m saju_engine.build reverse-index` 로 생성합니다.
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from saju_engine import events
+from saju_engine.sexagenary import (
+    branch_of,
+    is_consistent,
+    month_stem_for,
+    pack_chart,
+    sexagenary_index,
+    unpack_chart,
+)
+from saju_engine.solar_terms import TERMS_PER_YEAR, datetime_to_minute, minute_to_datetime
+
+REVERSE_INDEX_PATH = os.getenv(
+    "SAJU_REVERSE_INDEX",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "reverse_index.bin")
+)
+
+_MAGIC = b'SJRV'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHHHI')
+_N_CODES = 1 << 12
+
+_MINUTES_PER_DAY = 1440
+_EPOCH_JD = 2415021  # 1900-01-01 의 율리우스일 (경과 분의 기준점)
+
+
+def month_intervals(term_minutes: Sequence[int], first_year: int, end_minute: int) -> Iterator[Tuple[int, int, int]]:
+    """절기 테이블 → (연주·월주 12비트 코드, 시작 분, 끝 분) 절기 월 구간
+
+    연도별 짝수 위치(소한, 입춘, 경칩 …)의 절입 시각이 월 경계이며,
+    마지막 구간은 테이블 커버리지 끝(end_minute)에서 자릅니다.
+    """
+    boundaries = [k for k in range(0, len(term_minutes), 2)]
+    for i, k in enumerate(boundaries):
+        start = term_minutes[k]
+        end = term_minutes[boundaries[i + 1]] if i + 1 < len(boundaries) else end_minute
+        end = min(end, end_minute)
+        if end <= start:
+            continue
+
+        term_year, term_pos = first_year + k // TERMS_PER_YEAR, k % TERMS_PER_YEAR
+        saju_year = term_year if term_pos >= 2 else term_year - 1
+        month_idx = ((term_pos - 2) // 2) % 12
+
+        year_stem, year_branch = (saju_year - 4) % 10, (saju_year - 4) % 12
+        month_branch = (month_idx + 2) % 12
+        month_stem = month_stem_for(year_stem, month_branch)
+
+        code = (sexagenary_index(year_stem, year_branch) << 6) | sexagenary_index(month_stem, month_branch)
+        yield code, start, end
+
+
+def write_reverse_index(path: str, first_year: int, n_years: int,
+                        intervals: Sequence[Tuple[int, int, int]]) -> None:
+    """(코드, 시작 분, 끝 분) 목록을 역색인 바이너리로 저장"""
+    intervals = sorted(intervals)
+    offsets = array('I', [0] * (_N_CODES + 1))
+    for code, _, _ in intervals:
+        offsets[code + 1] += 1
+    for code in range(_N_CODES):
+        offsets[code + 1] += offsets[code]
+
+    records = array('i')
+    for _, start, end in intervals:
+        records.extend((start, end))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+        records.byteswap()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, 0, first_year, n_years, len(intervals)))
+        fh.write(offsets.tobytes())
+        fh.write(records.tobytes())
+
+
+def _hour_ranges(hour_branch: int) -> Tuple[Tuple[int, int], ...]:
+    """시지 → 하루 안의 [시작 분, 끝 분) 구간 (자시는 00시대와 23시대 두 구간)"""
+    if hour_branch == 0:
+        return (0, 60), (23 * 60, _MINUTES_PER_DAY)
+    return ((2 * hour_branch - 1) * 60, (2 * hour_branch + 1) * 60),
+
+
+class ReverseIndex:
+    """mmap 기반 사주 역색인"""
+
+    def __init__(self, path: str = REVERSE_INDEX_PATH):
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, first_year, n_years, n_months = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"지원하지 않는 역색인 형식입니다: {path}")
+
+        self.path = path
+        self.first_year = first_year
+        self.last_year = first_year + n_years - 1
+
+        body = memoryview(self._mmap)[_HEADER.size:]
+        offsets_size = (_N_CODES + 1) * 4
+        self._offsets = self._cast(body[:offsets_size], 'I')
+        self._records = self._cast(body[offsets_size:offsets_size + n_months * 8], 'i')
+
+    @staticmethod
+    def _cast(view: memoryview, typecode: str):
+        if sys.byteorder == 'little':
+            return view.cast(typecode)
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def month_ranges(self, year: int, month: int) -> List[Tuple[int, int]]:
+        """(연주, 월주) 육십갑자 인덱스 → 절기 월 구간 [시작 분, 끝 분) 목록"""
+        code = (year << 6) | month
+        lo, hi = self._offsets[code], self._offsets[code + 1]
+        return [(self._records[2 * i], self._records[2 * i + 1]) for i in range(lo, hi)]
+
+    def minute_ranges(self, code: int) -> List[Tuple[int, int]]:
+        """사주 코드 → 같은 사주가 나오는 조정된 시각 구간 [시작 분, 끝 분) 목록 (시간순)"""
+        if not is_consistent(code):
+            return []
+
+        year, month, day, hour = unpack_chart(code)
+        hour_ranges = _hour_ranges(branch_of(hour))
+        # 일주 인덱스 = (율리우스일 + 49) % 60
+        day_residue = (day - 49 - _EPOCH_JD) % 60
+
+        ranges = []
+        for month_start, month_end in self.month_ranges(year, month):
+            first_day = month_start // _MINUTES_PER_DAY
+            day_number = first_day + (day_residue - first_day) % 60
+            while day_number * _MINUTES_PER_DAY < month_end:
+                day_start = day_number * _MINUTES_PER_DAY
+                for lo, hi in hour_ranges:
+                    start, end = max(day_start + lo, month_start), min(day_start + hi, month_end)
+                    if start < end:
+                        ranges.append((start, end))
+                day_number += 60
+        return ranges
+
+    def find(self, year_pillar: int, month_pillar: int, day_pillar: int, hour_pillar: int,
+             start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Tuple[datetime, datetime]]:
+        """네 기둥의 육십갑자 인덱스 → 조정된 시각 구간 [시작, 끝) 목록 (start/end 로 범위 제한)"""
+        ranges = self.minute_ranges(pack_chart(year_pillar, month_pillar, day_pillar, hour_pillar))
+        lower = datetime_to_minute(start) if start is not None else None
+        upper = datetime_to_minute(end) if end is not None else None
+        return [
+            (minute_to_datetime(lo), minute_to_datetime(hi)) for lo, hi in ranges
+            if (lower is None or hi > lower) and (upper is None or lo < upper)
+        ]
+
+
+log = events.get_logger("reverse_index")
+
+_index = None
+_index_loaded = False
+
+
+def get_reverse_index() -> Optional[ReverseIndex]:
+    """프로세스 공용 역색인 (파일이 없으면 None)"""
+    global _index, _index_loaded
+
+    if not _index_loaded:
+        _index_loaded = True
+        if os.path.exists(REVERSE_INDEX_PATH):
+            _index = ReverseIndex(REVERSE_INDEX_PATH)
+        else:
+            events.warning(log, "reverse_index.missing", "사주 역색인이 없습니다: {path}", path=REVERSE_INDEX_PATH)
+    return _index
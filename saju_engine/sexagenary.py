@@ -0,0 +1,91 @@
+# saju_engine/sexagenary.py
+# 육십갑자 인덱스와 사주 코드 압축
+#
+# 간지 하나는 육십갑자 순서(甲子=0 … 癸亥=59)의 6비트 정수로, 사주 네 기둥은
+# (연 << 18) | (월 << 12) | (일 << 6) | 시 의 24비트 정수 하나로 표현합니다.
+# 정수 연산만 사용하므로 스칼라와 NumPy 배열 모두에 그대로 쓸 수 있습니다.
+
+from typing import Dict, Tuple
+
+STEMS = '甲乙丙丁戊己庚辛壬癸'
+BRANCHES = '子丑寅卯辰巳午未申酉戌亥'
+
+PILLAR_KEYS = ('year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar')
+
+_STEM_INDEX = {stem: i for i, stem in enumerate(STEMS)}
+_BRANCH_INDEX = {branch: i for i, branch in enumerate(BRANCHES)}
+
+
+def sexagenary_index(stem, branch):
+    """(천간 인덱스, 지지 인덱스) → 육십갑자 인덱스 (음양이 다른 조합은 존재하지 않음)"""
+    return (6 * stem - 5 * branch) % 60
+
+
+def stem_of(index):
+    """육십갑자 인덱스 → 천간 인덱스"""
+    return index % 10
+
+
+def branch_of(index):
+    """육십갑자 인덱스 → 지지 인덱스"""
+    return index % 12
+
+
+def pillar_index(pillar: str) -> int:
+    """간지 문자열(예: '甲子') → 육십갑자 인덱스"""
+    try:
+        stem, branch = _STEM_INDEX[pillar[0]], _BRANCH_INDEX[pillar[1]]
+    except (KeyError, IndexError, TypeError):
+        raise ValueError(f"올바른 간지가 아닙니다: {pillar!r}") from None
+    if len(pillar) != 2 or stem % 2 != branch % 2:
+        raise ValueError(f"존재하지 않는 간지입니다: {pillar!r}")
+    return sexagenary_index(stem, branch)
+
+
+def pillar_name(index: int) -> str:
+    """육십갑자 인덱스 → 간지 문자열"""
+    return STEMS[index % 10] + BRANCHES[index % 12]
+
+
+def pack_chart(year, month, day, hour):
+    """네 기둥의 육십갑자 인덱스 → 24비트 사주 코드"""
+    return (year << 18) | (month << 12) | (day << 6) | hour
+
+
+def unpack_chart(code) -> Tuple:
+    """24비트 사주 코드 → (연, 월, 일, 시) 육십갑자 인덱스"""
+    return (code >> 18) & 63, (code >> 12) & 63, (code >> 6) & 63, code & 63
+
+
+def pack_pillars(saju: Dict) -> int:
+    """calculate_solar_saju 결과(또는 같은 키의 dict) → 사주 코드"""
+    return pack_chart(*(pillar_index(saju[key]) for key in PILLAR_KEYS))
+
+
+def unpack_pillars(code: int) -> Dict[str, str]:
+    """사주 코드 → {'year_pillar': '甲子', ...}"""
+    return {key: pillar_name(index) for key, index in zip(PILLAR_KEYS, unpack_chart(code))}
+
+
+def pack_batch(result: Dict):
+    """calculate_solar_saju_batch / iter_charts 결과 → 사주 코드 배열"""
+    parts = [sexagenary_index(result[f'{name}_stem'].astype('int64'), result[f'{name}_branch'].astype('int64'))
+             for name in ('year', 'month', 'day', 'hour')]
+    return pack_chart(*parts)
+
+
+def month_stem_for(year_stem, month_branch):
+    """연간 + 월지 → 월간 (갑기년 丙寅월 시작)"""
+    return (2 + 2 * (year_stem % 5) + (month_branch - 2) % 12) % 10
+
+
+def hour_stem_for(day_stem, hour_branch):
+    """일간 + 시지 → 시간 (갑기일 甲子시 시작)"""
+    return (day_stem * 2 + hour_branch) % 10
+
+
+def is_consistent(code: int) -> bool:
+    """월간이 연간과, 시간이 일간과 맞는 (실제로 나올 수 있는) 사주 코드인지"""
+    year, month, day, hour = unpack_chart(code)
+    return (month_stem_for(stem_of(year), branch_of(month)) == stem_of(month)
+            and hour_stem_for(stem_of(day), branch_of(hour)) == stem_of(hour))
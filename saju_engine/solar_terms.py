@@ -0,0 +1,158 @@
+# saju_engine/solar_terms.py
+# 오프라인 24절기 테이블 (분 단위 절입 시각, mmap 로드)
+#
+# 파일 형식 (little-endian):
+#   헤더 16바이트: magic(4s) 'SJST', version(H), first_year(H), n_years(H), terms_per_year(H), 예약(4)
+#   본문: int32[n_years][24] - 1900-01-01 00:00(KST) 기준 경과 분, 각 연도는 소한부터 동지까지 시간순
+# 테이블은 `python -m saju_engine.build solar-terms` 로 생성합니다.
+
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from saju_engine import events
+
+SOLAR_TERM_TABLE_PATH = os.getenv(
+    "SAJU_SOLAR_TERM_TABLE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "solar_terms.bin")
+)
+
+# 연도 내 절기 순서 (양력 1월 소한부터)
+TERM_NAMES = (
+    '소한', '대한', '입춘', '우수', '경칩', '춘분', '청명', '곡우',
+    '입하', '소만', '망종', '하지', '소서', '대서', '입추', '처서',
+    '백로', '추분', '한로', '상강', '입동', '소설', '대설', '동지'
+)
+TERM_LONGITUDES = tuple((285 + 15 * i) % 360 for i in range(24))
+TERMS_PER_YEAR = 24
+
+# 분 단위 시각의 기준점 (KST)
+EPOCH = datetime(1900, 1, 1)
+
+_MAGIC = b'SJST'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHHH4x')
+
+
+def datetime_to_minute(dt: datetime) -> int:
+    """datetime → 기준점(1900-01-01 00:00) 이후 경과 분 (초 이하는 버림)"""
+    return (dt - EPOCH) // timedelta(minutes=1)
+
+
+def minute_to_datetime(minute: int) -> datetime:
+    """기준점 이후 경과 분 → datetime"""
+    return EPOCH + timedelta(minutes=minute)
+
+
+def month_index_of_term(term_pos: int) -> int:
+    """연도 내 절기 위치(0=소한) → 월지 인덱스 (MONTH_BRANCHES 기준, 인월=0)"""
+    return ((term_pos - 2) // 2) % 12
+
+
+def write_solar_term_table(path: str, first_year: int, rows: Sequence[Sequence[int]]) -> None:
+    """연도별 절입 시각(분) 목록을 바이너리 테이블로 저장"""
+    values = array('i')
+    for row in rows:
+        if len(row) != TERMS_PER_YEAR:
+            raise ValueError(f"연도별 절기는 {TERMS_PER_YEAR}개여야 합니다: {len(row)}개")
+        values.extend(row)
+    if list(values) != sorted(values):
+        raise ValueError("절입 시각이 시간순으로 정렬되어 있지 않습니다.")
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, first_year, len(rows), TERMS_PER_YEAR))
+        fh.write(values.tobytes())
+
+
+class SolarTermTable:
+    """mmap 기반 24절기 조회 테이블"""
+
+    def __init__(self, path: str = SOLAR_TERM_TABLE_PATH):
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, first_year, n_years, terms_per_year = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION or terms_per_year != TERMS_PER_YEAR:
+            raise ValueError(f"지원하지 않는 절기 테이블 형식입니다: {path}")
+
+        self.path = path
+        self.first_year = first_year
+        self.last_year = first_year + n_years - 1
+
+        body = memoryview(self._mmap)[_HEADER.size:_HEADER.size + n_years * TERMS_PER_YEAR * 4]
+        if sys.byteorder == 'little':
+            self.minutes = body.cast('i')
+        else:
+            self.minutes = array('i', body.tobytes())
+            self.minutes.byteswap()
+
+        # 커버리지 끝 (마지막 연도 이후의 소한은 알 수 없음)
+        self._end_minute = datetime_to_minute(datetime(self.last_year + 1, 1, 1))
+
+    def locate(self, dt: datetime) -> Optional[Tuple[int, int]]:
+        """dt 직전(같은 분 포함) 절기의 (연도, 연도 내 위치) - 테이블 범위 밖이면 None"""
+        minute = datetime_to_minute(dt)
+        k = bisect.bisect_right(self.minutes, minute) - 1
+        if k < 0 or minute >= self._end_minute:
+            return None
+        return self.first_year + k // TERMS_PER_YEAR, k % TERMS_PER_YEAR
+
+    def month_index(self, dt: datetime) -> Optional[int]:
+        """절기 기준 월지 인덱스 (인월=0) - 범위 밖이면 None"""
+        located = self.locate(dt)
+        if located is None:
+            return None
+        return month_index_of_term(located[1])
+
+    def saju_year(self, dt: datetime) -> Optional[int]:
+        """입춘 기준 연도 - 범위 밖이면 None"""
+        located = self.locate(dt)
+        if located is None:
+            return None
+        term_year, term_pos = located
+        return term_year if term_pos >= 2 else term_year - 1
+
+    def terms_for_year(self, year: int) -> List[Dict]:
+        """해당 연도의 24절기 목록 (get_24_divisions_from_kasi 와 같은 형식)"""
+        if not self.first_year <= year <= self.last_year:
+            return []
+        base = (year - self.first_year) * TERMS_PER_YEAR
+        return [
+            {
+                'name': TERM_NAMES[i],
+                'datetime': minute_to_datetime(self.minutes[base + i]),
+                'sun_longitude': TERM_LONGITUDES[i]
+            }
+            for i in range(TERMS_PER_YEAR)
+        ]
+
+    def terms_for_month(self, year: int, month: int) -> List[Dict]:
+        """해당 연월의 절기 목록 (get_24_divisions_from_kasi 와 같은 형식)"""
+        return [term for term in self.terms_for_year(year) if term['datetime'].month == month]
+
+
+log = events.get_logger("solar_terms")
+
+_table = None
+_table_loaded = False
+
+
+def get_solar_term_table() -> Optional[SolarTermTable]:
+    """프로세스 공용 절기 테이블 (파일이 없으면 None)"""
+    global _table, _table_loaded
+
+    if not _table_loaded:
+        _table_loaded = True
+        if os.path.exists(SOLAR_TERM_TABLE_PATH):
+            _table = SolarTermTable(SOLAR_TERM_TABLE_PATH)
+        else:
+            events.warning(log, "solar_terms.table_missing", "절기 테이블이 없습니다: {path} (근사 절기 사용)", path=SOLAR_TERM_TABLE_PATH)
+    return _table
@@ -0,0 +1,191 @@
+# saju_engine/time_rules.py
+# 출생 시각 조정 규칙 엔진 (써머타임, 표준 자오선 변경 등)
+#
+# 규칙의 기간 문자열은 import 시 한 번만 파싱되어 1900-01-01 00:00(KST) 기준 경과 분의
+# 정렬된 배열로 컴파일되고, 조회는 규칙마다 bisect 한 번으로 끝납니다.
+# 새로운 역사적 표준시 변경은 IntervalRule 을 만들어 TIME_RULES.register_rule() 로 추가합니다.
+
+import bisect
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from saju_engine.solar_terms import datetime_to_minute
+
+# 써머타임 실시 기간 (한국천문연구원 만세력 기준)
+SUMMERTIME_PERIODS = [
+    ("1948-06-01 00:00", "1948-09-13 00:00"),
+    ("1949-04-03 00:00", "1949-09-11 00:00"),
+    ("1950-04-01 00:00", "1950-09-10 00:00"),
+    ("1951-05-06 00:00", "1951-09-09 00:00"),
+    ("1955-05-05 00:00", "1955-09-09 00:00"),
+    ("1956-05-20 00:00", "1956-09-30 00:00"),
+    ("1957-05-05 00:00", "1957-09-22 00:00"),
+    ("1958-05-04 00:00", "1958-09-21 00:00"),
+    ("1959-05-03 00:00", "1959-09-20 00:00"),
+    ("1960-05-01 00:00", "1960-09-18 00:00"),
+    ("1987-05-10 02:00", "1987-10-11 03:00"),
+    ("1988-05-08 02:00", "1988-10-09 03:00")
+]
+
+# 절입조정 기간 (동경 127도 30분 사용 기간)
+SOLAR_TERM_ADJUSTMENT_PERIODS = [
+    ("1908-04-01", "1911-12-31"),
+    ("1954-03-21", "1961-08-09")
+]
+
+# 기본 표준 자오선 (동경 135도)
+DEFAULT_REFERENCE_LONGITUDE = 135.0
+
+_MINUTES_PER_DAY = 1440
+
+
+def _parse_minute(value: str) -> Tuple[int, bool]:
+    """'YYYY-MM-DD[ HH:MM]' → (경과 분, 날짜만 지정 여부)
+
+    fromisoformat 사용 (strptime 은 첫 호출 때 _strptime/locale 을 import 해 시작 시간이 늘어남)
+    """
+    return datetime_to_minute(datetime.fromisoformat(value)), len(value) <= 10
+
+
+def compile_periods(periods: Sequence[Tuple[str, str]]) -> Tuple[List[int], List[int]]:
+    """기간 문자열 목록 → 정렬된 (시작 분, 끝 분) 목록 (양 끝 포함, 날짜만 있으면 그날 23:59 까지)"""
+    intervals = []
+    for start_str, end_str in periods:
+        start, _ = _parse_minute(start_str)
+        end, date_only = _parse_minute(end_str)
+        if date_only:
+            end += _MINUTES_PER_DAY - 1
+        if end < start:
+            raise ValueError(f"기간의 끝이 시작보다 앞섭니다: {start_str} ~ {end_str}")
+        intervals.append((start, end))
+
+    intervals.sort()
+    for (_, prev_end), (next_start, _) in zip(intervals, intervals[1:]):
+        if next_start <= prev_end:
+            raise ValueError("같은 규칙의 기간이 서로 겹칩니다.")
+
+    return [start for start, _ in intervals], [end for _, end in intervals]
+
+
+class IntervalRule:
+    """기간 안의 출생 시각에 적용되는 조정 규칙
+
+    offset_minutes: 출생 시각에 더할 분 (써머타임 -60 등)
+    reference_longitude: 기간 중 사용된 표준 자오선 (경도 조정 기준), 없으면 None
+    label: 조정 내역 문자열 (apply_comprehensive_time_adjustment 의 adjustments 항목)
+    """
+
+    def __init__(self, code: str, periods: Sequence[Tuple[str, str]], offset_minutes: int = 0,
+                 reference_longitude: Optional[float] = None, label: str = ""):
+        self.code = code
+        self.periods = list(periods)
+        self.offset_minutes = offset_minutes
+        self.reference_longitude = reference_longitude
+        self.label = label or code
+        self.starts, self.ends = compile_periods(self.periods)
+        self._arrays = None  # contains_array 용 NumPy 배열 (최초 사용 시 생성)
+
+    def contains_minute(self, minute: int) -> bool:
+        """경과 분이 규칙 기간 안인지"""
+        i = bisect.bisect_right(self.starts, minute) - 1
+        return i >= 0 and minute <= self.ends[i]
+
+    def contains(self, dt: datetime) -> bool:
+        """datetime 이 규칙 기간 안인지 (분 단위)"""
+        return self.contains_minute(datetime_to_minute(dt))
+
+    def contains_array(self, minutes):
+        """경과 분 배열 → 포함 여부 bool 배열"""
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (np.asarray(self.starts, dtype=np.int64), np.asarray(self.ends, dtype=np.int64))
+        starts, ends = self._arrays
+        if not len(starts):
+            return np.zeros(np.shape(minutes), dtype=bool)
+
+        idx = np.searchsorted(starts, minutes, side='right') - 1
+        return (idx >= 0) & (minutes <= ends[np.clip(idx, 0, None)])
+
+
+class TimeRuleEngine:
+    """등록된 규칙을 순서대로 적용하는 시간 조정 엔진"""
+
+    def __init__(self, rules: Sequence[IntervalRule] = (),
+                 default_reference_longitude: float = DEFAULT_REFERENCE_LONGITUDE):
+        self.default_reference_longitude = default_reference_longitude
+        self.rules: List[IntervalRule] = []
+        self._listeners: List[Callable[['TimeRuleEngine'], None]] = []
+        for rule in rules:
+            self.register_rule(rule)
+
+    def add_listener(self, callback: Callable[['TimeRuleEngine'], None]) -> None:
+        """규칙이 바뀔 때 호출할 콜백 등록 (계산 결과 캐시 무효화 등)"""
+        self._listeners.append(callback)
+
+    def register_rule(self, rule: IntervalRule) -> None:
+        """규칙 추가 (같은 code 면 교체, 자오선 규칙은 나중 규칙이 우선)"""
+        self.rules = [r for r in self.rules if r.code != rule.code]
+        self.rules.append(rule)
+        for callback in self._listeners:
+            callback(self)
+
+    def rule(self, code: str) -> IntervalRule:
+        """code 로 규칙 조회"""
+        for rule in self.rules:
+            if rule.code == code:
+                return rule
+        raise KeyError(code)
+
+    def reference_longitudes(self) -> Tuple[float, ...]:
+        """가능한 표준 자오선 목록 (0번 = 기본값)"""
+        longitudes = [self.default_reference_longitude]
+        for rule in self.rules:
+            if rule.reference_longitude is not None and rule.reference_longitude not in longitudes:
+                longitudes.append(rule.reference_longitude)
+        return tuple(longitudes)
+
+    def resolve(self, minute: int) -> Tuple[int, float, List[IntervalRule]]:
+        """경과 분 → (규칙 조정 분 합계, 표준 자오선, 적용된 규칙 목록)"""
+        offset = 0
+        reference_longitude = self.default_reference_longitude
+        active = []
+        for rule in self.rules:
+            if rule.contains_minute(minute):
+                offset += rule.offset_minutes
+                if rule.reference_longitude is not None:
+                    reference_longitude = rule.reference_longitude
+                active.append(rule)
+        return offset, reference_longitude, active
+
+    def resolve_array(self, minutes) -> Tuple[object, object, Dict[str, object]]:
+        """경과 분 배열 → (조정 분 합계 배열, 표준 자오선 인덱스 배열, {code: 적용 여부 배열})
+
+        표준 자오선 인덱스는 reference_longitudes() 의 순서를 따릅니다.
+        """
+        import numpy as np
+
+        minutes = np.asarray(minutes, dtype=np.int64)
+        offset = np.zeros(minutes.shape, dtype=np.int64)
+        reference_index = np.zeros(minutes.shape, dtype=np.int64)
+        longitudes = self.reference_longitudes()
+        masks = {}
+
+        for rule in self.rules:
+            mask = rule.contains_array(minutes)
+            masks[rule.code] = mask
+            if rule.offset_minutes:
+                offset += mask * rule.offset_minutes
+            if rule.reference_longitude is not None:
+                reference_index = np.where(mask, longitudes.index(rule.reference_longitude), reference_index)
+
+        return offset, reference_index, masks
+
+
+# 기본 규칙 (적용 순서 = adjustments 표시 순서)
+TIME_RULES = TimeRuleEngine([
+    IntervalRule("summertime", SUMMERTIME_PERIODS, offset_minutes=-60,
+                 label="써머타임: -60분"),
+    IntervalRule("standard_meridian", SOLAR_TERM_ADJUSTMENT_PERIODS, offset_minutes=-30,
+                 reference_longitude=127.5, label="절입조정: -30분 (E135→E127.5)"),
+])
@@ -43,5 +43,8 @@ setup(
         ],
     },
     include_package_data=True,
+    package_data={
+        "saju_engine": ["data/*.bin", "data/*.csv"],
+    },
     zip_safe=False,
 ) 
\ No newline at end of file
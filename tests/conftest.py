@@ -0,0 +1,7 @@
+# tests/conftest.py
+# 저장소 루트를 import 경로에 추가 (pytest 를 어디서 실행해도 saju_engine / saju_calculator 를 찾도록)
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
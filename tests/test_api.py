@@ -0,0 +1,84 @@
+# tests/test_api.py
+# API 엔드포인트 (궁합 상위 후보, 타임라인): 입력 검증(422/400), 동기 CPU 작업의 스레드 풀 실행
+
+import pytest
+
+pytest.importorskip("langsmith")
+pytest.importorskip("langgraph")
+pytest.importorskip("langchain_openai")
+
+from fastapi.testclient import TestClient
+
+from api import main
+
+client = TestClient(main.app)
+
+PERSON = {"birth_year": 1990, "birth_month": 5, "birth_day": 15, "birth_hour": 14, "birth_minute": 30,
+          "is_male": True, "city": "서울"}
+CANDIDATES = [
+    {"id": "u1", "birth_year": 1992, "birth_month": 8, "birth_day": 3, "birth_hour": 9, "city": "부산"},
+    {"id": "u2", "birth_year": 1988, "birth_month": 12, "birth_day": 21, "birth_hour": 23, "birth_minute": 40},
+    {"id": "u3", "birth_year": 1995, "birth_month": 2, "birth_day": 4, "birth_hour": 6},
+]
+
+
+@pytest.fixture
+def threadpool_calls(monkeypatch):
+    calls = []
+    run_in_threadpool = main.run_in_threadpool
+
+    async def recording(func, *args, **kwargs):
+        calls.append(func.__name__)
+        return await run_in_threadpool(func, *args, **kwargs)
+
+    monkeypatch.setattr(main, 'run_in_threadpool', recording)
+    return calls
+
+
+def test_compatibility_top(threadpool_calls):
+    response = client.post("/api/v1/compatibility/top", json={"person": PERSON, "candidates": CANDIDATES, "top_k": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["candidate_count"] == 3
+    assert len(body["matches"]) == 2
+    assert body["matches"][0]["score"] >= body["matches"][1]["score"]
+    assert {match["id"] for match in body["matches"]} <= {"u1", "u2", "u3"}
+    assert threadpool_calls == ["compatibility_matches"]
+
+
+@pytest.mark.parametrize('payload', [
+    {"person": PERSON, "candidates": []},
+    {"person": PERSON, "candidates": CANDIDATES, "top_k": 0},
+    {"person": PERSON, "candidates": CANDIDATES, "top_k": -3},
+    {"person": PERSON, "candidates": [CANDIDATES[0]] * (main.MAX_COMPATIBILITY_CANDIDATES + 1)},
+])
+def test_compatibility_top_rejects_invalid_requests(payload):
+    assert client.post("/api/v1/compatibility/top", json=payload).status_code == 422
+
+
+def test_compatibility_top_bad_candidate_date():
+    bad = dict(CANDIDATES[0], birth_month=13)
+    response = client.post("/api/v1/compatibility/top", json={"person": PERSON, "candidates": [bad]})
+    assert response.status_code == 400
+
+
+TIMELINE = dict(PERSON, start_year=2024, end_year=2033)
+
+
+def test_timeline(threadpool_calls):
+    response = client.post("/api/v1/saju/timeline", json=TIMELINE)
+    assert response.status_code == 200
+    body = response.json()
+    assert [item['year'] for item in body['years']] == list(range(2024, 2034))
+    assert threadpool_calls == ["scan_interactions"]
+
+
+@pytest.mark.parametrize('payload, status', [
+    (dict(TIMELINE, start_year=2030, end_year=2020), 400),
+    (dict(TIMELINE, start_year=2000, end_year=2200), 400),
+    (dict(TIMELINE, start_year=0), 422),
+    # 존재하지 않는 윤달: calculate_saju_data 의 400 이 500 으로 바뀌지 않음
+    (dict(TIMELINE, birth_year=2024, birth_month=1, birth_day=1, is_lunar=True, is_leap_month=True), 400),
+])
+def test_timeline_rejects_invalid_requests(payload, status):
+    assert client.post("/api/v1/saju/timeline", json=payload).status_code == status
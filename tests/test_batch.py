@@ -0,0 +1,71 @@
+# tests/test_batch.py
+# 배치 사주 계산: 건별 calculate_solar_saju 와 같은 간지/오행/대운 방향/조정 시각, 입력 검증
+
+import random
+
+import numpy as np
+import pytest
+
+from saju_calculator import calculate_solar_saju, calculate_solar_saju_batch
+from saju_engine.batch import CITY_CODES, ELEMENT_ORDER, city_longitudes
+from saju_engine.sexagenary import pack_batch, unpack_pillars
+
+PILLARS = ('year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar')
+
+
+def _rows():
+    rng = random.Random(1)
+    rows = [(rng.randint(1900, 2100), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59),
+             rng.random() < 0.5, rng.randint(-1, len(CITY_CODES) - 1)) for _ in range(300)]
+    # 써머타임/표준 자오선 변경 연도의 절입일 부근
+    for year in (1908, 1948, 1954, 1961, 1987, 1988):
+        for month in range(1, 13):
+            for day in (4, 5, 6, 7, 8):
+                rows.append((year, month, day, rng.choice([0, 1, 23]), rng.choice([0, 29, 30, 59]), True,
+                             rng.randint(-1, len(CITY_CODES) - 1)))
+    return rows
+
+
+ROWS = _rows()
+
+
+def _scalar(row):
+    year, month, day, hour, minute, male, city = row
+    return calculate_solar_saju(year, month, day, hour, minute, male=male,
+                                city=CITY_CODES[city] if city >= 0 else '알수없음')
+
+
+def test_batch_matches_scalar():
+    columns = np.array([row[:5] for row in ROWS])
+    result = calculate_solar_saju_batch(*columns.T, male=np.array([row[5] for row in ROWS]),
+                                        city_code=np.array([row[6] for row in ROWS]))
+    codes = pack_batch(result)
+    for i, row in enumerate(ROWS):
+        expected = _scalar(row)
+        assert unpack_pillars(int(codes[i])) == {key: expected[key] for key in PILLARS}, row
+        elements = {ELEMENT_ORDER[k]: int(v) for k, v in enumerate(result['elements'][i]) if v}
+        assert elements == expected['elements'], row
+        assert bool(result['great_luck_forward'][i]) == (expected['great_luck']['direction'] == '순행'), row
+        adjusted = str(result['adjusted_time'][i].astype('datetime64[m]')).replace('T', ' ')
+        assert adjusted == expected['birth_info']['adjusted_time'], row
+
+
+def test_city_longitude_matches_city_code():
+    cities = [CITY_CODES[0], CITY_CODES[-1], 'Los Angeles']
+    by_code = calculate_solar_saju_batch(1990, 5, 15, 14, 30, city_code=[0, len(CITY_CODES) - 1, -1])
+    by_longitude = calculate_solar_saju_batch(1990, 5, 15, 14, 30, city_longitude=city_longitudes(cities))
+    np.testing.assert_array_equal(by_code['adjusted_time'], by_longitude['adjusted_time'])
+    assert np.isnan(city_longitudes(['Los Angeles'])[0])
+
+
+@pytest.mark.parametrize('args', [
+    (2023, 2, 29, 0, 0), (2000, 13, 1, 0, 0), (2000, 1, 1, 24, 0), (2000, 1, 1, 0, 60),
+])
+def test_invalid_input_raises(args):
+    with pytest.raises(ValueError):
+        calculate_solar_saju_batch(*args)
+
+
+def test_broadcast_scalars():
+    result = calculate_solar_saju_batch([1990, 1991, 1992], 5, 15, 14)
+    assert result['year_stem'].shape == (3,)
@@ -0,0 +1,72 @@
+# tests/test_branches.py
+# 지지 상호작용 엔진: 규칙별 직접 대조와 같은 결과, 세 글자 관계의 두 글자 생략, 자형, 배치 비트, 운 지지별 관계
+
+import random
+
+import numpy as np
+import pytest
+
+from saju_analyzer import branches
+from saju_engine.sexagenary import BRANCHES
+
+
+def naive_bits(indexes):
+    """규칙마다 지지 목록을 직접 대조 (세 글자 관계가 가리는 두 글자 관계 제외)"""
+    names = [BRANCHES[i] for i in indexes]
+    found = {i for i, relation in enumerate(branches.RELATIONS)
+             if (names.count(relation.branches[0]) >= 2 if relation.duplicate
+                 else all(branch in names for branch in relation.branches))}
+    found -= {i for i, full in branches._COVERED_BY.items() if full in found}
+    return sum(1 << i for i in found)
+
+
+def names(indexes):
+    return [relation.name for relation in branches.describe(branches.relation_bits(indexes))]
+
+
+def b(text):
+    return [BRANCHES.index(ch) for ch in text]
+
+
+@pytest.mark.parametrize('size', [4, 5, 6])
+def test_bits_match_naive_rules(size):
+    rng = random.Random(size)
+    rows = [[rng.randrange(12) for _ in range(size)] for _ in range(2000)]
+    for row in rows:
+        assert branches.relation_bits(row) == naive_bits(row), row
+    assert branches.interactions_batch(rows).tolist() == [naive_bits(row) for row in rows]
+
+
+def test_full_groups_hide_pairs():
+    assert names(b('申子辰午')) == ['申子辰三合', '子午沖']
+    assert '子辰半合' in names(b('子辰卯酉'))
+    assert names(b('寅巳申亥')).count('寅巳申三刑') == 1
+    assert '寅巳刑' not in names(b('寅巳申亥'))
+
+
+def test_self_punishment_needs_duplicate():
+    assert '午午自刑' in names(b('午午子丑'))
+    assert not any(name.endswith('自刑') for name in names(b('午子丑卯')))
+    mask, duplicates, positions = branches.branch_masks(b('午子午'))
+    assert duplicates == 1 << BRANCHES.index('午')
+    assert positions[BRANCHES.index('午')] == 0b101
+
+
+def test_interactions_report_positions():
+    # 원국 4개 + 대운 1개: 대운 申이 申子辰三合을 완성
+    result = {r['name']: r for r in branches.interactions(b('子辰午未申'))}
+    assert result['申子辰三合']['positions'] == [0, 1, 4]
+    assert result['申子辰三合']['element'] == '水'
+    assert result['子午沖']['positions'] == [0, 2]
+
+
+def test_relations_by_branch_select_luck_relations():
+    bits = branches.relation_bits(b('子辰午未申'))
+    from_luck = bits & branches.RELATIONS_BY_BRANCH[BRANCHES.index('申')]
+    assert all('申' in relation.branches for relation in branches.describe(from_luck))
+    assert '申子辰三合' in [relation.name for relation in branches.describe(from_luck)]
+
+
+def test_batch_accepts_single_row():
+    bits = branches.interactions_batch(b('申子辰午'))
+    assert bits.dtype == np.uint64 and bits.tolist() == [branches.relation_bits(b('申子辰午'))]
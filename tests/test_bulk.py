@@ -0,0 +1,125 @@
+# tests/test_bulk.py
+# 대량 계산: 입력 파싱, 행 오류 기록, 체크포인트 --resume 잘라내기, 출생지 경고 중복 방지
+
+import json
+
+import pytest
+
+import saju_calculator
+from saju_engine import bulk
+
+RECORDS = [
+    {'id': f'p{i}', 'birth_year': 1950 + 5 * i, 'birth_month': 1 + i % 12, 'birth_day': 1 + 2 * i,
+     'birth_hour': i % 24, 'birth_minute': 7 * i % 60, 'is_male': i % 2 == 0, 'city': '부산' if i % 3 else '서울'}
+    for i in range(10)
+]
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "births.jsonl"
+    lines = [json.dumps(record, ensure_ascii=False) for record in RECORDS]
+    lines.insert(4, '{"id": "bad", "birth_year": 2000}')
+    lines.insert(7, '')
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def run(input_path, output_path, **kwargs):
+    return bulk.run_bulk(input_path, output_path, workers=1, chunk_size=3, progress_interval=1e9, **kwargs)
+
+
+def read(path):
+    with open(path, 'rb') as fh:
+        return fh.read()
+
+
+@pytest.mark.parametrize('value, expected', [('남', True), ('F', False), ('', True), (None, True), (False, False)])
+def test_parse_bool(value, expected):
+    assert bulk.parse_record({'birth_year': '1990', 'birth_month': '5', 'birth_day': '15', 'birth_hour': '14',
+                              'is_male': value})['is_male'] is expected
+
+
+def test_parse_record_requires_fields():
+    with pytest.raises(ValueError):
+        bulk.parse_record({'birth_year': 1990})
+
+
+def test_rows_and_errors(tmp_path, input_path):
+    output = str(tmp_path / "charts.jsonl")
+    stats = run(input_path, output)
+    assert (stats['rows'], stats['written'], stats['errors']) == (11, 10, 1)
+
+    rows = [json.loads(line) for line in read(output).decode('utf-8').splitlines()]
+    assert [row['id'] for row in rows] == [record['id'] for record in RECORDS]
+    errors = [json.loads(line) for line in read(output + '.errors.jsonl').decode('utf-8').splitlines()]
+    assert [(error['line'], error['id']) for error in errors] == [(5, 'bad')]
+
+
+@pytest.mark.parametrize('extension', ['jsonl', 'csv', 'parquet'])
+def test_resume_truncates_uncheckpointed_output(tmp_path, monkeypatch, input_path, extension):
+    if extension == 'parquet':
+        pytest.importorskip('pyarrow')
+    expected_path = str(tmp_path / f"expected.{extension}")
+    run(input_path, expected_path)
+
+    # 세 번째 청크를 쓴 뒤 체크포인트 저장 전에 중단
+    output = str(tmp_path / f"charts.{extension}")
+    save_checkpoint = bulk._save_checkpoint
+    calls = []
+
+    def interrupted(path, state):
+        calls.append(path)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        save_checkpoint(path, state)
+
+    monkeypatch.setattr(bulk, '_save_checkpoint', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        run(input_path, output)
+    monkeypatch.setattr(bulk, '_save_checkpoint', save_checkpoint)
+
+    checkpoint = json.loads(read(output + '.checkpoint'))
+    assert checkpoint['rows_done'] == 6
+
+    stats = run(input_path, output, resume=True)
+    assert stats['rows'] == 5 and stats['rows_total'] == 11
+    if extension == 'parquet':
+        import pyarrow.parquet as pq
+        assert pq.read_table(output).to_pylist() == pq.read_table(expected_path).to_pylist()
+    else:
+        assert read(output) == read(expected_path)
+        assert read(output + '.errors.jsonl') == read(expected_path + '.errors.jsonl')
+
+
+def test_resume_rejects_other_job(tmp_path, input_path):
+    output = str(tmp_path / "charts.jsonl")
+    run(input_path, output)
+    with pytest.raises(ValueError):
+        run(input_path, output, resume=True, analysis=True)
+
+
+def test_birthplace_warnings_once_per_city(tmp_path, monkeypatch):
+    # 같은 해외/알 수 없는 출생지가 수천 행에 나와도 경고는 출생지별 한 번
+    cities = ['Los Angeles', 'NYC', '없는도시123', '서울']
+    path = tmp_path / "foreign.jsonl"
+    path.write_text(''.join(
+        json.dumps({'id': f'f{i}', 'birth_year': 1980 + i % 30, 'birth_month': 1 + i % 12, 'birth_day': 1 + i % 28,
+                    'birth_hour': i % 24, 'city': cities[i % len(cities)]}, ensure_ascii=False) + '\n'
+        for i in range(200)
+    ), encoding='utf-8')
+
+    warnings = []
+    monkeypatch.setattr(saju_calculator.events, 'warning',
+                        lambda logger, event, message='', **fields: warnings.append((event, fields['city'])))
+    saju_calculator._warn_unknown_city.cache_clear()
+    saju_calculator._warn_foreign_city.cache_clear()
+    try:
+        stats = run(str(path), str(tmp_path / "charts.jsonl"))
+    finally:
+        saju_calculator._warn_unknown_city.cache_clear()
+        saju_calculator._warn_foreign_city.cache_clear()
+
+    assert stats['written'] == 200
+    assert sorted(warnings) == [('time.foreign_city', 'Los Angeles'), ('time.foreign_city', 'NYC'),
+                                ('time.unknown_city', '없는도시123')]
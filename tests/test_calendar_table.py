@@ -0,0 +1,56 @@
+# tests/test_calendar_table.py
+# 만세력 테이블: 날짜별 간지가 사주 계산(그날 23:59)과 일치, 절입 표시, 월운 전환, 범위/형식 검사
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from saju_calculator import calculate_chart
+from saju_engine.calendar_table import CalendarTable, get_calendar_table
+
+table = get_calendar_table()
+pytestmark = pytest.mark.skipif(table is None, reason="만세력 테이블 없음")
+
+
+def test_pillars_match_chart_at_end_of_day():
+    rng = random.Random(14)
+    span = (table.last_date - table.first_date).days
+    for _ in range(300):
+        day = table.first_date + timedelta(days=rng.randrange(span + 1))
+        chart = calculate_chart(datetime(day.year, day.month, day.day, 23, 59), use_cache=False)
+        row = table.pillars(day)
+        assert (row['year_pillar'], row['month_pillar'], row['day_pillar']) == \
+               (chart['year_pillar'], chart['month_pillar'], chart['day_pillar']), day
+
+
+def test_solar_term_marks_and_year_pillar():
+    assert table.pillars(date(2024, 2, 4))['solar_term'] == '입춘'
+    assert table.pillars(date(2024, 2, 3))['solar_term'] is None
+    assert table.year_pillar(2024) == '甲辰'
+    assert table.pillars(date(2024, 2, 4))['year_pillar'] == '甲辰'
+    assert table.pillars(date(2024, 2, 3))['year_pillar'] == '癸卯'
+
+
+def test_month_transitions_follow_terms():
+    transitions = table.month_transitions(date(2024, 1, 1), date(2024, 12, 31))
+    # 1월 1일 시점 월운 + 12번의 절입 (소한 ~ 대설)
+    assert len(transitions) == 13
+    assert transitions[0]['start_date'] == '2024-01-01'
+    assert [t['start_date'] for t in transitions[1:3]] == ['2024-01-06', '2024-02-04']
+    assert transitions[2]['month_pillar'] == '丙寅'
+
+
+def test_range_is_clipped():
+    before = table.first_date - timedelta(days=1)
+    assert table.pillars(before) is None and table.year_pillar(before.year - 1) is None
+    view = table.pillars_for_range(before - timedelta(days=10), table.first_date + timedelta(days=2))
+    assert view.start == table.first_date and len(view) == 3
+    assert len(table.pillars_for_range(date(2000, 1, 2), date(2000, 1, 1))) == 0
+
+
+def test_rejects_unknown_format(tmp_path):
+    path = tmp_path / "calendar.bin"
+    path.write_bytes(b'XXXX' + bytes(12))
+    with pytest.raises(ValueError):
+        CalendarTable(str(path))
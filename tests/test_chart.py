@@ -0,0 +1,64 @@
+# tests/test_chart.py
+# 정수 사주 코드와 SajuChart: 육십갑자 왕복, 코드 압축/배치 압축, dict/SajuData 손실 없는 변환
+
+import numpy as np
+import pytest
+
+from saju_analyzer.chart import SajuChart
+from saju_calculator import calculate_solar_saju, calculate_solar_saju_batch
+from saju_engine.sexagenary import (
+    is_consistent,
+    pack_batch,
+    pack_chart,
+    pack_pillars,
+    pillar_index,
+    pillar_name,
+    unpack_chart,
+    unpack_pillars,
+)
+
+
+def test_sexagenary_round_trip():
+    assert [pillar_index(pillar_name(i)) for i in range(60)] == list(range(60))
+    assert pillar_name(0) == '甲子' and pillar_name(59) == '癸亥'
+
+
+@pytest.mark.parametrize('pillar', ['甲丑', 'XY', '甲', '甲子子', None])
+def test_invalid_pillars(pillar):
+    with pytest.raises(ValueError):
+        pillar_index(pillar)
+
+
+def test_pack_round_trip_scalar_and_array():
+    assert unpack_chart(pack_chart(59, 0, 31, 7)) == (59, 0, 31, 7)
+    codes = pack_chart(*(np.arange(60, dtype=np.int64) for _ in range(4)))
+    assert [part.tolist() for part in unpack_chart(codes)] == [list(range(60))] * 4
+
+
+def test_pack_batch_matches_scalar_pillars():
+    dates = [(1990, 5, 15, 14), (2000, 2, 4, 0), (1955, 12, 31, 23)]
+    codes = pack_batch(calculate_solar_saju_batch(*zip(*dates)))
+    for code, args in zip(codes.tolist(), dates):
+        result = calculate_solar_saju(*args)
+        assert code == pack_pillars(result)
+        assert is_consistent(code)
+        assert unpack_pillars(code) == {key: result[key] for key in
+                                        ('year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar')}
+
+
+def test_chart_round_trips_and_matches_elements():
+    result = calculate_solar_saju(1990, 5, 15, 14, 30)
+    chart = SajuChart.from_dict(result)
+    assert chart.element_counts() == result['elements']
+    assert sum(chart.elements) == 8
+    assert chart.to_dict() == {key: result[key] for key in chart.to_dict()}
+    assert SajuChart.from_saju_data(chart.to_saju_data()) == chart
+    assert hash(chart) == hash(chart.code) and len({chart, SajuChart.from_dict(result)}) == 1
+    assert chart.stems[2] == chart.day_stem == '甲乙丙丁戊己庚辛壬癸'.index(result['day_pillar'][0])
+
+
+def test_chart_has_no_instance_dict():
+    chart = SajuChart.from_indexes(0, 2, 4, 6)
+    assert not hasattr(chart, '__dict__')
+    with pytest.raises(AttributeError):
+        chart.extra = 1
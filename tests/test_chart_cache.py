@@ -0,0 +1,66 @@
+# tests/test_chart_cache.py
+# 사주 계산 캐시: 조정된 분 + 성별 키, 반환값 복사, 비활성화, 시간 조정 규칙 변경 시 무효화
+
+from datetime import datetime
+
+import pytest
+
+from saju_calculator import calculate_chart
+from saju_engine.chart_cache import ChartCache, get_chart_cache
+from saju_engine.time_rules import TIME_RULES
+
+
+def test_get_or_compute_counts_hits():
+    cache = ChartCache(2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'value': len(calls)}
+
+    key = ChartCache.key(100, True)
+    assert cache.get_or_compute(key, compute) == {'value': 1}
+    assert cache.get_or_compute(key, compute) == {'value': 1}
+    assert cache.get_or_compute(ChartCache.key(100, False), compute) == {'value': 2}
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['enabled']) == (1, 2, True)
+
+
+def test_disabled_cache_always_computes():
+    cache = ChartCache(0)
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute(ChartCache.key(1, True), lambda: calls.append(1) or {})
+    assert len(calls) == 3 and cache.stats() == {'enabled': False, 'invalidations': 0}
+
+
+def test_same_minute_shares_entry_and_results_are_copies():
+    cache = get_chart_cache()
+    cache.invalidate("test")
+    first = calculate_chart(datetime(1990, 5, 15, 14, 30, 5))
+    hits = cache.stats()['hits']
+    second = calculate_chart(datetime(1990, 5, 15, 14, 30, 59))
+    assert cache.stats()['hits'] == hits + 1
+    assert first == second
+
+    first['great_luck']['pillars'][0]['pillar'] = 'XX'
+    first['elements'].clear()
+    third = calculate_chart(datetime(1990, 5, 15, 14, 30))
+    assert third == second == calculate_chart(datetime(1990, 5, 15, 14, 30), use_cache=False)
+
+
+def test_time_rule_change_invalidates(monkeypatch):
+    cache = get_chart_cache()
+    calculate_chart(datetime(2000, 1, 1, 12, 0))
+    assert len(cache._lru) > 0
+    before = cache.invalidations
+
+    monkeypatch.setattr(TIME_RULES, 'rules', list(TIME_RULES.rules))
+    TIME_RULES.register_rule(TIME_RULES.rule('summertime'))
+    assert cache.invalidations == before + 1 and len(cache._lru) == 0
+
+
+@pytest.mark.parametrize('male', [True, False])
+def test_gender_is_part_of_the_key(male):
+    chart = calculate_chart(datetime(1985, 3, 3, 3, 3), male=male)
+    assert chart == calculate_chart(datetime(1985, 3, 3, 3, 3), male=male, use_cache=False)
@@ -0,0 +1,36 @@
+# tests/test_city_longitude.py
+# 출생지 경도 조회: 알 수 없는/해외 출생지 경고는 출생지별로 한 번만
+
+import pytest
+
+import saju_calculator
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    saju_calculator._warn_unknown_city.cache_clear()
+    saju_calculator._warn_foreign_city.cache_clear()
+    events = []
+    monkeypatch.setattr(saju_calculator.events, 'warning',
+                        lambda logger, event, message='', **fields: events.append((event, fields['city'])))
+    yield events
+    saju_calculator._warn_unknown_city.cache_clear()
+    saju_calculator._warn_foreign_city.cache_clear()
+
+
+def test_foreign_city_warns_once(warnings):
+    for _ in range(1000):
+        assert saju_calculator.get_city_longitude('Los Angeles') is None
+    assert saju_calculator.get_city_longitude('베이징') is None
+    assert warnings == [('time.foreign_city', 'Los Angeles'), ('time.foreign_city', '베이징')]
+
+
+def test_unknown_city_warns_once(warnings):
+    for _ in range(3):
+        assert saju_calculator.get_city_longitude('없는도시123') is None
+    assert warnings == [('time.unknown_city', '없는도시123')]
+
+
+def test_domestic_city_does_not_warn(warnings):
+    assert saju_calculator.get_city_longitude('서울') == pytest.approx(126.978)
+    assert warnings == []
@@ -0,0 +1,55 @@
+# tests/test_compat.py
+# 궁합 점수 엔진: 행렬/상위 K/단일 쌍 점수 일치, 블록 분할과 무관한 결과
+
+import numpy as np
+import pytest
+
+from saju_analyzer.compat import score_matrix, score_pair, top_k_matches
+from saju_calculator import calculate_solar_saju
+from saju_engine.sexagenary import pack_pillars, unpack_pillars
+
+
+@pytest.fixture(scope='module')
+def codes():
+    rng = np.random.default_rng(15)
+    charts = [calculate_solar_saju(int(rng.integers(1940, 2030)), int(rng.integers(1, 13)), int(rng.integers(1, 29)),
+                                   int(rng.integers(0, 24)), int(rng.integers(0, 60)))
+              for _ in range(40)]
+    return np.array([pack_pillars(chart) for chart in charts], dtype=np.int64)
+
+
+def test_scores_are_bounded_and_symmetric(codes):
+    scores = score_matrix(codes, codes)
+    assert scores.shape == (len(codes), len(codes)) and scores.dtype == np.float32
+    assert (scores >= 0).all() and (scores <= 100).all()
+    # 오행/지지/일주 항목은 대칭이고 십신은 양방향 평균이라 점수 행렬도 대칭
+    np.testing.assert_allclose(scores, scores.T, atol=1e-4)
+
+
+def test_matrix_matches_score_pair(codes):
+    scores = score_matrix(codes[:5], codes[5:10])
+    for i in range(5):
+        for j in range(5):
+            pair = score_pair(unpack_pillars(int(codes[i])), unpack_pillars(int(codes[5 + j])))
+            assert pair['score'] == pytest.approx(round(float(scores[i, j]), 1))
+            assert set(pair['components']) == {'element', 'ten_god', 'branch', 'day'}
+
+
+@pytest.mark.parametrize('chunk_cells', [1, 7, 64, 1 << 22])
+def test_chunking_does_not_change_results(codes, chunk_cells):
+    full = score_matrix(codes, codes)
+    np.testing.assert_array_equal(score_matrix(codes, codes, chunk_cells=chunk_cells), full)
+
+    index, score = top_k_matches(codes[:3], codes, k=5, chunk_cells=chunk_cells)
+    assert index.shape == score.shape == (3, 5)
+    for row in range(3):
+        expected = np.sort(full[row])[::-1][:5]
+        np.testing.assert_array_equal(score[row], expected)
+        np.testing.assert_array_equal(full[row, index[row]], score[row])
+
+
+def test_top_k_is_capped_by_candidates(codes):
+    index, score = top_k_matches(codes[:1], codes[:3], k=10)
+    assert index.shape == (1, 3)
+    assert sorted(index[0].tolist()) == [0, 1, 2]
+    assert list(score[0]) == sorted(score[0], reverse=True)
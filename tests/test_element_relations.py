@@ -0,0 +1,45 @@
+# tests/test_element_relations.py
+# 개수 기반 오행 생극: 방향별 가중치 = 기존 쌍별 목록의 개수, 글자 수와 무관한 크기, 지연 생성 목록
+
+import random
+from collections import Counter
+
+import pytest
+
+from saju_analyzer.core import SajuAnalyzer
+from saju_analyzer.tables import ElementRelations, element_relations
+from saju_engine.sexagenary import pillar_name
+
+analyzer = SajuAnalyzer()
+
+
+@pytest.mark.parametrize('count', [4, 6, 12])
+def test_flows_match_pairwise_lists(count):
+    rng = random.Random(count)
+    for _ in range(200):
+        pillars = [pillar_name(rng.randrange(60)) for _ in range(count)]
+        relations = analyzer.analyze_element_relations(pillars)
+        legacy = analyzer._analyze_element_relations(pillars)
+        assert relations.legacy_dict() == legacy
+        assert relations['generation_flow'] == Counter(legacy['generation'])
+        assert relations['destruction_flow'] == Counter(legacy['destruction'])
+
+
+def test_weights_are_count_products():
+    # 木 3, 火 2, 土 1 → 木生火 = 3 × 2, 火生土 = 2 × 1, 木克土 = 3 × 1
+    relations = ElementRelations(['木', '木', '木', '火', '火', '土'])
+    assert relations['element_count'] == {'木': 3, '火': 2, '土': 1}
+    assert relations['generation_flow'] == {'木生火': 6, '火生土': 2}
+    assert relations['destruction_flow'] == {'木克土': 3}
+
+
+def test_size_does_not_grow_with_characters():
+    relations = element_relations('甲子' * 500 + '丙午' * 500)
+    assert sum(relations['element_count'].values()) == 2000
+    assert len(relations['generation_flow']) + len(relations['destruction_flow']) <= 10
+    # 기존 형식 목록은 요청할 때만 만들어짐
+    assert relations._pair_lists is None
+
+
+def test_unknown_characters_are_ignored():
+    assert element_relations('甲?子!')['element_count'] == {'木': 1, '水': 1}
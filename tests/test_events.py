@@ -0,0 +1,78 @@
+# tests/test_events.py
+# 구조화 이벤트 로깅: JSON/콘솔 형식, 레벨 게이팅(꺼진 레벨은 메시지를 만들지 않음), 핸들러 교체
+
+import io
+import json
+import logging
+
+import pytest
+
+from saju_engine import events
+
+
+@pytest.fixture
+def configure():
+    root = logging.getLogger(events.LOGGER_NAME)
+    level, propagate = root.level, root.propagate
+
+    def configure(fmt, level='DEBUG'):
+        stream = io.StringIO()
+        events.configure_logging(fmt, level, stream=stream)
+        return stream
+
+    yield configure
+    if events._handler is not None:
+        root.removeHandler(events._handler)
+        events._handler = None
+    root.setLevel(level)
+    root.propagate = propagate
+
+
+class Exploding:
+    def __format__(self, spec):
+        raise AssertionError("꺼진 레벨에서 메시지를 만들면 안 됨")
+
+
+def test_json_line_has_event_and_fields(configure):
+    stream = configure('json')
+    log = events.get_logger("test")
+    events.warning(log, "test.event", "도시 {city} 경도 {longitude:.1f}", city="서울", longitude=126.978)
+    payload = json.loads(stream.getvalue())
+    assert payload['event'] == "test.event" and payload['level'] == "WARNING"
+    assert payload['logger'] == "saju.test"
+    assert payload['message'] == "도시 서울 경도 127.0"
+    assert payload['city'] == "서울" and payload['longitude'] == 126.978
+
+
+def test_console_prefix_and_template_fallback(configure):
+    stream = configure('console')
+    log = events.get_logger("test")
+    events.error(log, "test.error", "오류: {missing}")
+    events.info(log, "test.info")
+    assert stream.getvalue().splitlines() == ["❌ 오류: {missing}", "test.info"]
+
+
+def test_disabled_level_does_not_render(configure):
+    stream = configure('json', level='WARNING')
+    log = events.get_logger("test")
+    events.debug(log, "test.debug", "{value}", value=Exploding())
+    events.info(log, "test.info", "{value}", value=Exploding())
+    assert stream.getvalue() == ""
+
+
+def test_exception_includes_traceback(configure):
+    stream = configure('json')
+    log = events.get_logger("test")
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        events.exception(log, "test.exception", "실패: {error}", error=str(e))
+    payload = json.loads(stream.getvalue())
+    assert payload['message'] == "실패: boom" and "ValueError: boom" in payload['exc_info']
+
+
+def test_reconfigure_replaces_handler(configure):
+    first = configure('console')
+    second = configure('console')
+    events.warning(events.get_logger("test"), "test.once", "한 번")
+    assert first.getvalue() == "" and second.getvalue() == "⚠️  한 번\n"
@@ -0,0 +1,64 @@
+# tests/test_extended_cache.py
+# 확장 분석 캐시: (사주 코드, 계절) 키, 문자열 구현과 같은 결과, JSON 바이트 1회 직렬화, 비활성화
+
+import pytest
+
+from saju_analyzer import serialization
+from saju_analyzer.core import SajuAnalyzer, SajuData
+from saju_analyzer.extended_cache import ExtendedCache, get_extended_cache
+
+PILLARS = ('庚午', '辛巳', '庚辰', '癸未')
+
+
+def saju(month, pillars=PILLARS):
+    return SajuData(*pillars, birth_info={'original_time': f"1990-{month:02d}-15 14:30"}, elements={}, great_luck={})
+
+
+@pytest.fixture
+def analyzer():
+    get_extended_cache().clear()
+    yield SajuAnalyzer()
+    get_extended_cache().clear()
+
+
+def test_same_season_shares_entry(analyzer):
+    cache = get_extended_cache()
+    if not cache.stats()['enabled']:
+        pytest.skip("확장 분석 캐시 사용 안 함")
+    hits = cache.stats()['hits']
+    may, june, august = (analyzer.analyze_extended_saju(saju(month)) for month in (5, 6, 8))
+    assert cache.stats()['hits'] == hits + 1
+    assert may.cache_entry is june.cache_entry
+    assert august.cache_entry is not may.cache_entry
+    assert may.seasonal_balance['season'] == '夏' and august.seasonal_balance['season'] == '秋'
+
+
+@pytest.mark.parametrize('month', [1, 4, 5, 11])
+def test_cached_result_matches_string_implementation(analyzer, month):
+    data = saju(month)
+    expected = {'basic_data': data.to_dict(), **analyzer._analyze_extended_fields(list(PILLARS), data.birth_info)}
+    assert analyzer.analyze_extended_saju(data).to_dict() == expected
+    assert analyzer.analyze_extended_saju(saju(month)).to_dict() == expected
+
+
+def test_json_bytes_are_serialized_once(analyzer):
+    first = analyzer.analyze_extended_saju(saju(5))
+    second = analyzer.analyze_extended_saju(saju(5))
+    assert first.cache_entry.json_bytes() is second.cache_entry.json_bytes()
+    assert serialization.loads(first.to_json_bytes()) == serialization.loads(serialization.dumps(first.to_dict()))
+
+
+def test_non_sexagenary_input_bypasses_cache(analyzer):
+    cache = get_extended_cache()
+    before = cache.stats()
+    result = analyzer.analyze_extended_saju(saju(5, ('甲丑', '辛巳', '庚辰', '癸未')))
+    assert result.hidden_stems
+    assert cache.stats().get('misses') == before.get('misses')
+
+
+def test_disabled_cache_computes_every_time():
+    cache = ExtendedCache(0)
+    calls = []
+    first = cache.get_or_compute(cache.key(1, '夏'), lambda: calls.append(1) or {'a': 1})
+    second = cache.get_or_compute(cache.key(1, '夏'), lambda: calls.append(1) or {'a': 1})
+    assert len(calls) == 2 and first is not second and cache.stats() == {'enabled': False}
@@ -0,0 +1,85 @@
+# tests/test_gazetteer.py
+# 오프라인 지명 사전: 정규화, 국내 로마자 표기, 해외 약칭/표준 표기, 최근접 지명
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from saju_calculator import get_city_longitude
+from saju_engine.gazetteer import KIND_DISTRICT, get_gazetteer, normalize_place_name
+
+gazetteer = get_gazetteer()
+pytestmark = pytest.mark.skipif(gazetteer is None, reason="지명 사전 없음")
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('서울특별시', '서울'),
+    ('부산 해운대구', '부산 해운대'),
+    ('중구', '중구'),
+    ('오사카 시', '오사카'),
+    ('Gangnam-gu', 'gangnam'),
+    ('New York City', 'new york'),
+    ('Busan Metropolitan City', 'busan'),
+    ('São Paulo', 'sao paulo'),
+])
+def test_normalize_place_name(text, expected):
+    assert normalize_place_name(text) == expected
+
+
+@pytest.mark.parametrize('name, full_name', [
+    ('Seoul', '서울특별시'),
+    ('Busan', '부산광역시'),
+    ('Gangnam-gu', '서울특별시 강남구'),
+    ('Busan Jung-gu', '부산광역시 중구'),
+    ('Suwon-si', '경기도 수원시'),
+    ('Gangneung', '강원특별자치도 강릉시'),
+    ('서울 중구', '서울특별시 중구'),
+])
+def test_korean_romanized_names(name, full_name):
+    assert gazetteer.lookup(name).full_name == full_name
+
+
+@pytest.mark.parametrize('name, display', [
+    ('New York', '뉴욕'),
+    ('NYC', '뉴욕'),
+    ('LA', '로스앤젤레스'),
+    ('엘에이', '로스앤젤레스'),
+    ('오사카', '오사카'),
+    ('오사카 시', '오사카'),
+    ('북경', '베이징'),
+    ('Beijing', '베이징'),
+    ('Tokyo', '도쿄'),
+])
+def test_world_names_and_exonyms(name, display):
+    assert gazetteer.lookup(name).name == display
+
+
+def test_domestic_names_take_priority():
+    # 경기 광주시보다 광주광역시, 중국 안양보다 경기 안양시
+    assert gazetteer.lookup('광주').full_name == '광주광역시'
+    assert gazetteer.lookup('Anyang').country == 'KR'
+
+
+def test_city_longitude():
+    assert get_city_longitude('Seoul') == pytest.approx(126.978)
+    assert get_city_longitude('Busan') == pytest.approx(129.0756)
+    assert get_city_longitude('Tokyo') is None
+
+
+def test_search_prefix():
+    names = [place.name for place in gazetteer.search('해운')]
+    assert '해운대구' in names
+
+
+def test_nearest():
+    place = gazetteer.nearest(35.1631, 129.1635, country='KR')
+    assert place.full_name == '부산광역시 해운대구' and place.kind == KIND_DISTRICT
+
+
+def test_runtime_does_not_import_geonamescache():
+    # 지명 사전은 gazetteer.bin 만 읽으므로 geonamescache 는 빌드 전용
+    code = ("import sys; from saju_engine.gazetteer import get_gazetteer; "
+            "assert get_gazetteer().lookup('Seoul') is not None; assert 'geonamescache' not in sys.modules")
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
@@ -0,0 +1,48 @@
+# tests/test_iter_charts.py
+# 구간 열거: 묶음 크기/개수, 출생 시각 등차수열, 배치 계산과 같은 결과, 간격 검증
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from saju_calculator import calculate_solar_saju_batch, iter_charts
+from saju_engine.batch import CITY_CODES
+
+
+def _concat(chunks):
+    chunks = list(chunks)
+    return chunks, {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+
+@pytest.mark.parametrize('step, count', [('hour', 24 * 3), ('day', 3), (timedelta(minutes=90), 48)])
+def test_chunks_cover_half_open_range(step, count):
+    chunks, merged = _concat(iter_charts(datetime(1988, 5, 7), datetime(1988, 5, 10), step=step, chunk_size=10))
+    assert len(merged['birth_time']) == count
+    assert all(len(chunk['birth_time']) == 10 for chunk in chunks[:-1])
+    assert merged['birth_time'][0] == np.datetime64('1988-05-07T00:00')
+    assert np.all(np.diff(merged['birth_time']) == np.diff(merged['birth_time'])[0])
+    assert merged['birth_time'][-1] < np.datetime64('1988-05-10T00:00')
+
+
+def test_matches_batch_calculation():
+    # 써머타임(1988년 5월) 시작 부근, 부산 경도조정 포함
+    start, end = datetime(1988, 5, 7, 12, 0), datetime(1988, 5, 9, 12, 0)
+    _, merged = _concat(iter_charts(start, end, step='minute', city='부산', male=False, chunk_size=1000))
+    times = merged['birth_time'].astype(datetime)
+    expected = calculate_solar_saju_batch(
+        [t.year for t in times], [t.month for t in times], [t.day for t in times],
+        [t.hour for t in times], [t.minute for t in times], male=False, city_code=CITY_CODES.index('부산')
+    )
+    for key, value in expected.items():
+        np.testing.assert_array_equal(merged[key], value, err_msg=key)
+
+
+def test_empty_range_yields_nothing():
+    assert list(iter_charts(datetime(2000, 1, 2), datetime(2000, 1, 1))) == []
+
+
+@pytest.mark.parametrize('kwargs', [{'step': 'week'}, {'step': timedelta(seconds=30)}, {'chunk_size': 0}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        list(iter_charts(datetime(2000, 1, 1), datetime(2000, 1, 2), **kwargs))
@@ -0,0 +1,132 @@
+# tests/test_kasi_async.py
+# 비동기 KASI 클라이언트: 블로킹 캐시는 스레드에서, 24절기 페이지 조회는 동기 클라이언트와 같은 결과
+
+import asyncio
+import threading
+import xml.etree.ElementTree as ET
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from saju_engine.kasi_async import AsyncKasiClient
+from saju_engine.kasi_cache import MemoryLRUCache, SQLiteCache
+from saju_engine.kasi_client import DivisionsYearPages, KasiClient, division_cache_key
+
+
+class RecordingSQLiteCache(SQLiteCache):
+    """get/set 이 실행된 스레드를 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ttl=None):
+        self.threads.append(threading.get_ident())
+        super().set(key, value, ttl)
+
+
+class RecordingMemoryCache(MemoryLRUCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ttl=None):
+        self.threads.append(threading.get_ident())
+        super().set(key, value, ttl)
+
+
+def _fake_year(client):
+    async def fetch_year(year, service_key):
+        return {month: [{'name': f'{year}-{month}'}] for month in range(1, 13)}
+
+    client.fetch_24_divisions_year = fetch_year
+
+
+def test_sqlite_cache_runs_off_event_loop(tmp_path):
+    cache = RecordingSQLiteCache(str(tmp_path / "kasi.sqlite3"))
+    client = AsyncKasiClient()
+    _fake_year(client)
+
+    async def run():
+        loop_thread = threading.get_ident()
+        first = await client.get_24_divisions(2024, 3, "key", cache)
+        second = await client.get_24_divisions(2024, 3, "key", cache)
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(run())
+    assert first == second == [{'name': '2024-3'}]
+    assert cache.get(division_cache_key(2024, 12)) == [{'name': '2024-12'}]
+    assert len(cache.threads) == 1 + 12 + 1 + 1
+    assert loop_thread not in cache.threads[:-1]
+
+
+def test_memory_cache_stays_on_event_loop():
+    cache = RecordingMemoryCache(64)
+    client = AsyncKasiClient()
+    _fake_year(client)
+
+    async def run():
+        await client.get_24_divisions(2024, 3, "key", cache)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert set(cache.threads) == {loop_thread}
+
+
+TERMS = [('소한', '20240106', '0449', 285), ('입춘', '20240204', '1727', 315), ('경칩', '20240305', '1123', 345),
+         ('입하', '20240505', '0910', 45), ('동지', '20241221', '1821', 270), ('소한', '20250105', '1033', 285)]
+
+
+def _page(items, total):
+    body = ''.join(f"<item><dateName>{name}</dateName><locdate>{date}</locdate><kst>{kst}</kst>"
+                   f"<sunLongitude>{lon}</sunLongitude></item>" for name, date, kst, lon in items)
+    return ET.fromstring(f"<response><header><resultCode>00</resultCode></header><body><items>{body}</items>"
+                         f"<totalCount>{total}</totalCount></body></response>")
+
+
+def _fake_pages(page_size=2):
+    requested = []
+
+    def get_xml(url, params):
+        requested.append(params['pageNo'])
+        start = (params['pageNo'] - 1) * page_size
+        return _page(TERMS[start:start + page_size], len(TERMS))
+
+    return get_xml, requested
+
+
+def test_divisions_pages_follow_total_count():
+    pages = DivisionsYearPages(2024, "key")
+    assert pages.params() == {'serviceKey': 'key', 'solYear': '2024', 'numOfRows': 50, 'pageNo': 1}
+    assert pages.add_page(_page(TERMS[:4], len(TERMS))) is True
+    assert pages.params()['pageNo'] == 2
+    assert pages.add_page(_page(TERMS[4:], len(TERMS))) is False
+    # 다른 연도(2025년 소한)는 제외
+    assert [term['name'] for month in pages.by_month.values() for term in month] == [t[0] for t in TERMS[:5]]
+
+
+def test_async_and_sync_year_fetch_match():
+    sync_client = KasiClient()
+    sync_client.get_xml, sync_requests = _fake_pages()
+    expected = sync_client.fetch_24_divisions_year(2024, "key")
+    sync_client.close()
+
+    async_client = AsyncKasiClient()
+    get_xml, async_requests = _fake_pages()
+
+    async def fake_get_xml(url, params):
+        return get_xml(url, params)
+
+    async_client.get_xml = fake_get_xml
+    assert asyncio.run(async_client.fetch_24_divisions_year(2024, "key")) == expected
+    assert sync_requests == async_requests == [1, 2, 3]
+    assert expected[2][0]['name'] == '입춘'
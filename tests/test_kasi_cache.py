@@ -0,0 +1,157 @@
+# tests/test_kasi_cache.py
+# KASI 응답 캐시: TTL 만료, LRU/SQLite 축출, 2단 캐시, 환경 변수 구성
+
+from datetime import datetime
+
+import pytest
+
+from saju_engine import kasi_cache
+from saju_engine.kasi_cache import (
+    CacheBackend,
+    MemoryLRUCache,
+    SQLiteCache,
+    TieredCache,
+    create_kasi_cache_from_env,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(kasi_cache, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    return SQLiteCache(str(tmp_path / "kasi.sqlite3"), max_entries=3, default_ttl=100, evict_interval=1)
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_memory_ttl(clock):
+    cache = MemoryLRUCache(10, default_ttl=100)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=500)
+    clock.now += 99
+    assert cache.get('a') == 1
+    clock.now += 1
+    assert cache.get('a') is None and cache.get('b') == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_memory_without_ttl(clock):
+    cache = MemoryLRUCache(10, default_ttl=0)
+    cache.set('a', 1)
+    clock.now += 10 ** 9
+    assert cache.get('a') == 1
+
+
+def test_memory_lru_eviction(clock):
+    cache = MemoryLRUCache(2, default_ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')            # a 가 최근 사용
+    cache.set('c', 3)         # b 축출
+    assert cache.get('b') is None and cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.evictions == 1 and len(cache) == 2
+
+
+def test_sqlite_round_trip_datetime(sqlite_cache):
+    value = {'terms': [{'name': '입춘', 'datetime': datetime(2024, 2, 4, 17, 27)}]}
+    sqlite_cache.set('2024', value)
+    assert sqlite_cache.get('2024') == value
+
+
+def test_sqlite_ttl(clock, sqlite_cache):
+    sqlite_cache.set('a', 1)
+    clock.now += 100
+    assert sqlite_cache.get('a') is None
+    assert len(sqlite_cache) == 0
+
+
+def test_sqlite_evicts_least_recently_accessed(clock, sqlite_cache):
+    for key in 'abc':
+        sqlite_cache.set(key, key)
+        clock.now += 1
+    sqlite_cache.get('a')
+    clock.now += 1
+    sqlite_cache.set('d', 'd')
+    assert len(sqlite_cache) == 3
+    assert sqlite_cache.get('b') is None
+    assert [sqlite_cache.get(key) for key in 'acd'] == ['a', 'c', 'd']
+
+
+def test_sqlite_eviction_is_amortized(clock, tmp_path):
+    cache = SQLiteCache(str(tmp_path / "amortized.sqlite3"), max_entries=2, default_ttl=None, evict_interval=4)
+    for i in range(3):
+        cache.set(str(i), i)
+        clock.now += 1
+    assert len(cache) == 3          # 정리 전에는 잠시 초과
+    cache.set('3', 3)               # 네 번째 쓰기에서 오래된 항목 정리
+    assert len(cache) == 2 and cache.evictions == 2
+    assert cache.get('0') is None and cache.get('3') == 3
+
+
+def test_sqlite_shared_between_instances(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    SQLiteCache(path).set('key', [1, 2])
+    assert SQLiteCache(path).get('key') == [1, 2]
+
+
+def test_tiered_fills_front_from_back(sqlite_cache):
+    front = MemoryLRUCache(10, default_ttl=100)
+    cache = TieredCache(front, sqlite_cache)
+    sqlite_cache.set('a', 1)
+    assert front.get('a') is None
+    assert cache.get('a') == 1
+    assert front.get('a') == 1
+    cache.delete('a')
+    assert cache.get('a') is None and sqlite_cache.get('a') is None
+
+
+def test_tiered_front_keeps_back_expiry(clock, sqlite_cache):
+    front = MemoryLRUCache(10, default_ttl=10 ** 6)
+    cache = TieredCache(front, sqlite_cache)
+    sqlite_cache.set('a', 1, ttl=50)
+    clock.now += 40
+    assert cache.get_entry('a') == (1, clock.now + 10)
+    clock.now += 10
+    assert front.get('a') is None and cache.get('a') is None
+
+
+def test_tiered_front_keeps_no_expiry(clock, tmp_path):
+    back = SQLiteCache(str(tmp_path / "forever.sqlite3"), default_ttl=0)
+    front = MemoryLRUCache(10, default_ttl=100)
+    back.set('a', 1)
+    cache = TieredCache(front, back)
+    assert cache.get('a') == 1
+    clock.now += 10 ** 9
+    assert front.get('a') == 1
+
+
+@pytest.mark.parametrize('backend, expected', [('memory', MemoryLRUCache), ('sqlite', SQLiteCache),
+                                               ('tiered', TieredCache)])
+def test_create_from_env(monkeypatch, tmp_path, backend, expected):
+    monkeypatch.setenv("KASI_CACHE_BACKEND", backend)
+    monkeypatch.setenv("KASI_CACHE_PATH", str(tmp_path / "env.sqlite3"))
+    assert isinstance(create_kasi_cache_from_env(), expected)
+
+
+def test_create_falls_back_to_memory(monkeypatch, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("KASI_CACHE_BACKEND", "tiered")
+    monkeypatch.setenv("KASI_CACHE_PATH", str(blocker / "kasi.sqlite3"))
+    assert isinstance(create_kasi_cache_from_env(), MemoryLRUCache)
@@ -0,0 +1,40 @@
+# tests/test_luck.py
+# 대운 계산: 캐시 사용 여부와 관계없이 같은 결과 (대운 시작일은 분 단위 출생 시각 기준)
+
+import random
+from datetime import datetime
+
+import pytest
+
+from saju_calculator import calculate_chart, calculate_solar_saju
+from saju_engine.luck import great_luck_timeline
+
+
+def test_start_date_ignores_seconds():
+    base = great_luck_timeline(datetime(2020, 12, 15, 6, 40), '戊子', True)
+    with_seconds = great_luck_timeline(datetime(2020, 12, 15, 6, 40, 59, 999999), '戊子', True)
+    assert base == with_seconds
+
+
+@pytest.mark.parametrize('male', [True, False])
+def test_calculate_chart_cache_matches_uncached(male):
+    rng = random.Random(20261018)
+    for _ in range(300):
+        adjusted = datetime(rng.randint(1920, 2040), rng.randint(1, 12), rng.randint(1, 28),
+                            rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59), rng.randint(0, 999999))
+        assert calculate_chart(adjusted, male, use_cache=True) == calculate_chart(adjusted, male, use_cache=False)
+
+
+@pytest.mark.parametrize('city', ['서울', '부산', '제주', '강릉', '광주'])
+def test_calculate_solar_saju_cache_matches_uncached(city):
+    rng = random.Random(city)
+    for _ in range(100):
+        args = (rng.randint(1930, 2030), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59))
+        assert calculate_solar_saju(*args, city=city, use_cache=True) == \
+            calculate_solar_saju(*args, city=city, use_cache=False)
+
+
+def test_reported_chart_start_dates():
+    cached = calculate_solar_saju(2020, 12, 15, 6, 40, city='제주', use_cache=True)
+    uncached = calculate_solar_saju(2020, 12, 15, 6, 40, city='제주', use_cache=False)
+    assert cached['great_luck'] == uncached['great_luck']
@@ -0,0 +1,60 @@
+# tests/test_lunar_table.py
+# 음력 테이블: 윤달, 월 대소, 양력↔음력 왕복
+#
+# 테이블은 lunar_python 으로 생성되어 2017년처럼 한국천문연구원 역법과 윤달이 다른 해가 있으므로
+# 고정값 검사는 두 역법이 같은 해만 사용합니다.
+
+from datetime import date, timedelta
+
+import pytest
+
+from saju_engine.lunar_table import get_lunar_table
+
+table = get_lunar_table()
+pytestmark = pytest.mark.skipif(table is None, reason="음력 테이블 없음")
+
+
+@pytest.mark.parametrize('year, month, first_day', [
+    (2020, 4, date(2020, 5, 23)),
+    (2023, 2, date(2023, 3, 22)),
+    (2025, 6, date(2025, 7, 25)),
+])
+def test_leap_months(year, month, first_day):
+    assert table.leap_month(year) == month
+    assert table.to_solar(year, month, 1, is_leap_month=True) == first_day
+    # 윤달 직전 날은 같은 숫자의 평달 마지막 날
+    length = table.month_length(year, month)
+    assert table.to_lunar(first_day - timedelta(days=1)) == (year, month, length, False)
+    assert table.to_lunar(first_day) == (year, month, 1, True)
+
+
+@pytest.mark.parametrize('year, seollal', [
+    (1990, date(1990, 1, 27)), (2000, date(2000, 2, 5)), (2023, date(2023, 1, 22)), (2024, date(2024, 2, 10)),
+])
+def test_new_year(year, seollal):
+    assert table.to_solar(year, 1, 1) == seollal
+    assert table.to_lunar(seollal) == (year, 1, 1, False)
+    assert table.to_lunar(seollal - timedelta(days=1))[0] == year - 1
+
+
+def test_nonexistent_dates():
+    assert table.to_solar(2024, 3, 1, is_leap_month=True) is None   # 2024년은 윤달 없음
+    assert table.to_solar(2020, 5, 1, is_leap_month=True) is None   # 2020년 윤달은 4월
+    assert table.to_solar(2024, 13, 1) is None
+    for month in range(1, 13):
+        length = table.month_length(2024, month)
+        assert length in (29, 30)
+        assert table.to_solar(2024, month, length + 1) is None
+
+
+def test_round_trip_every_day():
+    day, end = table.to_solar(table.first_year, 1, 1), table.to_solar(table.last_year, 12, 29)
+    while day <= end:
+        lunar_year, month, lunar_day, leap = table.to_lunar(day)
+        assert table.to_solar(lunar_year, month, lunar_day, leap) == day
+        day += timedelta(days=1)
+
+
+def test_out_of_range():
+    assert table.to_solar(table.last_year + 1, 1, 1) is None
+    assert table.to_lunar(table.to_solar(table.first_year, 1, 1) - timedelta(days=1)) is None
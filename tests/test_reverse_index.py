@@ -0,0 +1,63 @@
+# tests/test_reverse_index.py
+# 사주 역색인: 조정된 시각 → 사주 → 역색인 구간 왕복
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from saju_calculator import calculate_chart, find_same_saju_times
+from saju_engine.reverse_index import get_reverse_index
+from saju_engine.sexagenary import pillar_index
+
+index = get_reverse_index()
+pytestmark = pytest.mark.skipif(index is None, reason="사주 역색인 없음")
+
+PILLARS = ('year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar')
+
+
+def pillars_at(adjusted: datetime):
+    chart = calculate_chart(adjusted, use_cache=False)
+    return tuple(chart[name] for name in PILLARS)
+
+
+def test_round_trip_random_times():
+    rng = random.Random(7)
+    for _ in range(200):
+        adjusted = datetime(rng.randint(index.first_year, index.last_year), rng.randint(1, 12), rng.randint(1, 28),
+                            rng.randint(0, 23), rng.randint(0, 59))
+        pillars = pillars_at(adjusted)
+        ranges = index.find(*(pillar_index(p) for p in pillars))
+        matching = [(start, end) for start, end in ranges if start <= adjusted < end]
+        assert len(matching) == 1
+
+        # 구간 양 끝(시작 분, 끝 직전 분)도 같은 사주, 끝 분은 다른 사주
+        start, end = matching[0]
+        assert pillars_at(start) == pillars
+        assert pillars_at(end - timedelta(minutes=1)) == pillars
+        assert pillars_at(end) != pillars
+
+
+def test_ranges_are_sorted_and_disjoint():
+    ranges = index.find(*(pillar_index(p) for p in ('庚午', '辛巳', '庚辰', '癸未')))
+    assert ranges
+    for (_, previous_end), (start, end) in zip(ranges, ranges[1:]):
+        assert previous_end <= start < end
+
+
+def test_inconsistent_chart_is_empty():
+    # 甲년의 월간은 丙寅부터 - 甲子년 甲寅월은 존재하지 않음
+    assert index.find(pillar_index('甲子'), pillar_index('甲寅'), 0, 0) == []
+
+
+def test_find_same_saju_times_limit():
+    pillars = ('庚午', '辛巳', '庚辰', '癸未')
+    everything = find_same_saju_times(*pillars)
+    assert len(everything) >= 2
+    assert find_same_saju_times(*pillars, limit=1) == everything[:1]
+
+
+@pytest.mark.parametrize('limit', [0, -1, -100])
+def test_find_same_saju_times_rejects_non_positive_limit(limit):
+    with pytest.raises(ValueError):
+        find_same_saju_times('庚午', '辛巳', '庚辰', '癸未', limit=limit)
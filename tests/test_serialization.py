@@ -0,0 +1,78 @@
+# tests/test_serialization.py
+# 사주 데이터 직렬화: 표준 json 과 같은 내용, orjson 없을 때 대체, 미리 직렬화한 값 잇기, msgpack 왕복, 1회 직렬화
+
+import json
+import sys
+
+import pytest
+
+from saju_analyzer import serialization
+from saju_analyzer.core import SajuAnalyzer, SajuData
+
+VALUE = {'year_pillar': '庚午', 'elements': {'木': 0, '火': 3}, 'great_luck': {'ages': [3, 13], 'start': None},
+         'score': 1.5, 'ok': True}
+
+
+def saju():
+    return SajuData('庚午', '辛巳', '庚辰', '癸未', birth_info={'original_time': "1990-05-15 14:30", 'city': '서울'},
+                    elements={'木': 0, '火': 3, '土': 2, '金': 3, '水': 1}, great_luck={'start_age': 3, 'pillars': ['壬午']})
+
+
+def test_dumps_matches_compact_json():
+    data = serialization.dumps(VALUE)
+    assert isinstance(data, bytes)
+    assert data == json.dumps(VALUE, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    assert serialization.loads(data) == serialization.loads(data.decode('utf-8')) == VALUE
+    assert serialization.loads(serialization.dumps({1: 'a'})) == {'1': 'a'}
+
+
+def test_standard_json_fallback(monkeypatch):
+    expected = serialization.dumps(VALUE)
+    monkeypatch.setattr(serialization, '_orjson', None)
+    monkeypatch.setattr(serialization, '_orjson_loaded', True)
+    assert serialization.dumps(VALUE) == expected
+    assert serialization.loads(expected) == VALUE
+
+
+def test_json_object_joins_serialized_values():
+    parts = {key: serialization.dumps(value) for key, value in VALUE.items()}
+    assert serialization.loads(serialization.json_object(parts)) == VALUE
+    assert serialization.json_object({}) == b'{}'
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip('msgpack')
+    value = {**VALUE, 'by_month': {1: ['소한'], 2: ['입춘']}}
+    assert serialization.unpackb(serialization.packb(value)) == value
+    assert serialization.unpackb(serialization.packb(('甲子', 1))) == ['甲子', 1]
+
+
+def test_msgpack_missing_raises_install_hint(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'msgpack', None)
+    with pytest.raises(RuntimeError, match='pip install msgpack'):
+        serialization.packb(VALUE)
+
+
+def test_saju_data_bytes_are_cached():
+    data = saju()
+    assert data.to_json_bytes() is data.to_json_bytes()
+    assert serialization.loads(data.to_json_bytes()) == data.to_dict()
+
+
+def test_saju_data_msgpack_round_trip():
+    pytest.importorskip('msgpack')
+    data = saju()
+    assert data.to_msgpack() is data.to_msgpack()
+    assert SajuData.from_msgpack(data.to_msgpack()) == data
+    assert len(data.to_msgpack()) < len(data.to_json_bytes())
+
+
+@pytest.mark.parametrize('pillars', [('庚午', '辛巳', '庚辰', '癸未'), ('甲丑', '辛巳', '庚辰', '癸未')])
+def test_extended_bytes_match_dict(pillars):
+    data = saju()
+    data.year_pillar = pillars[0]
+    extended = SajuAnalyzer().analyze_extended_saju(data)
+    assert extended.to_json_bytes() is extended.to_json_bytes()
+    assert serialization.loads(extended.to_json_bytes()) == serialization.loads(serialization.dumps(extended.to_dict()))
+    pytest.importorskip('msgpack')
+    assert serialization.unpackb(extended.to_msgpack()) == serialization.unpackb(serialization.packb(extended.to_dict()))
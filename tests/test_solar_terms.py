@@ -0,0 +1,57 @@
+# tests/test_solar_terms.py
+# 24절기 테이블: 절입 분 경계의 bisect, 입춘 기준 연도, 범위 밖 처리
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from saju_engine.solar_terms import (
+    TERMS_PER_YEAR,
+    datetime_to_minute,
+    get_solar_term_table,
+    minute_to_datetime,
+    month_index_of_term,
+)
+
+table = get_solar_term_table()
+pytestmark = pytest.mark.skipif(table is None, reason="절기 테이블 없음")
+
+
+def test_minute_round_trip_floors_seconds():
+    dt = datetime(2024, 2, 4, 17, 27, 59, 999999)
+    assert minute_to_datetime(datetime_to_minute(dt)) == datetime(2024, 2, 4, 17, 27)
+
+
+def test_ipchun_2024():
+    ipchun = table.terms_for_year(2024)[2]
+    assert ipchun['name'] == '입춘' and ipchun['datetime'] == datetime(2024, 2, 4, 17, 27)
+
+
+@pytest.mark.parametrize('year', [1900, 1950, 1988, 2024, 2052])
+def test_locate_switches_exactly_at_term_minute(year):
+    for position, term in enumerate(table.terms_for_year(year)):
+        at = term['datetime']
+        assert table.locate(at) == (year, position)
+        assert table.locate(at + timedelta(seconds=59)) == (year, position)
+        before = table.locate(at - timedelta(minutes=1))
+        if before is not None:
+            assert before == ((year, position - 1) if position else (year - 1, TERMS_PER_YEAR - 1))
+
+
+def test_month_and_year_change_at_ipchun():
+    ipchun = table.terms_for_year(2024)[2]['datetime']
+    just_before = ipchun - timedelta(minutes=1)
+    assert table.month_index(just_before) == 11 and table.saju_year(just_before) == 2023   # 丑월
+    assert table.month_index(ipchun) == 0 and table.saju_year(ipchun) == 2024              # 寅월
+
+
+def test_month_index_of_term():
+    # 소한/대한 → 丑(11), 입춘/우수 → 寅(0), 대설/동지 → 子(10)
+    assert [month_index_of_term(k) for k in (0, 1, 2, 3, 22, 23)] == [11, 11, 0, 0, 10, 10]
+
+
+def test_out_of_range_is_none():
+    first = table.terms_for_year(table.first_year)[0]['datetime']
+    assert table.locate(first - timedelta(minutes=1)) is None
+    assert table.locate(datetime(table.last_year + 1, 1, 1)) is None
+    assert table.terms_for_year(table.last_year + 1) == []
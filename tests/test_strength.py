@@ -0,0 +1,55 @@
+# tests/test_strength.py
+# 일간 강약 점수: 스칼라/배치 일치, 스칼라 코드 입력, 월령 배수
+
+import numpy as np
+import pytest
+
+from saju_analyzer.strength import (
+    CATEGORY_NAMES,
+    CONTRIBUTION_UNIT,
+    analyze_pillars,
+    category_of,
+    chart_strength,
+    contributions,
+    strength_batch,
+)
+from saju_engine.sexagenary import pack_chart
+
+
+@pytest.fixture(scope='module')
+def codes():
+    rng = np.random.default_rng(24)
+    return np.array([pack_chart(*rng.integers(0, 60, 4).tolist()) for _ in range(500)], dtype=np.int64)
+
+
+def test_batch_matches_scalar(codes):
+    batch = strength_batch(codes)
+    for i, code in enumerate(codes.tolist()):
+        scalar = chart_strength(code)
+        assert round(float(batch.scores[i]), 1) == scalar['score']
+        assert CATEGORY_NAMES[batch.categories[i]] == scalar['category']
+        assert [value / CONTRIBUTION_UNIT for value in batch.contributions[i].tolist()] == list(scalar['elements'].values())
+
+
+def test_batch_accepts_a_single_code(codes):
+    single = strength_batch(int(codes[0]))
+    assert single.scores.shape == (1,)
+    assert single.scores[0] == strength_batch(codes[:1]).scores[0]
+    assert strength_batch(np.int64(codes[0])).contributions.shape == (1, 5)
+
+
+def test_empty_batch():
+    assert strength_batch([]).scores.shape == (0,)
+
+
+def test_month_branch_weighs_double_with_season_multiplier():
+    # 甲子년 丙寅월 甲子일 甲子시: 木 = 연간/시간 甲 (일간 제외) + 월지 寅 본기 甲 6 × 2배, 寅월이라 木 旺 130%
+    values = contributions((0, 2, 0, 0), (0, 2, 0, 0))
+    assert values[0] == (10 * 2 + 6 * 2) * 130
+    result = analyze_pillars(['甲子', '丙寅', '甲子', '甲子'])
+    assert result['day_element'] == '木' and result['category'] == category_of(result['score'])
+
+
+def test_invalid_pillars():
+    assert analyze_pillars(['甲子', '丙寅', '甲子']) is None
+    assert analyze_pillars(['甲子', '丙寅', '甲子', 'XY']) is None
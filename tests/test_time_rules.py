@@ -0,0 +1,83 @@
+# tests/test_time_rules.py
+# 시간 조정 규칙 엔진: 써머타임/절입조정 기간 경계, 규칙 중첩, 배치 결과 일치
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from saju_engine.solar_terms import datetime_to_minute
+from saju_engine.time_rules import (
+    DEFAULT_REFERENCE_LONGITUDE,
+    TIME_RULES,
+    IntervalRule,
+    TimeRuleEngine,
+    compile_periods,
+)
+
+
+def resolve(*args):
+    offset, longitude, active = TIME_RULES.resolve(datetime_to_minute(datetime(*args)))
+    return offset, longitude, [rule.code for rule in active]
+
+
+def test_summertime_start_is_inclusive():
+    assert resolve(1987, 5, 10, 1, 59) == (0, DEFAULT_REFERENCE_LONGITUDE, [])
+    assert resolve(1987, 5, 10, 2, 0) == (-60, DEFAULT_REFERENCE_LONGITUDE, ['summertime'])
+
+
+def test_summertime_end_minute_is_inclusive():
+    assert resolve(1987, 10, 11, 3, 0)[2] == ['summertime']
+    assert resolve(1987, 10, 11, 3, 1)[2] == []
+
+
+def test_date_only_end_covers_whole_day():
+    assert resolve(1911, 12, 31, 23, 59) == (-30, 127.5, ['standard_meridian'])
+    assert resolve(1912, 1, 1, 0, 0) == (0, DEFAULT_REFERENCE_LONGITUDE, [])
+    assert resolve(1908, 3, 31, 23, 59)[2] == []
+    assert resolve(1908, 4, 1, 0, 0)[2] == ['standard_meridian']
+
+
+def test_overlapping_rules_add_up():
+    # 1955년 써머타임은 동경 127.5도 기간 안
+    assert resolve(1955, 7, 1, 12, 0) == (-90, 127.5, ['summertime', 'standard_meridian'])
+
+
+def test_seconds_do_not_cross_boundaries():
+    assert TIME_RULES.rule('summertime').contains(datetime(1987, 5, 10, 1, 59, 59)) is False
+    assert TIME_RULES.rule('summertime').contains(datetime(1987, 10, 11, 3, 0, 59)) is True
+
+
+def test_resolve_array_matches_resolve():
+    edges = []
+    for rule in TIME_RULES.rules:
+        for minute in rule.starts + rule.ends:
+            edges.extend(range(minute - 2, minute + 3))
+    minutes = np.array(sorted(set(edges)), dtype=np.int64)
+
+    offsets, reference_index, masks = TIME_RULES.resolve_array(minutes)
+    longitudes = TIME_RULES.reference_longitudes()
+    for i, minute in enumerate(minutes.tolist()):
+        offset, longitude, active = TIME_RULES.resolve(minute)
+        assert offsets[i] == offset
+        assert longitudes[reference_index[i]] == longitude
+        assert {code for code, mask in masks.items() if mask[i]} == {rule.code for rule in active}
+
+
+def test_compile_periods_rejects_bad_intervals():
+    with pytest.raises(ValueError):
+        compile_periods([("2000-01-02", "2000-01-01")])
+    with pytest.raises(ValueError):
+        compile_periods([("2000-01-01", "2000-01-10"), ("2000-01-10 12:00", "2000-01-20")])
+
+
+def test_register_rule_replaces_and_notifies():
+    engine = TimeRuleEngine([IntervalRule("test", [("2000-01-01", "2000-01-01")], offset_minutes=-10)])
+    notified = []
+    engine.add_listener(notified.append)
+    engine.register_rule(IntervalRule("test", [("2001-01-01", "2001-01-01")], offset_minutes=-20))
+
+    assert notified == [engine] and len(engine.rules) == 1
+    assert engine.resolve(datetime_to_minute(datetime(2000, 1, 1, 12)))[0] == 0
+    assert engine.resolve(datetime_to_minute(datetime(2001, 1, 1, 12)))[0] == -20
+    assert engine.resolve(datetime_to_minute(datetime(2001, 1, 1) + timedelta(days=1)))[0] == 0
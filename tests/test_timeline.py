@@ -0,0 +1,67 @@
+# tests/test_timeline.py
+# 원국 대 운 타임라인: 월운의 만세력 테이블 사용 구간, 스캔 기간 제한
+
+import pytest
+
+from saju_analyzer.timeline import MAX_SCAN_YEARS, _month_pillars, scan_interactions
+from saju_calculator import calculate_solar_saju
+from saju_engine.calendar_table import get_calendar_table
+
+table = get_calendar_table()
+
+
+@pytest.fixture(scope='module')
+def chart():
+    return calculate_solar_saju(1990, 5, 15, 14, 30)
+
+
+@pytest.mark.skipif(table is None, reason="만세력 테이블 없음")
+def test_month_pillars_use_table_for_covered_years():
+    last = table.last_date.year
+    months = _month_pillars(last - 1, last + 1)
+    inside = [entry for entry in months if entry[1] <= last]
+    outside = [entry for entry in months if entry[1] > last]
+    assert inside and all(entry[0] is not None for entry in inside)
+    assert len(outside) == 12 and all(entry[0] is None for entry in outside)
+    # 경계에서 같은 월운이 두 번 나오지 않음
+    assert all(a[2:] != b[2:] for a, b in zip(months, months[1:]))
+
+
+@pytest.mark.skipif(table is None, reason="만세력 테이블 없음")
+def test_month_pillars_match_table_transitions():
+    year = table.last_date.year - 10
+    transitions = table.month_transitions(table.first_date.replace(year=year), table.last_date.replace(year=year))
+    months = _month_pillars(year, year)
+    assert [entry[0] for entry in months] == [item['start_date'] for item in transitions]
+
+
+def test_default_scan_is_hundred_years(chart):
+    result = scan_interactions(chart, monthly=True)
+    assert (result['start_year'], result['end_year']) == (1990, 2089)
+    assert len(result['years']) == 100
+
+
+def test_scan_span_is_limited(chart):
+    scan_interactions(chart, 1990, 1990 + MAX_SCAN_YEARS - 1)
+    with pytest.raises(ValueError):
+        scan_interactions(chart, 1990, 1990 + MAX_SCAN_YEARS)
+    with pytest.raises(ValueError):
+        scan_interactions(chart, 2000, 1999)
+
+
+def test_scan_reports_events_against_natal_chart(chart):
+    # 1990년생(庚午년) 원국: 子년 세운은 연지 午와 子午沖
+    result = scan_interactions(chart, 2020, 2020)
+    year = result['years'][0]
+    assert year['year'] == 2020 and year['pillar'] == '庚子'
+    events = {event['name']: event['with'] for event in year['events']}
+    assert events['子午沖'] == ['년지'] and events['子未害'] == ['시지']
+    # 그해 대운(甲申)의 申이 일지 辰과 함께 申子辰 삼합을 완성
+    assert year['luck_pillar'] == '甲申' and events['申子辰三合'] == ['일지', '대운']
+    # 일간 庚 기준 세운 천간 庚 = 比肩, 지지 子(본기 癸) = 傷官
+    assert year['ten_gods'] == ['比肩', '傷官']
+
+
+def test_unknown_chart_fails_loudly():
+    with pytest.raises((ValueError, KeyError, TypeError)):
+        scan_interactions({'year_pillar': '??', 'month_pillar': '??', 'day_pillar': '??', 'hour_pillar': '??'})